@@ -0,0 +1,5 @@
+"""
+Benchmark module
+
+Contains standalone performance benchmarks, run with `python -m benchmarks.<name>`.
+"""
@@ -0,0 +1,98 @@
+"""
+JSON extractor benchmark
+
+Compares the raw_decode based extractor with the previous brace-counting
+implementation on 200 KB+ responses.
+
+Usage:
+    python -m benchmarks.bench_json_extractor [--size 220000] [--repeat 5]
+"""
+
+import argparse
+import json
+import re
+import time
+from typing import Any, Callable, Dict, Optional
+
+from src.utils.json_extractor import JSONExtractor
+from .fixtures import build_response
+
+
+def _legacy_match_braces(text: str, start: int) -> int:
+    """Brace matching loop used before raw_decode (ignores strings)"""
+    brace_count = 0
+    for i in range(start, len(text)):
+        if text[i] == '{':
+            brace_count += 1
+        elif text[i] == '}':
+            brace_count -= 1
+            if brace_count == 0:
+                return i + 1
+    return -1
+
+
+def legacy_extract(response_text: str) -> Optional[Dict[str, Any]]:
+    """Previous three-pass extraction, kept as the comparison baseline"""
+    try:
+        json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
+        if json_match:
+            return json.loads(json_match.group(1).strip())
+    except json.JSONDecodeError:
+        pass
+
+    start = response_text.find('{')
+    if start != -1:
+        end = _legacy_match_braces(response_text, start)
+        if end != -1:
+            try:
+                return json.loads(re.sub(r'[\x00-\x1f\x7f-\x9f]', '', response_text[start:end]))
+            except json.JSONDecodeError:
+                pass
+
+    json_start = response_text.find('"English readme"')
+    brace_start = response_text.rfind('{', 0, json_start) if json_start != -1 else -1
+    if brace_start != -1:
+        end = _legacy_match_braces(response_text, brace_start)
+        if end != -1:
+            try:
+                return json.loads(re.sub(r'[\x00-\x1f\x7f-\x9f]', '', response_text[brace_start:end]))
+            except json.JSONDecodeError:
+                pass
+    return None
+
+
+def time_call(func: Callable[[str], Any], text: str, repeat: int) -> float:
+    """Return the best wall time of func(text) in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    """Run the benchmark and print a comparison table"""
+    parser = argparse.ArgumentParser(description="Benchmark JSON extraction")
+    parser.add_argument("--size", type=int, default=220000, help="Approximate response size in characters")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement")
+    args = parser.parse_args()
+
+    scenarios = {
+        "fenced": build_response(args.size),
+        "bare": build_response(args.size, fenced=False),
+        "bare + commentary": "Sure! {braces} in prose first.\n" + build_response(args.size, fenced=False),
+    }
+
+    print(f"{'scenario':<20} {'size':>9} {'legacy ms':>10} {'new ms':>8} {'speedup':>8}  legacy ok  new ok")
+    for name, text in scenarios.items():
+        legacy_ms = time_call(legacy_extract, text, args.repeat)
+        new_ms = time_call(JSONExtractor.extract_json_from_response, text, args.repeat)
+        legacy_ok = legacy_extract(text) is not None
+        new_ok = JSONExtractor.extract_json_from_response(text) is not None
+        print(f"{name:<20} {len(text):>9} {legacy_ms:>10.2f} {new_ms:>8.2f} {legacy_ms / new_ms:>7.1f}x"
+              f"  {str(legacy_ok):<9}  {new_ok}")
+
+
+if __name__ == "__main__":
+    main()
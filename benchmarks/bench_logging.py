@@ -0,0 +1,96 @@
+"""
+Logging overhead benchmark
+
+Runs the SSE event loop over a fake streamed reply with logging at INFO and
+compares it with the formatting work the eager f-string calls used to do on
+every request and event.
+
+Usage:
+    python -m benchmarks.bench_logging [--size 220000] [--chunk 40] [--repeat 5]
+"""
+
+import argparse
+import json
+import logging
+import time
+from typing import List
+from unittest.mock import Mock, patch
+
+from src.models.types import TranslationRequest
+from src.services.sse_client import SSEClient
+from src.utils.config import Config
+from src.utils.logger import get_logger
+from .fixtures import build_response, build_sse_events
+
+
+def _fake_response(events: List[bytes]) -> Mock:
+    """Build a streaming HTTP response yielding the given events"""
+    response = Mock()
+    response.status_code = 200
+    response.__iter__ = Mock(side_effect=lambda: iter(events))
+    return response
+
+
+def eager_formatting(request_data: dict, events: List[bytes]) -> None:
+    """Formatting the previous debug calls performed even with DEBUG disabled"""
+    f"Request data: {json.dumps(request_data, ensure_ascii=False, indent=2)}"
+    for raw in events:
+        data = raw.decode("utf-8").split("data: ", 1)[1].strip()
+        f"Event data: {data}"
+        f"Event data: {data}"
+        f'Sent content: {json.loads(data)["payload"]["content"]}'
+
+
+def time_sse_loop(client: SSEClient, request: TranslationRequest, events: List[bytes], repeat: int) -> float:
+    """Return the best wall time of one send_request call in milliseconds"""
+    best = float("inf")
+    with patch("src.services.sse_client.requests.post", side_effect=lambda *a, **k: _fake_response(events)):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            client.send_request(request)
+            best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Benchmark logging overhead in the SSE loop")
+    parser.add_argument("--size", type=int, default=220000, help="Approximate reply size in characters")
+    parser.add_argument("--chunk", type=int, default=40, help="Characters per SSE event")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement")
+    args = parser.parse_args()
+
+    # INFO level, with output discarded so terminal speed does not skew timings
+    logger = get_logger()
+    logger.set_level("INFO")
+    handlers = logger.get_logger().handlers[:]
+    logger.get_logger().handlers = [logging.NullHandler()]
+
+    try:
+        config = Config()
+        config.set("sse.streaming_throttle", 0)
+        client = SSEClient(config)
+        request = TranslationRequest(
+            content=build_response(args.size, fenced=False),
+            languages=["en", "zh-Hans", "ja"],
+            bot_app_key="key",
+            visitor_biz_id="visitor"
+        )
+        events = build_sse_events(build_response(args.size), args.chunk)
+        request_data = {"content": request.content, "bot_app_key": "key", "visitor_biz_id": "visitor"}
+
+        loop_ms = time_sse_loop(client, request, events, args.repeat)
+        start = time.perf_counter()
+        eager_formatting(request_data, events)
+        eager_ms = (time.perf_counter() - start) * 1000
+    finally:
+        logger.get_logger().handlers = handlers
+
+    print(f"events: {len(events)}, request: {len(request.content)} chars")
+    print(f"SSE loop at INFO (lazy logging):      {loop_ms:8.2f} ms")
+    print(f"Formatting skipped per request:       {eager_ms:8.2f} ms "
+          f"({eager_ms / (loop_ms + eager_ms):.0%} of the eager total)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+End-to-end replay benchmark
+
+Runs the full gen pipeline (project reading, request, streaming extraction,
+parsing and file writes) against recorded SSE sessions, without network access.
+Without --recording, a session is first recorded from the local mock server.
+
+Usage:
+    python -m benchmarks.bench_replay [--recording sessions.jsonl] [--speed 0] [--repeat 3]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.cli.commands import run_translation_workflow
+from src.core.generator import Generator
+from src.core.parser import Parser
+from src.core.translator import Translator
+from src.services.mock_server import MockLKEServer, MockServerOptions
+from src.services.sse_client import SSEClient
+from src.models.types import TranslationRequest
+from src.utils.config import Config
+from src.utils.profiler import get_profiler
+from .fixtures import RESPONSE_KEYS, build_readme, build_response
+
+
+def record_session(path: str, size: int):
+    """Record a synthetic reply served by the mock server"""
+    options = MockServerOptions(reply=build_response(size, languages=3), chunk_size=40)
+    with MockLKEServer(options) as server:
+        config = Config()
+        config.set("sse.url", server.url)
+        config.set("sse.transport", "record")
+        config.set("sse.record_path", path)
+        config.set("sse.streaming_throttle", 0)
+        SSEClient(config).send_request(TranslationRequest(
+            content="Translate", languages=["en", "zh-Hans", "ja"], bot_app_key="key", visitor_biz_id="visitor"
+        ))
+
+
+def run_pipeline(recording: str, speed: float) -> float:
+    """Run one gen workflow in a scratch directory and return its wall time in seconds"""
+    config = Config()
+    config.set("sse.transport", "replay")
+    config.set("sse.record_path", recording)
+    config.set("sse.replay_speed", speed)
+    config.set("sse.streaming_throttle", 0)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as project:
+        Path(project, "README.md").write_text(build_readme(RESPONSE_KEYS[0], 3000), encoding="utf-8")
+        Path(project, "main.py").write_text("print('hello')\n", encoding="utf-8")
+        # Generated files are written relative to the working directory
+        os.chdir(project)
+        try:
+            start = time.perf_counter()
+            run_translation_workflow(Translator(config), Parser(), Generator(), project, ["en", "zh-Hans", "ja"])
+            return time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+
+
+def main():
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Benchmark the gen pipeline on recorded SSE sessions")
+    parser.add_argument("--recording", help="Sessions recorded with sse.transport: record")
+    parser.add_argument("--size", type=int, default=60000, help="Synthetic reply size when recording from the mock server")
+    parser.add_argument("--speed", type=float, default=0, help="Replay speed factor, 0 replays without delays")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        recording = args.recording
+        if recording is None:
+            recording = str(Path(scratch, "sessions.jsonl"))
+            record_session(recording, args.size)
+        recording = os.path.abspath(recording)
+
+        profiler = get_profiler()
+        profiler.enable()
+        timings = [run_pipeline(recording, args.speed) for _ in range(args.repeat)]
+        profiler.disable()
+
+    print(f"\nruns: {args.repeat}, best: {min(timings) * 1000:.1f} ms, worst: {max(timings) * 1000:.1f} ms")
+    print(profiler.report())
+
+
+if __name__ == "__main__":
+    main()
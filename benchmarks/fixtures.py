@@ -0,0 +1,113 @@
+"""
+Benchmark fixtures
+
+Builds model responses shaped like real multi-language replies and
+synthetic project trees.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+# Key names as returned by the model
+RESPONSE_KEYS = [
+    "English readme", "中文 readme", "日本語 readme", "한국어 readme", "Français readme",
+    "Deutsch readme", "Español readme", "Italiano readme", "Português readme", "Русский readme",
+    "ไทย readme", "Tiếng Việt readme"
+]
+
+SECTION_TEMPLATE = """## {title} {index}
+
+DuoReadme reads the project, compresses the important files and sends them to the model.
+Configuration values such as `{{"sse": {{"timeout": 60}}}}` are merged over the built-in defaults.
+
+```python
+def handler(event):
+    if event.get("type") == "reply":
+        return {{"content": event["payload"]["content"], "final": False}}
+    return {{}}
+```
+
+- Opening a block with `function start() {{` continues on the next line
+- Item with braces {{ and }} and a path C:\\\\duoreadme\\\\docs
+- 多语言支持 / 多言語サポート / 다국어 지원
+
+"""
+
+
+def build_readme(title: str, target_length: int) -> str:
+    """Build a Markdown README of roughly target_length characters with code samples"""
+    parts = [f"# {title}\n\n"]
+    length = len(parts[0])
+    index = 1
+    while length < target_length:
+        section = SECTION_TEMPLATE.format(title=title, index=index)
+        parts.append(section)
+        length += len(section)
+        index += 1
+    return "".join(parts)
+
+
+def build_response_data(total_length: int, languages: int = len(RESPONSE_KEYS)) -> Dict[str, str]:
+    """Build the decoded reply object for the given total size"""
+    per_language = max(total_length // languages, 200)
+    return {key: build_readme(key, per_language) for key in RESPONSE_KEYS[:languages]}
+
+
+def build_response(total_length: int, languages: int = len(RESPONSE_KEYS), fenced: bool = True) -> str:
+    """Build a reply text as the model returns it, optionally inside a ```json fence with commentary"""
+    body = json.dumps(build_response_data(total_length, languages), ensure_ascii=False, indent=2)
+    if not fenced:
+        return body
+    return f"Here are the README documents:\n\n```json\n{body}\n```\n\nLet me know if anything should change."
+
+
+def build_sse_events(response_text: str, chunk_size: int = 40) -> List[bytes]:
+    """Split a reply into incremental SSE reply events followed by the final event"""
+    events = []
+    for i in range(0, len(response_text), chunk_size):
+        payload = {"payload": {"content": response_text[i:i + chunk_size], "is_from_self": False, "is_final": False}}
+        events.append(f"event: reply\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8"))
+    payload = {"payload": {"content": response_text, "is_from_self": False, "is_final": True}}
+    events.append(f"event: reply\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8"))
+    return events
+
+
+MODULE_NAMES = ["main", "config", "utils", "models", "client", "commands", "helpers", "parser", "service", "view"]
+
+GITIGNORE_RULES = [
+    "__pycache__/", "*.pyc", "*.log", "build/", "dist/", ".venv/", "node_modules/", "*.egg-info/",
+    "coverage/", ".cache/", "*.tmp", "tmp/", "docs/_build/", "*.sqlite", ".env", "**/generated/*.py"
+]
+
+
+def build_repo(root: Path, files: int, depth: int = 3, gitignore_rules: int = 8, file_size: int = 2000) -> Path:
+    """
+    Build a synthetic project tree
+
+    Args:
+        root: Directory to create the project in
+        files: Number of source files
+        depth: Maximum directory nesting
+        gitignore_rules: Number of .gitignore patterns, a third of the files match one
+        file_size: Approximate size of each source file in characters
+
+    Returns:
+        Path: Project root
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "README.md").write_text(build_readme("Synthetic project", file_size * 2), encoding="utf-8")
+    rules = (GITIGNORE_RULES * (gitignore_rules // len(GITIGNORE_RULES) + 1))[:gitignore_rules]
+    (root / ".gitignore").write_text("\n".join(rules) + "\n", encoding="utf-8")
+
+    body = "def handler_{index}(event):\n    return {{'index': {index}, 'event': event}}\n\n"
+    for index in range(files):
+        parts = [f"pkg{(index + level) % 4}" for level in range(index % (depth + 1))]
+        # Every third file lands in a directory the .gitignore patterns exclude
+        top = "build" if gitignore_rules and index % 3 == 2 else "src"
+        directory = root.joinpath(top, *parts)
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f"{MODULE_NAMES[index % len(MODULE_NAMES)]}_{index}.py"
+        content = "".join(body.format(index=i) for i in range(max(file_size // 60, 1)))
+        (directory / name).write_text(content, encoding="utf-8")
+    return root
@@ -0,0 +1,196 @@
+"""
+Benchmark suite runner
+
+Times the scan, select, compress, extract, parse and write stages on
+synthetic projects and replies of 10 KB to 1 MB, and compares the results
+with stored baselines so regressions show up in review.
+
+Baselines are absolute timings from the machine they were saved on, so
+regressions are only reported unless --fail-on-regression is given.
+
+Usage:
+    python -m benchmarks.run                      # run and compare with baselines.json
+    python -m benchmarks.run --fail-on-regression # exit with 1 when a case is slower than its baseline
+    python -m benchmarks.run --save-baseline      # run and store the results as the new baseline
+    python -m benchmarks.run --filter extract --repeat 10
+"""
+
+import argparse
+import itertools
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from src.core.generator import Generator
+from src.core.parser import Parser
+from src.core.translator import Translator
+from src.models.types import ParsedReadme
+from src.utils.config import Config
+from src.utils.file_utils import FileUtils
+from src.utils.json_extractor import extract_json_content
+from src.utils.logger import get_logger
+from .fixtures import build_readme, build_repo, build_response
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+
+# Project trees: name -> (files, depth, gitignore rules)
+REPOS = {
+    "small": (50, 2, 4),
+    "medium": (500, 4, 16),
+    "large": (2000, 6, 32),
+}
+
+# Reply sizes in characters
+RESPONSES = {
+    "10KB": 10_000,
+    "100KB": 100_000,
+    "1MB": 1_000_000,
+}
+
+LANGUAGES = ["en", "zh-Hans", "ja", "ko", "fr", "de", "es", "it", "pt", "ru", "th", "vi"]
+
+MANY_LANGUAGES = [
+    "en", "zh-Hans", "zh-Hant", "ja", "ko", "fr", "de", "es", "it", "pt", "pt-PT", "ru", "th", "vi", "hi", "ar",
+    "tr", "pl", "nl", "sv", "da", "no", "nb", "fi", "cs", "sk", "hu", "ro", "bg", "hr", "sl", "et", "lv", "lt",
+    "mt", "el", "ca", "eu", "gl", "af", "zu", "xh", "st", "sw", "yo", "ig", "ha", "am", "or", "bn", "gu", "pa",
+    "te", "kn", "ml", "ta", "si", "my", "km", "lo", "ne", "ur", "fa", "ps", "sd", "he", "yue"
+]
+
+# Writer threads of the parallel generate_readme_files cases
+WRITE_WORKERS = 4
+
+
+def measure(func: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Run func repeat times and return the best and median wall time in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {"best_ms": round(min(timings), 3), "median_ms": round(statistics.median(timings), 3)}
+
+
+def build_cases(workdir: Path) -> List[Tuple[str, Callable[[], object]]]:
+    """Create the fixtures and return (name, callable) pairs"""
+    file_utils = FileUtils()
+    translator = Translator(Config())
+    parser = Parser()
+    cases = []
+
+    for name, (files, depth, rules) in REPOS.items():
+        repo = build_repo(workdir / f"repo_{name}", files, depth, rules)
+        project_files = file_utils.get_project_files(repo)
+        cases.append((f"get_project_files[{name}]", lambda repo=repo: file_utils.get_project_files(repo)))
+        cases.append((f"_select_important_files[{name}]",
+                      lambda project_files=project_files: translator._select_important_files(project_files)))
+
+    for size in (3_000, 30_000, 300_000):
+        readme = build_readme("Compress", size)
+        cases.append((f"_compress_content[{size // 1000}KB]",
+                      lambda readme=readme: translator._compress_content(readme, max_length=3000)))
+
+    for name, size in RESPONSES.items():
+        response = build_response(size)
+        cases.append((f"extract_json_content[{name}]", lambda response=response: extract_json_content(response)))
+        cases.append((f"parse_multilingual_content[{name}]",
+                      lambda response=response: parser.parse_multilingual_content(response, LANGUAGES)))
+
+        parsed = parser.parse_multilingual_content(response, LANGUAGES)
+        generator = Generator(base_dir=workdir / f"output_{name}")
+        revisions = _revisions(parsed.content)
+        cases.append((f"generate_readme_files[{name}]",
+                      lambda generator=generator, revisions=revisions, response=response:
+                      generator.generate_readme_files(next(revisions), response)))
+
+    # Many-language output, sequential writer against the thread pool
+    readme = build_readme("Languages", 20_000)
+    for workers in (1, WRITE_WORKERS):
+        generator = Generator(base_dir=workdir / f"output_{workers}w", write_workers=workers)
+        revisions = _revisions({lang: readme for lang in MANY_LANGUAGES})
+        cases.append((f"generate_readme_files[{len(MANY_LANGUAGES)}x20KB,{workers}w]",
+                      lambda generator=generator, revisions=revisions:
+                      generator.generate_readme_files(next(revisions))))
+
+    return cases
+
+
+def _revisions(content: Dict[str, str]) -> Iterator[ParsedReadme]:
+    """Yield the content with a new revision marker each time, unchanged files would be skipped instead of written"""
+    for run in itertools.count():
+        revision = f"\n<!-- revision {run} -->\n"
+        yield ParsedReadme(content={lang: text + revision for lang, text in content.items()},
+                           languages=list(content), total_count=len(content))
+
+
+def compare(results: Dict[str, Dict[str, float]], baselines: Dict[str, Dict[str, float]],
+            threshold: float) -> List[str]:
+    """Return the cases whose median time grew by more than threshold over the baseline"""
+    regressions = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline and result["median_ms"] > baseline["median_ms"] * (1 + threshold):
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    """Run the suite and print a table, exiting with 1 on regressions when --fail-on-regression is given"""
+    parser = argparse.ArgumentParser(description="Run the DuoReadme benchmark suite")
+    parser.add_argument("--filter", help="Only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per case")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown before a case is flagged")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="Exit with 1 when a case is flagged, for runs on the machine the baselines came from")
+    args = parser.parse_args()
+
+    # Stage logs would dominate the timings
+    get_logger().set_level("ERROR")
+    baseline_path = Path(args.baseline)
+    baselines = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {}
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        cases = build_cases(Path(workdir))
+        print(f"{'case':<42} {'best ms':>10} {'median ms':>10} {'baseline':>10} {'change':>8}")
+        for name, func in cases:
+            if args.filter and args.filter not in name:
+                continue
+            # Generator prints its progress, keep the table readable
+            stdout = sys.stdout
+            sys.stdout = open(os.devnull, "w")
+            try:
+                results[name] = measure(func, args.repeat)
+            finally:
+                sys.stdout.close()
+                sys.stdout = stdout
+
+            baseline = baselines.get(name, {}).get("median_ms")
+            change = f"{results[name]['median_ms'] / baseline - 1:+.0%}" if baseline else "new"
+            print(f"{name:<42} {results[name]['best_ms']:>10.2f} {results[name]['median_ms']:>10.2f} "
+                  f"{baseline if baseline else '-':>10} {change:>8}")
+
+    if args.save_baseline:
+        baselines.update(results)
+        baseline_path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"\nBaseline written to {baseline_path}")
+        return
+
+    regressions = compare(results, baselines, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} cases slower than baseline by more than {args.threshold:.0%}:")
+        for name in regressions:
+            print(f"  {name}")
+        if args.fail_on_regression:
+            sys.exit(1)
+        print("Baselines are absolute timings from one machine, compare on the same machine before acting on this")
+
+
+if __name__ == "__main__":
+    main()
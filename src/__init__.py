@@ -7,9 +7,21 @@ A powerful CLI tool for automatically generating project code and README into mu
 __version__ = "0.0.1"
 __author__ = "DuoReadme Team"
 
-from .core.translator import Translator
-from .core.parser import Parser
-from .core.generator import Generator
+# Loaded on first access (PEP 562) so importing the CLI stays fast
+_LAZY_IMPORTS = {
+    "Translator": ".core.translator",
+    "Parser": ".core.parser",
+    "Generator": ".core.generator",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "Translator",
@@ -4,14 +4,29 @@ CLI commands module
 Provides implementations for various CLI commands.
 """
 
+import sys
+import time
 import click
-import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from ..core.translator import Translator
+from typing import TYPE_CHECKING, Any, Dict, List
 from ..core.parser import Parser
 from ..core.generator import Generator
 from ..utils.config import Config
-from ..utils.logger import enable_debug, info, debug
+from ..models.types import ParsedReadme, TranslationPlan
+from ..utils.logger import enable_debug, enable_async_logging, info, debug, warning
+from ..utils.profiler import get_profiler, span
+from ..utils.metrics import get_metrics, METRIC_FORMATS
+
+if TYPE_CHECKING:
+    # Imported inside gen and trans only, it pulls in the network stack
+    from ..core.translator import Translator
+
+
+def _configure_logging(config_obj: Config):
+    """Switch to queue-based logging when enabled in the configuration"""
+    if config_obj.get("logging.async", False):
+        enable_async_logging(config_obj.get("logging.queue_size", 10000))
 
 
 @click.command()
@@ -20,7 +35,14 @@ from ..utils.logger import enable_debug, info, debug
 @click.option('--config', help='Configuration file path')
 @click.option('--verbose', is_flag=True, help='Show detailed output')
 @click.option('--debug', 'debug_mode', is_flag=True, help='Enable debug mode, output DEBUG level logs')
-def gen_command(project_path, languages, config, verbose, debug_mode):
+@click.option('--plan', is_flag=True, help='Show the files, batches and request sizes without sending requests')
+@click.option('--no-cache', is_flag=True, help='Ignore cached replies and do not store new ones')
+@click.option('--profile', is_flag=True, help='Print a per-phase timing breakdown')
+@click.option('--profile-output', help='Write cProfile data in pstats format to this file')
+@click.option('--metrics-file', help='Write run metrics to this file')
+@click.option('--metrics-format', type=click.Choice(METRIC_FORMATS), default='json', help='Metrics file format')
+def gen_command(project_path, languages, config, verbose, debug_mode, plan, no_cache, profile, profile_output,
+                metrics_file, metrics_format):
     """Generate multi-language README"""
     try:
         # Set log level based on --debug parameter
@@ -31,6 +53,7 @@ def gen_command(project_path, languages, config, verbose, debug_mode):
         # Load configuration
         config_obj = Config(config)
         debug(f"Configuration file path: {config}")
+        _configure_logging(config_obj)
         
         # Validate configuration
         if not config_obj.validate():
@@ -38,21 +61,33 @@ def gen_command(project_path, languages, config, verbose, debug_mode):
             return
         
         # Create core components
+        from ..core.translator import Translator
+        if no_cache:
+            config_obj.set("translation.cache_dir", "")
         translator = Translator(config_obj)
         parser_obj = Parser()
-        generator = Generator()
+        generator = Generator.from_config(config_obj)
         debug("Core components initialized")
         
-        # Display start information
-        click.echo("=" * 50)
-        
         # Process language parameters
         language_list = None
         if languages:
             language_list = [lang.strip() for lang in languages.split(',')]
             debug(f"Target languages: {language_list}")
         
+        # Dry run, nothing is sent or written
+        if plan:
+            translation_plan = translator.plan_project(project_path, language_list)
+            click.echo(_format_plan(translation_plan, config_obj.get("translation.cost_per_1k_tokens", 0)))
+            return
+        
+        # Display start information
+        click.echo("=" * 50)
+        
         # Execute generation workflow
+        _start_profiling(profile, profile_output)
+        if metrics_file:
+            get_metrics().enable()
         run_translation_workflow(
             translator=translator,
             parser_obj=parser_obj,
@@ -61,6 +96,8 @@ def gen_command(project_path, languages, config, verbose, debug_mode):
             languages=language_list,
             verbose=verbose
         )
+        _finish_profiling(profile, profile_output)
+        _write_metrics(metrics_file, metrics_format)
         
         click.echo("\nAll tasks completed!")
         
@@ -72,7 +109,7 @@ def gen_command(project_path, languages, config, verbose, debug_mode):
 
 
 def run_translation_workflow(
-    translator: Translator,
+    translator: "Translator",
     parser_obj: Parser,
     generator: Generator,
     project_path: str,
@@ -82,8 +119,20 @@ def run_translation_workflow(
     """Execute generation workflow"""
     debug(f"Starting project generation: {project_path}")
     
-    # Generate project content
-    translation_response = translator.translate_project(project_path, languages)
+    # Generate project content, writing languages as they complete in the stream
+    stream_writer = _build_stream_writer(translator, generator, languages)
+    if translator.config.get("translation.pipeline", False):
+        # Scanning, reading, the request and file writes overlap
+        from ..core.pipeline import TranslationPipeline
+        pipeline = TranslationPipeline(
+            translator,
+            generator,
+            queue_size=translator.config.get("translation.pipeline_queue_size", 8),
+            read_workers=translator.config.get("translation.read_workers", 4)
+        )
+        translation_response = pipeline.run(project_path, languages, stream_output=stream_writer is not None)
+    else:
+        translation_response = translator.translate_project(project_path, languages, on_language=stream_writer)
     
     if not translation_response.success:
         click.echo(f"❌ Generation failed: {translation_response.error}", err=True)
@@ -93,24 +142,157 @@ def run_translation_workflow(
     debug("Generation response processing completed")
     
     # Parse multi-language README
-    parsed_readme = parser_obj.parse_multilingual_content(
-        translation_response.content, 
-        languages
-    )
+    with span("parse"):
+        parsed_readme = parser_obj.parse_multilingual_content(
+            translation_response.content, 
+            languages
+        )
     debug("Multi-language content parsing completed")
     
+    # Request only the languages that were omitted or failed to parse
+    parsed_readme = _complete_missing_languages(
+        translate=lambda missing: translator.translate_project(project_path, missing, on_language=stream_writer),
+        parser_obj=parser_obj,
+        parsed_readme=parsed_readme,
+        requested=translation_response.languages,
+        max_rounds=translator.config.get("translation.completion_retries", 2)
+    )
+    
     # Generate README files
     click.echo("\nGenerating README files")
-    generation_result = generator.generate_readme_files(
-        parsed_readme, 
-        translation_response.raw_response
-    )
+    with span("generate"):
+        generation_result = generator.generate_readme_files(
+            parsed_readme, 
+            translation_response.raw_response
+        )
     debug("README file generation completed")
     
     # Generate summary report
     summary = generator.generate_summary(generation_result)
     click.echo(summary)
     debug("Summary report generation completed")
+    
+    return generation_result
+
+
+def _format_plan(plan: "TranslationPlan", cost_per_1k_tokens: float = 0) -> str:
+    """Format a dry-run generation plan"""
+    lines = [
+        f"Generation plan for {plan.project_path} (no requests sent)",
+        f"Languages: {', '.join(plan.languages)}",
+        "",
+        f"Files: {plan.files_scanned} scanned, {sum(1 for f in plan.files if f.selected)} selected"
+    ]
+    for planned in plan.files:
+        mark = "✓" if planned.selected else "-"
+        size = f" {planned.characters} -> {planned.compressed_characters} chars" if planned.selected else ""
+        details = ([f"score {planned.score}"] if planned.score is not None else []) + planned.reasons
+        lines.append(f"  {mark} {planned.path}{size} ({', '.join(details)})")
+    
+    lines.append("")
+    lines.append(f"Content: {plan.content_characters} characters in {len(plan.batches)} "
+                 f"{'request' if len(plan.batches) == 1 else 'batches'}")
+    for batch in plan.batches:
+        lines.append(f"  #{batch.index}: {batch.characters} chars, ~{batch.estimated_tokens} tokens, "
+                     f"{batch.request_bytes} bytes ({batch.wire_bytes} on the wire)")
+    lines.append(f"Total: ~{plan.estimated_tokens} input tokens, {plan.request_bytes} request bytes "
+                 f"({plan.wire_bytes} on the wire)")
+    if cost_per_1k_tokens:
+        lines.append(f"Estimated input cost: {plan.estimated_tokens / 1000 * cost_per_1k_tokens:.4f}")
+    return "\n".join(lines)
+
+
+def _start_profiling(profile: bool, profile_output: str = None):
+    """Start collecting phase timings, and cProfile data when an output file is given"""
+    if profile or profile_output:
+        get_profiler().enable(cprofile=bool(profile_output))
+
+
+def _finish_profiling(profile: bool, profile_output: str = None):
+    """Print the phase breakdown and write the pstats dump"""
+    profiler = get_profiler()
+    if not profiler.enabled:
+        return
+    profiler.disable()
+    if profile:
+        click.echo("\nPhase timings")
+        click.echo(profiler.report())
+    if profile_output and profiler.dump_stats(profile_output):
+        click.echo(f"Profile data written to: {profile_output}")
+
+
+def _write_metrics(metrics_file: str = None, metrics_format: str = "json"):
+    """Write the collected run metrics"""
+    if not metrics_file:
+        return
+    try:
+        get_metrics().write(metrics_file, metrics_format)
+        click.echo(f"Metrics written to: {metrics_file}")
+    except Exception as e:
+        warning(f"⚠ Failed to write metrics: {e}")
+
+
+def _build_stream_writer(translator: "Translator", generator: Generator, languages: list = None):
+    """Build the callback that writes each language README as soon as it is streamed"""
+    if not translator.config.get("sse.stream_output", True):
+        return None
+    
+    def on_language(lang: str, content: str):
+        # Same filter as the parser, so only requested languages are written early
+        if languages is None or lang in languages:
+            generator.write_streamed_language(lang, content)
+    
+    return on_language
+
+
+def _complete_missing_languages(
+    translate,
+    parser_obj: Parser,
+    parsed_readme: ParsedReadme,
+    requested: list,
+    max_rounds: int = 2
+) -> ParsedReadme:
+    """
+    Re-request only the languages missing from a parsed result
+    
+    Args:
+        translate: Function taking a list of language codes and returning a TranslationResponse
+        parser_obj: Parser used for the follow-up responses
+        parsed_readme: Result of the first request, updated in place
+        requested: Language codes that were requested
+        max_rounds: Maximum number of follow-up requests
+        
+    Returns:
+        ParsedReadme: Parsed result including recovered languages
+    """
+    for attempt in range(1, max_rounds + 1):
+        missing = [lang for lang in requested if lang not in parsed_readme.content]
+        if not missing:
+            break
+        
+        click.echo(f"\nRequesting {len(missing)} missing languages ({', '.join(missing)}), attempt {attempt}/{max_rounds}")
+        get_metrics().inc("retries")
+        response = translate(missing)
+        if not response.success:
+            warning(f"⚠ Follow-up request failed: {response.error}")
+            continue
+        
+        recovered = parser_obj.parse_multilingual_content(response.content, missing)
+        for lang, content in recovered.content.items():
+            parsed_readme.content[lang] = content
+            parsed_readme.languages.append(lang)
+        parsed_readme.total_count = len(parsed_readme.content)
+        debug(f"Recovered {recovered.total_count} of {len(missing)} missing languages")
+    
+    metrics = get_metrics()
+    for lang in requested:
+        metrics.set_language_parsed(lang, lang in parsed_readme.content)
+    
+    still_missing = [lang for lang in requested if lang not in parsed_readme.content]
+    if still_missing:
+        warning(f"⚠ Languages still missing after {max_rounds} follow-up requests: {', '.join(still_missing)}")
+    
+    return parsed_readme
 
 
 @click.command()
@@ -119,7 +301,13 @@ def run_translation_workflow(
 @click.option('--config', help='Configuration file path')
 @click.option('--verbose', is_flag=True, help='Show detailed output')
 @click.option('--debug', 'debug_mode', is_flag=True, help='Enable debug mode, output DEBUG level logs')
-def trans_command(project_path, languages, config, verbose, debug_mode):
+@click.option('--no-cache', is_flag=True, help='Ignore cached replies and do not store new ones')
+@click.option('--profile', is_flag=True, help='Print a per-phase timing breakdown')
+@click.option('--profile-output', help='Write cProfile data in pstats format to this file')
+@click.option('--metrics-file', help='Write run metrics to this file')
+@click.option('--metrics-format', type=click.Choice(METRIC_FORMATS), default='json', help='Metrics file format')
+def trans_command(project_path, languages, config, verbose, debug_mode, no_cache, profile, profile_output,
+                  metrics_file, metrics_format):
     """Pure text translation function - translate README file in project root directory"""
     try:
         # Set log level based on --debug parameter
@@ -130,6 +318,7 @@ def trans_command(project_path, languages, config, verbose, debug_mode):
         # Load configuration
         config_obj = Config(config)
         debug(f"Configuration file path: {config}")
+        _configure_logging(config_obj)
         
         # Validate configuration
         if not config_obj.validate():
@@ -137,9 +326,12 @@ def trans_command(project_path, languages, config, verbose, debug_mode):
             return
         
         # Create core components
+        from ..core.translator import Translator
+        if no_cache:
+            config_obj.set("translation.cache_dir", "")
         translator = Translator(config_obj)
         parser_obj = Parser()
-        generator = Generator()
+        generator = Generator.from_config(config_obj)
         debug("Core components initialized")
         
         # Display start information
@@ -154,6 +346,9 @@ def trans_command(project_path, languages, config, verbose, debug_mode):
             debug(f"Target languages: {language_list}")
         
         # Execute translation workflow
+        _start_profiling(profile, profile_output)
+        if metrics_file:
+            get_metrics().enable()
         run_text_translation_workflow(
             translator=translator,
             parser_obj=parser_obj,
@@ -162,6 +357,8 @@ def trans_command(project_path, languages, config, verbose, debug_mode):
             languages=language_list,
             verbose=verbose
         )
+        _finish_profiling(profile, profile_output)
+        _write_metrics(metrics_file, metrics_format)
         
         click.echo("\nTranslation completed!")
         
@@ -173,7 +370,7 @@ def trans_command(project_path, languages, config, verbose, debug_mode):
 
 
 def run_text_translation_workflow(
-    translator: Translator,
+    translator: "Translator",
     parser_obj: Parser,
     generator: Generator,
     project_path: str,
@@ -184,7 +381,8 @@ def run_text_translation_workflow(
     debug(f"Starting project translation: {project_path}")
     
     # Read README file in project root directory
-    readme_content = translator._read_readme_file(project_path)
+    with span("read_readme"):
+        readme_content = translator._read_readme_file(project_path)
     
     if not readme_content:
         click.echo("❌ README file not found or read failed", err=True)
@@ -192,8 +390,9 @@ def run_text_translation_workflow(
     
     debug(f"Successfully read README file, length: {len(readme_content)} characters")
     
-    # Execute pure text translation
-    translation_response = translator.translate_text_only(readme_content, languages)
+    # Execute pure text translation, writing languages as they complete in the stream
+    stream_writer = _build_stream_writer(translator, generator, languages)
+    translation_response = translator.translate_text_only(readme_content, languages, on_language=stream_writer)
     
     if not translation_response.success:
         click.echo(f"❌ Translation failed: {translation_response.error}", err=True)
@@ -203,24 +402,37 @@ def run_text_translation_workflow(
     debug("Translation response processing completed")
     
     # Parse multi-language README (same processing as gen command)
-    parsed_readme = parser_obj.parse_multilingual_content(
-        translation_response.content, 
-        languages
-    )
+    with span("parse"):
+        parsed_readme = parser_obj.parse_multilingual_content(
+            translation_response.content, 
+            languages
+        )
     debug("Multi-language content parsing completed")
     
+    # Request only the languages that were omitted or failed to parse
+    parsed_readme = _complete_missing_languages(
+        translate=lambda missing: translator.translate_text_only(readme_content, missing, on_language=stream_writer),
+        parser_obj=parser_obj,
+        parsed_readme=parsed_readme,
+        requested=translation_response.languages,
+        max_rounds=translator.config.get("translation.completion_retries", 2)
+    )
+    
     # Generate README files (same processing as gen command)
     click.echo("\nGenerating README files")
-    generation_result = generator.generate_readme_files(
-        parsed_readme, 
-        translation_response.raw_response
-    )
+    with span("generate"):
+        generation_result = generator.generate_readme_files(
+            parsed_readme, 
+            translation_response.raw_response
+        )
     debug("README file generation completed")
     
     # Generate summary report (same processing as gen command)
     summary = generator.generate_summary(generation_result)
     click.echo(summary)
     debug("Summary report generation completed")
+    
+    return generation_result
 
 
 @click.command()
@@ -270,6 +482,7 @@ def set_command(config_file, debug_mode):
             debug("Debug mode enabled")
         
         # Load the external configuration file
+        import yaml
         with open(config_file, 'r', encoding='utf-8') as f:
             external_config = yaml.safe_load(f)
         
@@ -352,3 +565,243 @@ def export_command(output, debug_mode):
         if debug_mode:
             import traceback
             traceback.print_exc()
+
+
+@click.command()
+@click.argument('manifest', type=click.Path(exists=True, dir_okay=False))
+@click.option('--config', help='Configuration file path')
+@click.option('--jobs', type=int, default=4, show_default=True, help='Number of projects processed at the same time')
+@click.option('--cache-dir', help='Translation cache directory, unchanged projects are not requested again')
+@click.option('--no-cache', is_flag=True, help='Ignore cached replies and do not store new ones')
+@click.option('--verbose', is_flag=True, help='Show detailed output')
+@click.option('--debug', 'debug_mode', is_flag=True, help='Enable debug mode, output DEBUG level logs')
+@click.option('--metrics-file', help='Write run metrics to this file')
+@click.option('--metrics-format', type=click.Choice(METRIC_FORMATS), default='json', help='Metrics file format')
+def batch_command(manifest, config, jobs, cache_dir, no_cache, verbose, debug_mode, metrics_file, metrics_format):
+    """Translate the README files of every project listed in a manifest"""
+    try:
+        # Set log level based on --debug parameter
+        if debug_mode:
+            enable_debug()
+            debug("Debug mode enabled")
+        
+        # Load configuration
+        config_obj = Config(config)
+        _configure_logging(config_obj)
+        
+        # Validate configuration
+        if not config_obj.validate():
+            click.echo("Error: Configuration validation failed", err=True)
+            return
+        
+        projects = _load_manifest(manifest)
+        jobs = max(jobs, 1)
+        if metrics_file:
+            get_metrics().enable()
+        
+        # One translator for all projects, sharing its connection pool and reply cache
+        from ..core.translator import Translator
+        if not config_obj.get("sse.pool_size"):
+            config_obj.set("sse.pool_size", jobs)
+        cache = _create_cache(config_obj, cache_dir, no_cache)
+        translator = Translator(config_obj, cache=cache)
+        
+        click.echo("=" * 50)
+        click.echo(f"Starting batch translation of {len(projects)} projects with {jobs} workers")
+        click.echo("=" * 50)
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(_run_batch_project, translator, project, verbose) for project in projects]
+            results = [future.result() for future in futures]
+        
+        click.echo(_format_batch_summary(results, cache, time.perf_counter() - start))
+        _write_metrics(metrics_file, metrics_format)
+        
+        if any(not result["success"] for result in results):
+            sys.exit(1)
+        
+    except Exception as e:
+        click.echo(f"❌ Execution failed: {e}", err=True)
+        if verbose or debug_mode:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
+
+
+def _load_manifest(manifest: str) -> List[Dict[str, Any]]:
+    """
+    Read the project list of a batch manifest
+    
+    The manifest is YAML (or JSON), either a list of projects or a mapping with
+    a "projects" list and optional default "languages" and "mode". Each project
+    is a path or a mapping with "path" and optional "languages" and "mode"
+    ("trans" translates the README, "gen" generates from the whole project).
+    Relative paths are resolved against the manifest directory.
+    
+    Args:
+        manifest: Manifest file path
+        
+    Returns:
+        List[Dict[str, Any]]: Projects with "path", "languages" and "mode"
+    """
+    import yaml
+    manifest_path = Path(manifest)
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+    
+    if isinstance(data, list):
+        data = {"projects": data}
+    if not isinstance(data, dict) or not isinstance(data.get("projects"), list):
+        raise click.BadParameter("manifest must be a list of projects or contain a 'projects' list")
+    
+    def parse_languages(value):
+        if value is None or isinstance(value, list):
+            return value
+        return [lang.strip() for lang in str(value).split(',') if lang.strip()]
+    
+    default_languages = parse_languages(data.get("languages"))
+    default_mode = data.get("mode", "trans")
+    
+    projects = []
+    for entry in data["projects"]:
+        if isinstance(entry, str):
+            entry = {"path": entry}
+        if not isinstance(entry, dict) or "path" not in entry:
+            raise click.BadParameter(f"invalid manifest entry: {entry}")
+        
+        mode = entry.get("mode", default_mode)
+        if mode not in ("trans", "gen"):
+            raise click.BadParameter(f"unknown mode '{mode}' for {entry['path']}")
+        languages = parse_languages(entry.get("languages"))
+        projects.append({
+            "path": str((manifest_path.parent / Path(entry["path"]).expanduser()).resolve()),
+            "languages": languages if languages is not None else default_languages,
+            "mode": mode
+        })
+    return projects
+
+
+def _run_batch_project(translator: "Translator", project: Dict[str, Any], verbose: bool = False) -> Dict[str, Any]:
+    """Translate one manifest project and return its result record"""
+    start = time.perf_counter()
+    result = {"path": project["path"], "success": False, "saved": 0, "failed": 0, "error": ""}
+    
+    workflow = run_text_translation_workflow if project["mode"] == "trans" else run_translation_workflow
+    try:
+        if not Path(project["path"]).is_dir():
+            raise FileNotFoundError("project directory not found")
+        
+        # Files are written into the project, not the current directory
+        generation_result = workflow(
+            translator=translator,
+            parser_obj=Parser(),
+            generator=Generator.from_config(translator.config, base_dir=Path(project["path"])),
+            project_path=project["path"],
+            languages=project["languages"],
+            verbose=verbose
+        )
+        if generation_result is None:
+            result["error"] = "translation failed"
+        else:
+            result["saved"] = generation_result.total_saved
+            result["failed"] = generation_result.total_failed
+            result["success"] = generation_result.total_saved > 0 and generation_result.total_failed == 0
+            if not result["success"]:
+                result["error"] = f"{generation_result.total_failed} files failed to save"
+    except Exception as e:
+        result["error"] = str(e)
+        warning(f"⚠ Batch project {project['path']} failed: {e}")
+    
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _create_cache(config_obj: Config, cache_dir: str = None, no_cache: bool = False):
+    """Create the reply cache shared by a batch run or server, None when --no-cache is given"""
+    from ..utils.cache import TranslationCache
+    if no_cache:
+        # Keeps the translator from creating its own cache from the configuration
+        config_obj.set("translation.cache_dir", "")
+        return None
+    return TranslationCache(cache_dir or config_obj.get("translation.cache_dir"))
+
+
+def _format_batch_summary(results: List[Dict[str, Any]], cache, elapsed: float) -> str:
+    """Format the per-project results of a batch run"""
+    succeeded = sum(1 for result in results if result["success"])
+    cached = f", {cache.hits} cached replies" if cache is not None else ""
+    lines = [
+        "=" * 60,
+        f"Batch completed in {elapsed:.1f}s: {succeeded} succeeded, {len(results) - succeeded} failed{cached}",
+        "=" * 60
+    ]
+    for result in results:
+        if result["success"]:
+            lines.append(f"  ✓ {result['path']} ({result['saved']} files, {result['seconds']:.1f}s)")
+        else:
+            lines.append(f"  ✗ {result['path']}: {result['error']}")
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option('--config', help='Configuration file path')
+@click.option('--host', help='Bind address, defaults to serve.host')
+@click.option('--port', type=int, help='Bind port, defaults to serve.port')
+@click.option('--concurrency', type=int, help='Translations running at the same time, defaults to serve.concurrency')
+@click.option('--queue-size', type=int, help='Requests waiting for a free slot before new ones get 503')
+@click.option('--root', help='Directory project paths are resolved under, defaults to serve.root')
+@click.option('--allow-write', is_flag=True, help='Let project requests write README files')
+@click.option('--cache-dir', help='Translation cache directory')
+@click.option('--no-cache', is_flag=True, help='Ignore cached replies and do not store new ones')
+@click.option('--debug', 'debug_mode', is_flag=True, help='Enable debug mode, output DEBUG level logs')
+def serve_command(config, host, port, concurrency, queue_size, root, allow_write, cache_dir, no_cache,
+                  debug_mode):
+    """Serve translations over a local HTTP/JSON API"""
+    try:
+        # Set log level based on --debug parameter
+        if debug_mode:
+            enable_debug()
+            debug("Debug mode enabled")
+        
+        # Load configuration
+        config_obj = Config(config)
+        _configure_logging(config_obj)
+        
+        # Validate configuration
+        if not config_obj.validate():
+            click.echo("Error: Configuration validation failed", err=True)
+            return
+        
+        host = host or config_obj.get("serve.host", "127.0.0.1")
+        port = port if port is not None else config_obj.get("serve.port", 8780)
+        concurrency = concurrency or config_obj.get("serve.concurrency", 4)
+        queue_size = queue_size if queue_size is not None else config_obj.get("serve.queue_size", 16)
+        root = root or config_obj.get("serve.root") or None
+        allow_write = allow_write or config_obj.get("serve.allow_write", False)
+        
+        # Kept for the lifetime of the server, so pooled connections and cached replies are reused
+        from ..core.translator import Translator
+        from ..services.api_server import TranslationServer
+        if not config_obj.get("sse.pool_size"):
+            config_obj.set("sse.pool_size", concurrency)
+        cache = _create_cache(config_obj, cache_dir, no_cache)
+        translator = Translator(config_obj, cache=cache)
+        
+        server = TranslationServer(translator, host, port, concurrency, queue_size, root, allow_write)
+        click.echo(f"Serving translations on {server.url} ({concurrency} concurrent, {queue_size} queued)")
+        if server.root is None:
+            click.echo("Project translation disabled, set --root or serve.root to enable it")
+        else:
+            click.echo(f"Projects under {server.root}, writing files {'allowed' if allow_write else 'disabled'}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            click.echo("\nServer stopped")
+        
+    except Exception as e:
+        click.echo(f"❌ Execution failed: {e}", err=True)
+        if debug_mode:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
@@ -5,7 +5,7 @@ Provides the main entry point for the command line interface.
 """
 
 import click
-from .commands import gen_command, config_command, trans_command, set_command, export_command
+from .commands import gen_command, config_command, trans_command, set_command, export_command, batch_command, serve_command
 
 
 @click.group()
@@ -25,6 +25,8 @@ cli.add_command(trans_command, name="trans")
 cli.add_command(config_command, name="config")
 cli.add_command(set_command, name="set")
 cli.add_command(export_command, name="export")
+cli.add_command(batch_command, name="batch")
+cli.add_command(serve_command, name="serve")
 
 
 def main():
@@ -4,8 +4,15 @@ Core functionality module
 Contains the core logic for generation, parsing, and generation.
 """
 
-from .translator import Translator
 from .parser import Parser
 from .generator import Generator
 
+
+def __getattr__(name):
+    # Translator pulls in the network stack, load it on first access (PEP 562)
+    if name == "Translator":
+        from .translator import Translator
+        return Translator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = ["Translator", "Parser", "Generator"] 
\ No newline at end of file
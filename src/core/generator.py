@@ -5,23 +5,48 @@ Responsible for generating and saving multi-language README files.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from ..utils.config import Config
 from ..utils.file_utils import FileUtils
 from ..models.types import ParsedReadme, GenerationResult
 from ..utils.logger import debug, info, warning, error
+from ..utils.profiler import span
 
 
 class Generator:
     """Document generator class, responsible for generating and saving multi-language README files"""
     
-    def __init__(self):
+    def __init__(self, base_dir: Optional[Path] = None, write_workers: int = 1):
         """
         Initialize generator
+        
+        Args:
+            base_dir: Project directory the files are written to, defaults to the current directory
+            write_workers: Threads writing README files, 1 writes them one after another
         """
-        self.output_dir = Path("docs")
+        self.write_workers = max(write_workers, 1)
+        self.base_dir = Path(base_dir) if base_dir is not None else None
+        self.output_dir = self.base_dir / "docs" if self.base_dir is not None else Path("docs")
         self.file_utils = FileUtils()
+        # Files written from the stream in this run, rewriting them with the same content is not "unchanged"
+        self._streamed_paths = set()
         debug("Document generator initialized")
+    
+    @classmethod
+    def from_config(cls, config: Config, base_dir: Optional[Path] = None) -> "Generator":
+        """
+        Create a generator with the write settings of a configuration
+        
+        Args:
+            config: Configuration object
+            base_dir: Project directory the files are written to, defaults to the current directory
+            
+        Returns:
+            Generator: Document generator
+        """
+        return cls(base_dir=base_dir, write_workers=config.get("translation.write_workers", 1))
         
     def generate_readme_files(self, parsed_readme: ParsedReadme, raw_content: str = "") -> GenerationResult:
         """
@@ -41,56 +66,122 @@ class Generator:
         
         saved_files = []
         failed_files = []
+        total_unchanged = 0
         
         # Generate language links for English README
         language_links = self._generate_language_links(parsed_readme.content.keys())
         
-        # Save README files for each language
+        # Resolve every target first, the writes themselves may run in parallel
+        targets = []
         for lang, content in parsed_readme.content.items():
-            try:
-                debug(f"Generating README file for {lang} language")
-                
-                # English README goes in root directory
-                if lang == "English" or lang == "en":
-                    filename = "README.md"
-                    filepath = Path(filename)
-                    # Add multi-language note at the beginning of English README
-                    language_note = f"> Homepage is English README. You can view the {language_links} versions.\n\n"
-                    content = self._add_language_note_to_content(content, language_note)
-                    debug("English README will be saved to root directory")
-                else:
-                    # Other languages go in docs directory
-                    filename = self._get_filename_for_language(lang)
-                    filepath = self.output_dir / filename
-                    debug(f"{lang} README will be saved to: {filepath}")
-                
-                self.file_utils.write_text_file(filepath, content)
-                saved_files.append({
-                    "language": lang,
-                    "filename": filename,
-                    "filepath": str(filepath),
-                    "size": len(content)
-                })
-                debug(f"✅ Successfully saved {lang} README file ({len(content)} characters)")
-            except Exception as e:
+            # English README goes in root directory
+            if lang == "English" or lang == "en":
+                filename = "README.md"
+                filepath = self.base_dir / filename if self.base_dir is not None else Path(filename)
+                # Add multi-language note at the beginning of English README
+                language_note = f"> Homepage is English README. You can view the {language_links} versions.\n\n"
+                content = self._add_language_note_to_content(content, language_note)
+                debug("English README will be saved to root directory")
+            else:
+                # Other languages go in docs directory
+                filename = self._get_filename_for_language(lang)
+                filepath = self.output_dir / filename
+                debug(f"{lang} README will be saved to: {filepath}")
+            targets.append((lang, filename, filepath, content))
+        
+        # Results are collected in language order, whichever write finishes first
+        for (lang, filename, filepath, content), outcome in zip(targets, self._write_files(targets)):
+            written, exc = outcome
+            if exc is not None:
                 failed_files.append({
                     "language": lang,
                     "filename": filename,
-                    "error": str(e)
+                    "error": str(exc)
                 })
-                error(f"❌ Failed to save {lang} README: {e}")
-                debug(f"Save failure details: {e}")
-        
-
+                error(f"❌ Failed to save {lang} README: {exc}")
+                debug(f"Save failure details: {exc}")
+                continue
+            
+            unchanged = not written and str(filepath) not in self._streamed_paths
+            total_unchanged += unchanged
+            saved_files.append({
+                "language": lang,
+                "filename": filename,
+                "filepath": str(filepath),
+                "size": len(content),
+                "unchanged": unchanged
+            })
+            if unchanged:
+                debug(f"{lang} README unchanged, not rewritten")
+            else:
+                debug(f"✅ Successfully saved {lang} README file ({len(content)} characters)")
         
-        debug(f"README file generation completed: {len(saved_files)} successful, {len(failed_files)} failed")
+        debug(f"README file generation completed: {len(saved_files)} successful, {len(failed_files)} failed, "
+              f"{total_unchanged} unchanged")
         return GenerationResult(
             saved_files=saved_files,
             failed_files=failed_files,
             total_saved=len(saved_files),
-            total_failed=len(failed_files)
+            total_failed=len(failed_files),
+            total_unchanged=total_unchanged
         )
     
+    def _write_files(self, targets: List[Tuple[str, str, Path, str]]) -> List[Tuple[bool, Optional[Exception]]]:
+        """
+        Write README files, on write_workers threads when there are several
+        
+        Args:
+            targets: (language, filename, filepath, content) of each file
+            
+        Returns:
+            List of (written, error) in the order of targets
+        """
+        def write(target: Tuple[str, str, Path, str]) -> Tuple[bool, Optional[Exception]]:
+            lang, _, filepath, content = target
+            debug(f"Generating README file for {lang} language")
+            try:
+                with span("write"):
+                    return self.file_utils.write_text_file(filepath, content, skip_unchanged=True), None
+            except Exception as e:
+                return False, e
+        
+        workers = min(self.write_workers, len(targets))
+        if workers <= 1:
+            return [write(target) for target in targets]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="readme-writer") as pool:
+            return list(pool.map(write, targets))
+    
+    def write_streamed_language(self, lang: str, content: str) -> bool:
+        """
+        Write a single language README as soon as it arrives from the stream
+        
+        The English README is left to generate_readme_files, since its header
+        links depend on the final set of languages.
+        
+        Args:
+            lang: Language code
+            content: README content
+            
+        Returns:
+            bool: Whether the file was written
+        """
+        if lang == "English" or lang == "en":
+            return False
+        
+        filepath = self.output_dir / self._get_filename_for_language(lang)
+        try:
+            with span("write"):
+                written = self.file_utils.write_text_file(filepath, content, skip_unchanged=True)
+            if not written:
+                debug(f"{lang} README received, unchanged")
+                return False
+            self._streamed_paths.add(str(filepath))
+            info(f"✓ {lang} README received, saved to {filepath}")
+            return True
+        except Exception as e:
+            warning(f"⚠ Failed to save streamed {lang} README: {e}")
+            return False
+    
     def _ensure_output_directory(self):
         """Ensure output directory exists"""
         if not self.output_dir.exists():
@@ -469,7 +560,8 @@ class Generator:
         for file_info in generation_result.saved_files:
             if file_info["language"] != "raw":
                 location = "root directory" if file_info["filename"] == "README.md" else f"{self.output_dir} directory"
-                summary_lines.append(f"  - {file_info['filename']} ({file_info['size']} bytes) - {location}")
+                status = ", unchanged" if file_info.get("unchanged") else ""
+                summary_lines.append(f"  - {file_info['filename']} ({file_info['size']} bytes{status}) - {location}")
         
         # Add original response file
         raw_files = [f for f in generation_result.saved_files if f["language"] == "raw"]
@@ -483,6 +575,9 @@ class Generator:
             for lang in languages:
                 summary_lines.append(f"  - {lang}")
         
+        if generation_result.total_unchanged:
+            summary_lines.append(f"✓ {generation_result.total_unchanged} files unchanged, not rewritten")
+        
         # Add failure information
         if generation_result.failed_files:
             summary_lines.append("Failed files:")
@@ -0,0 +1,263 @@
+"""
+Pipeline core module
+
+Runs project generation as stages connected by bounded queues, so scanning,
+reading, the upstream request and file writes overlap instead of running
+one after another:
+
+    discover -> excerpt -> batch -> translate -> write
+"""
+
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+from .generator import Generator
+from .translator import Translator, MAX_CONTENT_LENGTH
+from ..models.types import TranslationResponse
+from ..services.sse_client import StreamCancelled
+from ..utils.logger import debug, warning
+from ..utils.profiler import span
+
+# Marks the end of a stage's input
+_DONE = object()
+
+# Stage function: (item, emit) -> None, emit passes an item to the next stage
+StageFunc = Callable[[Any, Callable[[Any], None]], None]
+
+
+class _Cancelled(StreamCancelled):
+    """Raised in a stage when the pipeline stopped because another stage failed"""
+
+
+class Stage:
+    """Pipeline stage, one or more worker threads applying a function to each item"""
+
+    def __init__(self, name: str, func: StageFunc, workers: int = 1,
+                 finish: Optional[Callable[[Callable[[Any], None]], None]] = None):
+        """
+        Initialize stage
+
+        Args:
+            name: Stage name, used for profiling spans and thread names
+            func: Function called with each input item and an emit callback
+            workers: Worker threads, items are processed out of order when above 1
+            finish: Function called with the emit callback once all input is processed
+        """
+        self.name = name
+        self.func = func
+        self.workers = max(workers, 1)
+        self.finish = finish
+
+
+class Pipeline:
+    """Stages connected by bounded queues, each stage running in its own threads"""
+
+    def __init__(self, stages: List[Stage], queue_size: int = 8):
+        """
+        Initialize pipeline
+
+        Args:
+            stages: Stages in order, the output of each is the input of the next
+            queue_size: Items buffered between two stages before the producer waits
+        """
+        self.stages = stages
+        self.queue_size = max(queue_size, 1)
+        self._error: Optional[BaseException] = None
+        self._failed = threading.Event()
+
+    def run(self, items: List[Any]) -> List[Any]:
+        """
+        Feed items through every stage
+
+        Args:
+            items: Input of the first stage
+
+        Returns:
+            List[Any]: Items emitted by the last stage
+
+        Raises:
+            Exception: The first error raised by a stage
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        threads = []
+        for index, stage in enumerate(self.stages):
+            remaining = [stage.workers]
+            lock = threading.Lock()
+            for worker in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[index], queues[index + 1], remaining, lock),
+                    name=f"pipeline-{stage.name}-{worker}",
+                    daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+
+        feeder = threading.Thread(target=self._feed, args=(items, queues[0]), daemon=True)
+        feeder.start()
+
+        results = []
+        while True:
+            item = queues[-1].get()
+            if item is _DONE:
+                break
+            results.append(item)
+
+        for thread in [feeder] + threads:
+            thread.join()
+        if self._error is not None:
+            raise self._error
+        return results
+
+    def _feed(self, items: List[Any], output: queue.Queue):
+        """Put the input items on the first queue"""
+        for item in items:
+            if not self._put(output, item):
+                break
+        output.put(_DONE)
+
+    def _put(self, output: queue.Queue, item: Any) -> bool:
+        """Put an item, giving up once another stage failed"""
+        while not self._failed.is_set():
+            try:
+                output.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _work(self, stage: Stage, input_queue: queue.Queue, output: queue.Queue, remaining: List[int],
+              lock: threading.Lock):
+        """Worker loop of a stage"""
+        def emit(item: Any):
+            if not self._put(output, item):
+                raise _Cancelled()
+
+        while True:
+            item = input_queue.get()
+            if item is _DONE:
+                # Let the other workers of this stage see the end too
+                input_queue.put(_DONE)
+                break
+            # After a failure, input is still drained so upstream stages are never blocked
+            if self._failed.is_set():
+                continue
+            try:
+                with span(stage.name):
+                    stage.func(item, emit)
+            except _Cancelled:
+                pass
+            except BaseException as e:
+                self._fail(e)
+        self._close_worker(stage, emit, output, remaining, lock)
+
+    def _close_worker(self, stage: Stage, emit: Callable[[Any], None], output: queue.Queue,
+                      remaining: List[int], lock: threading.Lock):
+        """Run the stage's finish step after its last worker and pass the end on"""
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if not last:
+            return
+        try:
+            if stage.finish is not None and not self._failed.is_set():
+                with span(stage.name):
+                    stage.finish(emit)
+        except _Cancelled:
+            pass
+        except BaseException as e:
+            self._fail(e)
+        debug("Pipeline stage %s finished", stage.name)
+        # The end marker always goes through, so the caller never waits forever
+        output.put(_DONE)
+
+    def _fail(self, error: BaseException):
+        """Record the first error and stop every stage"""
+        if self._error is None:
+            self._error = error
+        self._failed.set()
+
+
+class TranslationPipeline:
+    """Project generation as a discover, excerpt, batch, translate and write pipeline"""
+
+    def __init__(self, translator: Translator, generator: Generator, queue_size: int = 8, read_workers: int = 4):
+        """
+        Initialize translation pipeline
+
+        Args:
+            translator: Translator reading the project and sending requests
+            generator: Generator streamed languages are written with
+            queue_size: Items buffered between two stages
+            read_workers: Threads reading and compressing files
+        """
+        self.translator = translator
+        self.generator = generator
+        self.queue_size = queue_size
+        self.read_workers = read_workers
+
+    def run(self, project_path: str, languages: Optional[List[str]] = None,
+            stream_output: bool = True) -> TranslationResponse:
+        """
+        Generate a project, writing each language as soon as it is complete in the stream
+
+        Produces the same requests as Translator.translate_project.
+
+        Args:
+            project_path: Project path
+            languages: List of languages to generate, if None then use default languages
+            stream_output: Write languages while the reply streams
+
+        Returns:
+            TranslationResponse: Generation response object
+        """
+        translator = self.translator
+        project_root = Path(project_path)
+        excerpts: List[Tuple[int, str]] = []
+
+        def discover(path: Path, emit):
+            readme_path, important_files, _ = translator._discover_files(path)
+            for index, file_path in enumerate(([readme_path] if readme_path is not None else []) + important_files):
+                emit((index, file_path))
+
+        def excerpt(item: Tuple[int, Path], emit):
+            index, file_path = item
+            emit((index, translator._read_excerpt(file_path, project_root)))
+
+        def collect(item: Tuple[int, str], emit):
+            excerpts.append(item)
+
+        def batch(emit):
+            # Batches depend on the total length, so they are built once every file is read
+            project_content = "".join(text for _, text in sorted(excerpts))
+            if len(project_content) > MAX_CONTENT_LENGTH:
+                warning(f"⚠ Content too long ({len(project_content)} characters), will process in batches")
+            emit(translator._build_project_requests(project_content, languages))
+
+        def translate(requests, emit):
+            if not requests:
+                emit(TranslationResponse(success=False, error="Unable to split content", languages=languages or []))
+                return
+            # Languages go to the writer through the queue, so the stream is never held up by disk writes
+            on_language = (lambda lang, content: emit((lang, content))) if stream_output else None
+            emit(translator._execute_requests(requests, languages, on_language))
+
+        def write(item, emit):
+            if isinstance(item, TranslationResponse):
+                emit(item)
+            elif languages is None or item[0] in languages:
+                # Same filter as the parser, so only requested languages are written early
+                self.generator.write_streamed_language(*item)
+
+        pipeline = Pipeline([
+            Stage("discover", discover),
+            Stage("excerpt", excerpt, workers=self.read_workers),
+            Stage("batch", collect, finish=batch),
+            Stage("translate", translate),
+            Stage("write", write),
+        ], self.queue_size)
+        results = pipeline.run([project_root])
+        return results[-1]
+
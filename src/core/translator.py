@@ -7,91 +7,218 @@ Responsible for generating project content in multiple languages.
 import os
 import json
 import re
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from ..services.tencent_cloud import TencentCloudService
-from ..services.sse_client import SSEClient
+from ..services.sse_client import SSEClient, StreamCancelled
 from ..utils.config import Config
 from ..utils.file_utils import FileUtils
-from ..models.types import TranslationRequest, TranslationResponse
+from ..utils.json_extractor import JSONExtractor, StreamingJSONExtractor
+from ..models.types import TranslationRequest, TranslationResponse, TranslationPlan, PlannedFile, PlannedBatch
 from ..utils.logger import debug, info, warning, error
+from ..utils.profiler import span
+from ..utils.metrics import metrics
+from ..utils.cache import SingleFlight, TranslationCache
+
+
+# Project content longer than this is sent in batches
+MAX_CONTENT_LENGTH = 15000
+
+# Importance rules of _score_file: (name keywords, score, reason)
+FILE_SCORE_RULES = [
+    (('main', 'core', 'translator', 'generator', 'parser'), 100, "core file"),
+    (('config', 'settings', 'setup'), 80, "configuration file"),
+    (('utils', 'helpers', 'tools'), 60, "utility file"),
+    (('models', 'types', 'schema'), 50, "model file"),
+    (('services', 'api', 'client'), 40, "service file"),
+    (('cli', 'commands'), 30, "CLI file"),
+    (('test', 'spec'), 10, "test file"),
+]
+
+# Other files selected by importance besides the README and requirements
+MAX_IMPORTANT_FILES = 2
+
+# Files left out by the selection that are still listed in a plan
+PLAN_RUNNER_UPS = 3
 
 
 class Translator:
     """Generator class, responsible for project content generation"""
     
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(self, config: Optional[Config] = None, cache: Optional[TranslationCache] = None):
         """
         Initialize translator
         
         Args:
             config: Configuration object, if None then use default configuration
+            cache: Translation reply cache, if None then one is created when translation.cache_dir is set
         """
         self.config = config or Config()
         self.tencent_service = TencentCloudService(self.config)
         self.sse_client = SSEClient(self.config)
         self.file_utils = FileUtils()
-        
-    def translate_project(self, project_path: str, languages: Optional[List[str]] = None) -> TranslationResponse:
+        cache_dir = self.config.get("translation.cache_dir")
+        self.cache = cache if cache is not None else (TranslationCache(cache_dir) if cache_dir else None)
+        # Identical requests running at the same time share one upstream stream
+        self._flights = SingleFlight()
+        
+    def translate_project(self, project_path: str, languages: Optional[List[str]] = None,
+                          on_language: Optional[Callable[[str, str], None]] = None,
+                          root: Optional[str] = None) -> TranslationResponse:
         """
         Generate entire project
         
         Args:
             project_path: Project path
             languages: List of languages to generate, if None then use default languages
+            on_language: Optional callback receiving (language code, content) as each language completes
+            root: Directory files must really be under, symlinks leading out of it are skipped
             
         Returns:
             TranslationResponse: Generation response object
         """
         # Read project content
-        project_content = self._read_project_content(project_path)
+        with span("read_project"):
+            project_content = self._read_project_content(project_path, root=root)
         
         # Check content length, if too long then process in batches
-        max_content_length = 15000  # 15KB limit
-        
-        if len(project_content) > max_content_length:
+        if len(project_content) > MAX_CONTENT_LENGTH:
             warning(f"⚠ Content too long ({len(project_content)} characters), will process in batches")
-            return self._translate_project_in_batches(project_content, languages, max_content_length)
+            return self._translate_project_in_batches(project_content, languages, MAX_CONTENT_LENGTH, on_language)
         else:
             # Build generation request
             request = self._build_translation_request(project_content, languages)
+            request.on_language = on_language
             
             # Execute generation
             response = self._execute_translation(request)
             
             return response
     
-    def translate_text_only(self, text: str, languages: Optional[List[str]] = None) -> TranslationResponse:
+    def plan_project(self, project_path: str, languages: Optional[List[str]] = None) -> TranslationPlan:
+        """
+        Plan the generation of a project without sending any request
+        
+        Runs the same discovery, selection, compression and batching as
+        translate_project and measures the requests it would send.
+        
+        Args:
+            project_path: Project path
+            languages: List of languages to generate, if None then use default languages
+            
+        Returns:
+            TranslationPlan: Files chosen and planned requests
+        """
+        plan = TranslationPlan(project_path=str(project_path), languages=[], files_scanned=0, content_characters=0)
+        with span("read_project"):
+            project_content = self._read_project_content(project_path, plan=plan)
+        plan.content_characters = len(project_content)
+        
+        if len(project_content) > MAX_CONTENT_LENGTH:
+            batches = self._create_batches(self._split_content_by_files(project_content), MAX_CONTENT_LENGTH)
+        else:
+            batches = [project_content]
+        requests = self._build_project_requests(project_content, languages)
+        
+        for i, (content, request) in enumerate(zip(batches, requests), 1):
+            request_bytes, wire_bytes = self.sse_client.measure_request(request)
+            variables = (request.additional_params or {}).get("workflow_variables", {})
+            sent_text = request.content + "".join(str(value) for value in variables.values())
+            plan.batches.append(PlannedBatch(
+                index=i,
+                characters=len(content),
+                estimated_tokens=self._estimate_tokens(sent_text),
+                request_bytes=request_bytes,
+                wire_bytes=wire_bytes
+            ))
+            plan.languages = request.languages
+        
+        return plan
+    
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """
+        Roughly estimate the tokens of a text
+        
+        ASCII text averages about four characters per token, other characters
+        (CJK in particular) about one token each.
+        """
+        ascii_chars = sum(1 for char in text if char < '\x80')
+        return (ascii_chars + 3) // 4 + len(text) - ascii_chars
+    
+    def translate_text_only(self, text: str, languages: Optional[List[str]] = None,
+                            on_language: Optional[Callable[[str, str], None]] = None) -> TranslationResponse:
         """
         Pure text translation function
         
         Args:
             text: Text content to translate
             languages: Target language list
+            on_language: Optional callback receiving (language code, content) as each language completes
             
         Returns:
             TranslationResponse: Translation response object
         """
         # Build pure translation request
         request = self._build_text_translation_request(text, languages)
+        request.on_language = on_language
         
         # Execute translation
         response = self._execute_translation(request)
         
         return response
     
-    def _read_project_content(self, project_path: str) -> str:
+    def _read_project_content(self, project_path: str, plan: Optional[TranslationPlan] = None,
+                              root: Optional[str] = None) -> str:
         """
         Read project file content, supports .gitignore filtering and intelligent compression
         
         Args:
             project_path: Project path
+            plan: Plan to record the files considered and why in, if any
+            root: Directory files must really be under, if any
             
         Returns:
             str: Project content string
         """
-        content = ""
         project_path = Path(project_path)
+        readme_path, important_files, other_files = self._discover_files(project_path, plan, root)
+        
+        content = ""
+        for file_path in ([readme_path] if readme_path is not None else []) + important_files:
+            content += self._read_excerpt(file_path, project_path, plan)
+        
+        if plan is not None:
+            # Runner-ups show what the selection left out
+            runner_ups = self._select_important_files(other_files, max_files=len(important_files) + PLAN_RUNNER_UPS)
+            for file_path in runner_ups[len(important_files):]:
+                score, reasons = self._score_file(file_path)
+                plan.files.append(PlannedFile(
+                    path=str(file_path.relative_to(project_path)),
+                    selected=False,
+                    score=score,
+                    reasons=reasons + [f"below the top {MAX_IMPORTANT_FILES}"]
+                ))
+        
+        return content
+    
+    def _discover_files(self, project_path: Path, plan: Optional[TranslationPlan] = None,
+                        root: Optional[str] = None) -> Tuple[Optional[Path], List[Path], List[Path]]:
+        """
+        Scan the project and choose the files to read
+        
+        Args:
+            project_path: Project path
+            plan: Plan to record the number of scanned files in, if any
+            root: Directory files must really be under, symlinked files resolving outside it are skipped
+            
+        Returns:
+            Tuple of the README path (None if missing), the selected files and all non-README files
+        """
+        if plan is None:
+            # Connect upstream while the project is scanned, plans send nothing
+            self.sse_client.warm_up()
         
         # Check if .gitignore file exists
         gitignore_path = project_path / ".gitignore"
@@ -101,50 +228,80 @@ class Translator:
             warning(f"⚠ No .gitignore file found, will read all text files")
         
         # Get project file list (apply .gitignore filtering)
-        project_files = self.file_utils.get_project_files(project_path, include_gitignore=True)
+        with span("scan"):
+            project_files = self.file_utils.get_project_files(project_path, include_gitignore=True)
+        if root is not None:
+            project_files = self._confine_files(project_files, Path(root))
+        metrics.inc("files_scanned", len(project_files))
+        if plan is not None:
+            plan.files_scanned = len(project_files)
         
         # Prioritize reading README.md
         readme_files = [f for f in project_files if f.name.lower() == "readme.md"]
-        if readme_files:
-            readme_path = readme_files[0]
-            try:
-                readme_content = readme_path.read_text(encoding="utf-8")
-                # Compress README content, keep important parts
-                compressed_readme = self._compress_content(readme_content, max_length=3000)
-                content += "=== README.md ===\n"
-                content += compressed_readme
-                content += "\n\n"
-                debug(f"✓ Read and compressed {readme_path.relative_to(project_path)} ({len(compressed_readme)} characters)")
-            except Exception as e:
-                error(f"✗ Failed to read README.md: {e}")
-        else:
+        readme_path = readme_files[0] if readme_files else None
+        if readme_path is None:
             warning(f"⚠ README.md not found")
         
         # Intelligently select the most important files
         other_files = [f for f in project_files if f.name.lower() != "readme.md"]
-        important_files = self._select_important_files(other_files, max_files=2)
-        
+        important_files = self._select_important_files(other_files, max_files=MAX_IMPORTANT_FILES)
         if important_files:
             debug(f"✓ Selected {len(important_files)} important files from {len(other_files)} files")
-            
-            for file_path in important_files:
-                try:
-                    relative_path = file_path.relative_to(project_path)
-                    file_content = file_path.read_text(encoding="utf-8")
-                    
-                    # Intelligently compress file content
-                    compressed_content = self._compress_content(file_content, max_length=1500)
-                    
-                    content += f"=== {relative_path} ===\n"
-                    content += compressed_content
-                    content += "\n\n"
-                    debug(f"✓ Read and compressed {relative_path} ({len(compressed_content)} characters)")
-                except Exception as e:
-                    error(f"✗ Failed to read {file_path}: {e}")
         else:
             warning(f"⚠ No other readable files found")
         
-        return content
+        return readme_path, important_files, other_files
+    
+    @staticmethod
+    def _confine_files(files: List[Path], root: Path) -> List[Path]:
+        """Keep the files whose real path, symlinks resolved, is under root"""
+        root = root.resolve()
+        confined = []
+        for file_path in files:
+            real_path = file_path.resolve()
+            if root in real_path.parents:
+                confined.append(file_path)
+            else:
+                warning(f"⚠ Skipped {file_path}, it leads outside {root}")
+        return confined
+    
+    def _read_excerpt(self, file_path: Path, project_path: Path, plan: Optional[TranslationPlan] = None) -> str:
+        """
+        Read and compress one file into its "=== name ===" section of the project content
+        
+        Args:
+            file_path: File path
+            project_path: Project path
+            plan: Plan to record the file in, if any
+            
+        Returns:
+            str: Section text, empty if the file could not be read
+        """
+        is_readme = file_path.name.lower() == "readme.md"
+        relative_path = file_path.relative_to(project_path)
+        try:
+            file_content = file_path.read_text(encoding="utf-8")
+            metrics.inc("bytes_read", len(file_content.encode("utf-8")))
+            # Intelligently compress file content, README keeps more of its text
+            compressed_content = self._compress_content(file_content, max_length=3000 if is_readme else 1500)
+        except Exception as e:
+            error(f"✗ Failed to read {'README.md' if is_readme else file_path}: {e}")
+            return ""
+        
+        if plan is not None:
+            score, reasons = (None, ["README, always included"]) if is_readme else self._score_file(file_path)
+            plan.files.append(PlannedFile(
+                path=str(relative_path),
+                selected=True,
+                characters=len(file_content),
+                compressed_characters=len(compressed_content),
+                score=score,
+                reasons=reasons
+            ))
+        debug(f"✓ Read and compressed {relative_path} ({len(compressed_content)} characters)")
+        
+        name = "README.md" if is_readme else relative_path
+        return f"=== {name} ===\n{compressed_content}\n\n"
     
     def _read_readme_file(self, project_path: str) -> str:
         """
@@ -168,6 +325,8 @@ class Translator:
             for readme_file in readme_files:
                 if readme_file.exists():
                     content = readme_file.read_text(encoding="utf-8")
+                    metrics.inc("files_scanned")
+                    metrics.inc("bytes_read", len(content.encode("utf-8")))
                     debug(f"Successfully read README file: {readme_file}")
                     
                     # Remove the first line if it starts with > (language note)
@@ -197,52 +356,38 @@ class Translator:
         if not files:
             return []
         
-        # Define file importance scoring rules
-        importance_scores = {}
-        
-        for file_path in files:
-            score = 0
-            file_name = file_path.name.lower()
-            relative_path = str(file_path.relative_to(file_path.parents[-2] if len(file_path.parts) > 2 else file_path.parent))
-            
-            # Core files get highest score
-            if any(keyword in file_name for keyword in ['main', 'core', 'translator', 'generator', 'parser']):
-                score += 100
-            
-            # Configuration files get higher score
-            if any(keyword in file_name for keyword in ['config', 'settings', 'setup']):
-                score += 80
-            
-            # Utility files get medium score
-            if any(keyword in file_name for keyword in ['utils', 'helpers', 'tools']):
-                score += 60
-            
-            # Model files get medium score
-            if any(keyword in file_name for keyword in ['models', 'types', 'schema']):
-                score += 50
-            
-            # Service files get medium score
-            if any(keyword in file_name for keyword in ['services', 'api', 'client']):
-                score += 40
-            
-            # CLI files get lower score
-            if any(keyword in file_name for keyword in ['cli', 'commands']):
-                score += 30
-            
-            # Test files get lowest score
-            if any(keyword in file_name for keyword in ['test', 'spec']):
-                score += 10
-            
-            # Path depth affects score (shallower is better)
-            depth_penalty = len(file_path.parts) * 5
-            score -= depth_penalty
-            
-            importance_scores[file_path] = score
+        importance_scores = {file_path: self._score_file(file_path)[0] for file_path in files}
         
         # Sort by score and return top N files
         sorted_files = sorted(files, key=lambda f: importance_scores[f], reverse=True)
         return sorted_files[:max_files]
     
+    def _score_file(self, file_path: Path) -> Tuple[int, List[str]]:
+        """
+        Score the importance of a file from its name and depth
+        
+        Args:
+            file_path: File path
+            
+        Returns:
+            Tuple of the score and the reasons it is made of
+        """
+        score = 0
+        reasons = []
+        file_name = file_path.name.lower()
+        
+        for keywords, points, reason in FILE_SCORE_RULES:
+            if any(keyword in file_name for keyword in keywords):
+                score += points
+                reasons.append(f"{reason} +{points}")
+        
+        # Path depth affects score (shallower is better)
+        depth_penalty = len(file_path.parts) * 5
+        score -= depth_penalty
+        reasons.append(f"depth -{depth_penalty}")
+        
+        return score, reasons
+    
     def _compress_content(self, content: str, max_length: int = 2000) -> str:
         """
         Intelligently compress content, keep important parts
@@ -298,7 +443,8 @@ class Translator:
         
         return content
     
-    def _translate_project_in_batches(self, project_content: str, languages: Optional[List[str]] = None, max_length: int = 30000) -> TranslationResponse:
+    def _translate_project_in_batches(self, project_content: str, languages: Optional[List[str]] = None, max_length: int = 30000,
+                                      on_language: Optional[Callable[[str, str], None]] = None) -> TranslationResponse:
         """
         Generate project content in batches
         
@@ -306,36 +452,78 @@ class Translator:
             project_content: Project content
             languages: Target language list
             max_length: Maximum length per batch
+            on_language: Optional streaming callback, only attached to the last batch since its response is the one kept
             
         Returns:
             TranslationResponse: Generation response object
         """
         debug(f"📦 Starting batch processing, total content length: {len(project_content)} characters")
         
-        # Split content by files
-        content_parts = self._split_content_by_files(project_content)
-        
-        if not content_parts:
+        requests = self._build_batch_requests(project_content, languages, max_length)
+        if not requests:
             return TranslationResponse(
                 success=False,
                 error="Unable to split content",
                 languages=languages or []
             )
         
+        return self._execute_requests(requests, languages, on_language)
+    
+    def _build_project_requests(self, project_content: str, languages: Optional[List[str]] = None) -> List[TranslationRequest]:
+        """
+        Build the requests generating a project, in batches when the content is too long
+        
+        Args:
+            project_content: Project content
+            languages: Target language list
+            
+        Returns:
+            List[TranslationRequest]: Requests in sending order, empty if the content could not be split
+        """
+        if len(project_content) > MAX_CONTENT_LENGTH:
+            return self._build_batch_requests(project_content, languages, MAX_CONTENT_LENGTH)
+        return [self._build_translation_request(project_content, languages)]
+    
+    def _build_batch_requests(self, project_content: str, languages: Optional[List[str]], max_length: int) -> List[TranslationRequest]:
+        """Split project content into batches and build one request per batch"""
+        # Split content by files
+        content_parts = self._split_content_by_files(project_content)
+        if not content_parts:
+            return []
         debug(f"📦 Content split into {len(content_parts)} parts")
         
         # Merge small parts, ensure each batch doesn't exceed limit
         batches = self._create_batches(content_parts, max_length)
-        
         debug(f"📦 Will process in {len(batches)} batches")
         
-        all_responses = []
+        return [
+            self._build_batch_translation_request(batch_content, languages, i, len(batches))
+            for i, batch_content in enumerate(batches, 1)
+        ]
+    
+    def _execute_requests(self, requests: List[TranslationRequest], languages: Optional[List[str]] = None,
+                          on_language: Optional[Callable[[str, str], None]] = None) -> TranslationResponse:
+        """
+        Execute project requests in order, combining the responses of batches
         
-        for i, batch_content in enumerate(batches, 1):
-            debug(f"📦 Processing batch {i}/{len(batches)} (length: {len(batch_content)} characters)")
+        Args:
+            requests: Requests built by _build_project_requests
+            languages: Target language list
+            on_language: Optional streaming callback, only attached to the last request since its response is the one kept
             
-            # Build batch request
-            batch_request = self._build_batch_translation_request(batch_content, languages, i, len(batches))
+        Returns:
+            TranslationResponse: Generation response object
+        """
+        if len(requests) == 1:
+            requests[0].on_language = on_language
+            return self._execute_translation(requests[0])
+        
+        all_responses = []
+        
+        for i, batch_request in enumerate(requests, 1):
+            debug(f"📦 Processing batch {i}/{len(requests)} (length: {len(batch_request.content)} characters)")
+            if i == len(requests):
+                batch_request.on_language = on_language
             
             # Execute generation
             batch_response = self._execute_translation(batch_request)
@@ -352,7 +540,8 @@ class Translator:
         return TranslationResponse(
             success=True,
             content=combined_response,
-            languages=languages or [],
+            # Resolved by the requests when none were given, so missing defaults are completed too
+            languages=requests[-1].languages,
             raw_response="\n\n".join(all_responses)
         )
     
@@ -445,10 +634,16 @@ class Translator:
         language_names = [self.get_language_name(lang) for lang in languages]
         languages_str = "、".join(language_names)
         
+        # Build workflow input variables, the source is sent only once
+        workflow_variables = {
+            "language": languages_str
+        }
+        source = self._place_source(content, workflow_variables)
+        
         prompt = f"""This is part {batch_num}/{total_batches} of the project content. Please generate multi-language README documents from the following project code and README, strictly following the language list: {languages_str}.
 
 Project content (part {batch_num}/{total_batches}):
-{content}
+{source}
 
 Please strictly follow the following format to generate complete README documents for each language, including project introduction, feature description, usage instructions, etc. Must include all required languages, cannot omit or replace:
 
@@ -466,12 +661,6 @@ Please strictly follow the following format to generate complete README document
             else:
                 prompt += f"### {lang_name}\n[{lang_name} README content]\n\n"
         
-        # Build workflow input variables
-        workflow_variables = {
-            "code_text": content,
-            "language": languages_str
-        }
-        
         return TranslationRequest(
             content=prompt,
             languages=languages,
@@ -525,7 +714,7 @@ Please strictly follow the following format to generate complete README document
                 # If not configured, use default language codes
                 languages = ["zh", "en", "ja"]
         
-        print(f"Target languages: {languages}")
+        debug(f"Target languages: {languages}")
         
         # Convert language codes to language names
         language_names = [self.get_language_name(lang) for lang in languages]
@@ -533,16 +722,16 @@ Please strictly follow the following format to generate complete README document
         # Build language list string
         languages_str = "、".join(language_names)
         
-        # Build workflow input variables
+        # Build workflow input variables, the source is sent only once
         workflow_variables = {
-            "code_text": content,
             "language": languages_str
         }
+        source = self._place_source(content, workflow_variables)
         
         # Build concise prompt
         prompt = f"""Generate project as {languages_str} README, format:
 
-Project: {content}
+Project: {source}
 
 Requirements: Generate complete README for each language, including introduction, features, usage instructions.
 
@@ -569,6 +758,26 @@ Format:
             additional_params={"workflow_variables": workflow_variables}
         )
     
+    def _place_source(self, content: str, workflow_variables: Dict[str, str]) -> str:
+        """
+        Decide where the project source travels, so it is sent only once
+        
+        By default the source is embedded in the prompt. With
+        translation.source_transport set to "variable" it is sent only as the
+        code_text workflow variable and the prompt refers to it.
+        
+        Args:
+            content: Project source content
+            workflow_variables: Workflow variables, updated in place
+            
+        Returns:
+            str: Text to place in the prompt
+        """
+        if self.config.get("translation.source_transport", "prompt") == "variable":
+            workflow_variables["code_text"] = content
+            return "(provided in the code_text variable)"
+        return content
+    
     def _execute_translation(self, request: TranslationRequest) -> TranslationResponse:
         """
         Execute generation
@@ -576,6 +785,57 @@ Format:
         Args:
             request: Generation request object
             
+        Returns:
+            TranslationResponse: Generation response object
+        """
+        cache_key = TranslationCache.make_key(request.content, request.languages, request.additional_params)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                info("✓ Using cached reply, request skipped")
+                metrics.inc("cache_hits")
+                return TranslationResponse(
+                    success=True,
+                    content=cached,
+                    languages=request.languages,
+                    raw_response=cached
+                )
+            metrics.inc("cache_misses")
+        
+        response, shared = self._flights.do(cache_key, lambda: self._send_translation(request, cache_key))
+        if shared:
+            info("✓ Shared the reply of an identical request in flight")
+            metrics.inc("coalesced_requests")
+            response = replace(response, languages=request.languages)
+            if response.success and request.on_language is not None:
+                self._replay_languages(response.content, request.on_language)
+        return response
+    
+    @staticmethod
+    def _replay_languages(content: str, on_language: Callable[[str, str], None]):
+        """
+        Report the languages of a shared reply to a caller that did not see the stream
+        
+        Args:
+            content: Reply text
+            on_language: Callback receiving (language code, content) for each complete language
+        """
+        for lang_code, lang_content in StreamingJSONExtractor().feed(content).items():
+            try:
+                on_language(lang_code, lang_content)
+            except StreamCancelled:
+                return
+            except Exception as e:
+                error(f"Failed to handle shared {lang_code} content: {e}")
+    
+    def _send_translation(self, request: TranslationRequest, cache_key: str) -> TranslationResponse:
+        """
+        Send a generation request upstream, caching a successful reply
+        
+        Args:
+            request: Generation request object
+            cache_key: Cache key of the request
+            
         Returns:
             TranslationResponse: Generation response object
         """
@@ -583,23 +843,55 @@ Format:
         
         try:
             # Use SSE client to send request
-            response_text = self.sse_client.send_request(request)
+            with span("request"):
+                response_text = self.sse_client.send_request(request)
+            metrics.record_request(self.sse_client.last_stats)
+            if self.cache is not None:
+                if self._is_complete_reply(response_text, request.languages):
+                    self.cache.put(cache_key, response_text)
+                else:
+                    debug("Reply incomplete, not cached")
             
             return TranslationResponse(
                 success=True,
                 content=response_text,
                 languages=request.languages,
-                raw_response=response_text
+                raw_response=response_text,
+                stats=self.sse_client.last_stats
             )
             
         except Exception as e:
             print(f"❌ Generation failed: {e}")
+            metrics.inc("failed_requests")
+            metrics.record_request(self.sse_client.last_stats)
             return TranslationResponse(
                 success=False,
                 error=str(e),
-                languages=request.languages
+                languages=request.languages,
+                stats=self.sse_client.last_stats
             )
     
+    @staticmethod
+    def _is_complete_reply(response_text: str, languages: List[str]) -> bool:
+        """
+        Check whether a reply can be cached
+        
+        Truncated replies, ones that only parse after repair and ones missing a
+        requested language would otherwise be served again for the same input.
+        
+        Args:
+            response_text: Reply text
+            languages: Requested language codes
+            
+        Returns:
+            bool: Whether the reply holds a complete JSON object with every requested language
+        """
+        json_data = JSONExtractor.extract_complete_json(response_text)
+        if not json_data:
+            return False
+        found = JSONExtractor.extract_language_content(json_data)
+        return all(lang in found for lang in languages)
+    
     def get_supported_languages(self) -> List[str]:
         """
         Get supported language list
@@ -832,7 +1124,7 @@ Format:
                 # If not configured, use default language codes
                 languages = ["zh-Hans", "en", "ja"]
         
-        print(f"Target languages: {languages}")
+        debug(f"Target languages: {languages}")
         
         # Convert language codes to language names
         language_names = [self.get_language_name(lang) for lang in languages]
@@ -7,6 +7,7 @@ Contains all data models and type definitions used in the project.
 from .types import (
     TranslationRequest,
     TranslationResponse,
+    RequestStats,
     ParsedReadme,
     GenerationResult
 )
@@ -14,6 +15,7 @@ from .types import (
 __all__ = [
     "TranslationRequest",
     "TranslationResponse", 
+    "RequestStats",
     "ParsedReadme",
     "GenerationResult"
 ] 
\ No newline at end of file
@@ -4,8 +4,8 @@ Type definition module
 Defines all data structures and types used in the project.
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Any
 
 
 @dataclass
@@ -16,6 +16,33 @@ class TranslationRequest:
     bot_app_key: str
     visitor_biz_id: str
     additional_params: Optional[Dict[str, Any]] = None
+    # Called with (language code, content) as each language completes in the stream
+    on_language: Optional[Callable[[str, str], None]] = None
+
+
+@dataclass
+class RequestStats:
+    """Per-request transfer statistics data class"""
+    request_bytes: int = 0
+    request_wire_bytes: int = 0
+    response_bytes: int = 0
+    chars_received: int = 0
+    events: int = 0
+    connect_seconds: float = 0.0
+    first_event_seconds: float = 0.0
+    stream_seconds: float = 0.0
+    total_seconds: float = 0.0
+    max_gap_seconds: float = 0.0
+    # Number of gaps between consecutive events, keyed by bucket upper bound in seconds ("+Inf" for the rest)
+    gap_histogram: Dict[str, int] = field(default_factory=dict)
+    stall_retries: int = 0
+    
+    @property
+    def chars_per_second(self) -> float:
+        """Reply characters received per second of streaming"""
+        if self.stream_seconds <= 0:
+            return 0.0
+        return self.chars_received / self.stream_seconds
 
 
 @dataclass
@@ -26,6 +53,7 @@ class TranslationResponse:
     languages: List[str] = None
     raw_response: str = ""
     error: str = ""
+    stats: Optional[RequestStats] = None
     
     def __post_init__(self):
         if self.languages is None:
@@ -40,6 +68,57 @@ class ParsedReadme:
     total_count: int
 
 
+@dataclass
+class PlannedFile:
+    """File considered for a generation request data class"""
+    path: str
+    selected: bool
+    # Characters in the file, and characters sent after compression
+    characters: int = 0
+    compressed_characters: int = 0
+    # Importance score, None for files included regardless of score
+    score: Optional[int] = None
+    # Why the file was or was not chosen, e.g. "core file +100"
+    reasons: List[str] = field(default_factory=list)
+
+
+@dataclass
+class PlannedBatch:
+    """Planned generation request data class"""
+    index: int
+    characters: int
+    estimated_tokens: int
+    request_bytes: int
+    # Bytes on the wire, after compression when sse.compress_requests applies
+    wire_bytes: int
+
+
+@dataclass
+class TranslationPlan:
+    """Dry-run generation plan data class"""
+    project_path: str
+    languages: List[str]
+    files_scanned: int
+    content_characters: int
+    files: List[PlannedFile] = field(default_factory=list)
+    batches: List[PlannedBatch] = field(default_factory=list)
+    
+    @property
+    def estimated_tokens(self) -> int:
+        """Estimated input tokens across all requests"""
+        return sum(batch.estimated_tokens for batch in self.batches)
+    
+    @property
+    def request_bytes(self) -> int:
+        """Request body bytes across all requests"""
+        return sum(batch.request_bytes for batch in self.batches)
+    
+    @property
+    def wire_bytes(self) -> int:
+        """Bytes sent on the wire across all requests"""
+        return sum(batch.wire_bytes for batch in self.batches)
+
+
 @dataclass
 class GenerationResult:
     """Generation result data class"""
@@ -47,6 +126,8 @@ class GenerationResult:
     failed_files: List[Dict[str, Any]]
     total_saved: int
     total_failed: int
+    # Saved files that already had the generated content and were not rewritten
+    total_unchanged: int = 0
 
 
 @dataclass
@@ -5,6 +5,13 @@ Contains integrations with external services (such as Tencent Cloud, SSE, etc.).
 """
 
 from .tencent_cloud import TencentCloudService
-from .sse_client import SSEClient
+
+
+def __getattr__(name):
+    # SSEClient pulls in requests and sseclient, load it on first access (PEP 562)
+    if name == "SSEClient":
+        from .sse_client import SSEClient
+        return SSEClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = ["TencentCloudService", "SSEClient"] 
\ No newline at end of file
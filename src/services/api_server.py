@@ -0,0 +1,334 @@
+"""
+Translation API server module
+
+Long-running HTTP/JSON server behind `duoreadme serve`. It keeps one
+Translator, with its pooled SSE connections and translation cache, alive
+across requests so each request costs only the upstream model latency.
+
+Endpoints:
+    POST /v1/translate/text     {"text": "...", "languages": ["en", "ja"], "stream": false}
+    POST /v1/translate/project  {"path": "...", "languages": ["en", "ja"], "stream": false, "write": false}
+    GET  /healthz
+
+With "stream": true the reply is NDJSON, one {"language", "content"} line per
+language as soon as it is complete, followed by a {"done": true} line.
+
+Project paths are resolved under the server root and may not lead out of it,
+symlinks included. Without a root the project endpoint is disabled, and
+"write" is refused unless the server allows writes.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..core.generator import Generator
+from ..core.parser import Parser
+from ..core.translator import Translator
+from ..models.types import TranslationResponse
+from ..utils.logger import debug, warning
+
+TEXT_PATH = "/v1/translate/text"
+PROJECT_PATH = "/v1/translate/project"
+HEALTH_PATH = "/healthz"
+
+# Largest accepted request body, in bytes
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+class APIError(Exception):
+    """Request error answered with an HTTP status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class TranslationServer:
+    """Threaded HTTP server answering translation requests with a shared Translator"""
+
+    def __init__(self, translator: Translator, host: str = "127.0.0.1", port: int = 0,
+                 concurrency: int = 4, queue_size: int = 16, root: Optional[str] = None,
+                 allow_write: bool = False):
+        """
+        Initialize translation server
+
+        Args:
+            translator: Translator shared by every request
+            host: Bind address
+            port: Bind port, 0 picks a free port
+            concurrency: Translations running at the same time
+            queue_size: Requests waiting for a free slot before new ones are answered with 503
+            root: Directory project paths are resolved under, None disables project translation
+            allow_write: Whether project requests may write README files into the project
+        """
+        self.translator = translator
+        self.root = Path(root).resolve() if root else None
+        self.allow_write = allow_write
+        self.parser = Parser()
+        self.concurrency = max(concurrency, 1)
+        self.queue_size = max(queue_size, 0)
+        self._slots = threading.BoundedSemaphore(self.concurrency)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._active = 0
+        self.completed = 0
+        self.rejected = 0
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "TranslationServer":
+        """Serve requests in a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve requests in the calling thread until interrupted"""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "TranslationServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def status(self) -> Dict[str, Any]:
+        """Get the load of the server"""
+        with self._lock:
+            return {
+                "status": "ok",
+                "active": self._active,
+                "queued": self._pending - self._active,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "concurrency": self.concurrency,
+                "queue_size": self.queue_size
+            }
+
+    def _admit(self):
+        """Reserve a place in the queue, raising APIError when it is full"""
+        with self._lock:
+            if self._pending >= self.concurrency + self.queue_size:
+                self.rejected += 1
+                raise APIError(503, "Server busy, try again later")
+            self._pending += 1
+
+    def _run(self, job: Callable[[], TranslationResponse]) -> TranslationResponse:
+        """Run a translation once a slot is free, after _admit"""
+        try:
+            with self._slots:
+                with self._lock:
+                    self._active += 1
+                try:
+                    return job()
+                finally:
+                    with self._lock:
+                        self._active -= 1
+                        self.completed += 1
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _prepare(self, path: str, body: Dict[str, Any],
+                 on_language: Optional[Callable[[str, str], None]]) -> Tuple[Callable[[], TranslationResponse], Optional[str]]:
+        """
+        Validate a request and build its translation job
+
+        Args:
+            path: Request path
+            body: Decoded request body
+            on_language: Streaming callback, None for a buffered reply
+
+        Returns:
+            Tuple of the job and the project directory to write files to, if any
+        """
+        languages = body.get("languages")
+        if isinstance(languages, str):
+            languages = [lang.strip() for lang in languages.split(",") if lang.strip()]
+        if languages is not None and not (isinstance(languages, list) and all(isinstance(l, str) for l in languages)):
+            raise APIError(400, "'languages' must be a list of language codes")
+
+        if on_language is not None and languages is not None:
+            # Same filter as the parser, so only requested languages are streamed
+            send = on_language
+
+            def on_language(lang: str, content: str):
+                if lang in languages:
+                    send(lang, content)
+
+        if path == TEXT_PATH:
+            text = body.get("text")
+            if not isinstance(text, str) or not text.strip():
+                raise APIError(400, "'text' is required")
+            return lambda: self.translator.translate_text_only(text, languages, on_language=on_language), None
+
+        project = self._resolve_project(body.get("path"))
+        write_dir = None
+        if body.get("write"):
+            if not self.allow_write:
+                raise APIError(403, "Writing files is disabled on this server")
+            # The generated files must not be redirected out of the root by a symlink either
+            for target in (project / "README.md", project / "docs"):
+                if not self._inside_root(target.resolve()):
+                    raise APIError(403, f"'{target.name}' leads outside the server root")
+            write_dir = str(project)
+        job = lambda: self.translator.translate_project(str(project), languages, on_language=on_language,
+                                                        root=str(self.root))
+        return job, write_dir
+
+    def _resolve_project(self, path: Any) -> Path:
+        """
+        Resolve a requested project path under the server root
+
+        Args:
+            path: Requested path, relative to the root or absolute
+
+        Returns:
+            Path: Real path of the project directory
+        """
+        if self.root is None:
+            raise APIError(403, "Project translation is disabled, no server root is configured")
+        if not isinstance(path, str) or not path:
+            raise APIError(400, "'path' must be a project directory under the server root")
+        # resolve() follows symlinks, so a link pointing out of the root is caught as well
+        project = (self.root / path).resolve()
+        if not self._inside_root(project):
+            raise APIError(403, "'path' is outside the server root")
+        if not project.is_dir():
+            raise APIError(400, "'path' must be an existing project directory")
+        return project
+
+    def _inside_root(self, path: Path) -> bool:
+        """Check whether a resolved path is the root or below it"""
+        return path == self.root or self.root in path.parents
+
+    def _finish(self, response: TranslationResponse, write_dir: Optional[str]) -> Dict[str, str]:
+        """Parse the reply, writing the README files when requested"""
+        parsed = self.parser.parse_multilingual_content(response.content, response.languages or None)
+        if write_dir is not None:
+            Generator.from_config(self.translator.config, base_dir=Path(write_dir)).generate_readme_files(
+                parsed, response.raw_response
+            )
+        return parsed.content
+
+    def _handler_class(self):
+        """Build the request handler bound to this server"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != HEALTH_PATH:
+                    self._send_json(404, {"error": "Not found"})
+                    return
+                self._send_json(200, server.status())
+
+            def do_POST(self):
+                start = time.perf_counter()
+                try:
+                    if self.path not in (TEXT_PATH, PROJECT_PATH):
+                        raise APIError(404, "Not found")
+                    body = self._read_body()
+                    stream = bool(body.get("stream"))
+                    emitted: Dict[str, str] = {}
+
+                    def on_language(lang: str, content: str):
+                        emitted[lang] = content
+                        self._send_line({"language": lang, "content": content})
+
+                    job, write_dir = server._prepare(self.path, body, on_language if stream else None)
+                    server._admit()
+                except APIError as e:
+                    self._send_json(e.status, {"error": str(e)})
+                    return
+
+                if stream:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+                    self.send_header("Cache-Control", "no-cache")
+                    self.end_headers()
+
+                try:
+                    response = server._run(job)
+                    languages = server._finish(response, write_dir) if response.success else {}
+                except Exception as e:
+                    warning(f"⚠ Translation request failed: {e}")
+                    response = TranslationResponse(success=False, error=str(e))
+                    languages = {}
+
+                result = {"success": response.success, "seconds": round(time.perf_counter() - start, 3)}
+                if not response.success:
+                    result["error"] = response.error
+                debug("%s answered in %.3fs, success: %s", self.path, result["seconds"], response.success)
+
+                try:
+                    if not stream:
+                        result["languages"] = languages
+                        self._send_json(200 if response.success else 502, result)
+                        return
+                    # Cached replies and languages completed only by the final event are not streamed
+                    for lang, content in languages.items():
+                        if lang not in emitted:
+                            self._send_line({"language": lang, "content": content})
+                    self._send_line({"done": True, **result})
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client went away before the reply was complete
+                    pass
+
+            def _read_body(self) -> Dict[str, Any]:
+                header = self.headers.get("Content-Length")
+                if header is None:
+                    raise APIError(411, "Content-Length header is required")
+                try:
+                    length = int(header)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    raise APIError(400, "Invalid Content-Length header")
+                if length > MAX_BODY_BYTES:
+                    raise APIError(413, "Request body too large")
+                try:
+                    body = json.loads(self.rfile.read(length).decode("utf-8") or "{}")
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    raise APIError(400, "Invalid JSON body")
+                if not isinstance(body, dict):
+                    raise APIError(400, "Request body must be a JSON object")
+                return body
+
+            def _send_line(self, data: Dict[str, Any]):
+                self.wfile.write((json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8"))
+                self.wfile.flush()
+
+            def _send_json(self, status: int, data: Dict[str, Any]):
+                payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                debug("%s - %s", self.address_string(), format % args)
+
+        return Handler
@@ -0,0 +1,234 @@
+"""
+Mock LKE SSE server module
+
+Local stand-in for the /v1/qbot/chat/sse endpoint, used by offline tests and
+benchmarks. Point the client at it with the sse.url configuration value.
+
+Usage:
+    python -m src.services.mock_server --port 8765 --latency 0.5 --throughput 2000
+"""
+
+import argparse
+import gzip
+import json
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+SSE_PATH = "/v1/qbot/chat/sse"
+
+DEFAULT_REPLY = "```json\n" + json.dumps({
+    "English readme": "# Demo Project\n\nA small demo project.\n\n## Usage\n\n```bash\npython main.py\n```",
+    "中文 readme": "# 演示项目\n\n一个小型演示项目。\n\n## 使用方法\n\n```bash\npython main.py\n```",
+    "日本語 readme": "# デモプロジェクト\n\n小さなデモプロジェクトです。\n\n## 使い方\n\n```bash\npython main.py\n```"
+}, ensure_ascii=False, indent=2) + "\n```"
+
+
+@dataclass
+class MockServerOptions:
+    """Behaviour of the mock server"""
+    reply: str = DEFAULT_REPLY
+    # Seconds to wait before the first event
+    latency: float = 0.0
+    # Reply characters per event
+    chunk_size: int = 40
+    # Reply characters per second, 0 for no limit
+    throughput: float = 0.0
+    # Send the full text so far in every event instead of the new part only
+    cumulative: bool = False
+    # Mark every event with is_delta, plain LKE events leave it out and clients rely on sse.reply_format
+    mark_delta: bool = False
+    # Faults, applied to the first fault_requests requests (every request when None)
+    error_status: int = 0
+    truncate_at: Optional[int] = None
+    stall_seconds: float = 0.0
+    fault_requests: Optional[int] = None
+
+
+class MockLKEServer:
+    """Threaded HTTP server streaming replies like the LKE SSE endpoint"""
+
+    def __init__(self, options: Optional[MockServerOptions] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize mock server
+
+        Args:
+            options: Server behaviour, defaults to an immediate well-formed reply
+            host: Bind address
+            port: Bind port, 0 picks a free port
+        """
+        self.options = options or MockServerOptions()
+        # Decoded request bodies, in arrival order
+        self.requests: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """SSE endpoint URL"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{SSE_PATH}"
+
+    def start(self) -> "MockLKEServer":
+        """Serve requests in a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockLKEServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def _record(self, body: Dict[str, Any]) -> int:
+        """Store a request body and return its 1-based index"""
+        with self._lock:
+            self.requests.append(body)
+            return len(self.requests)
+
+    def _handler_class(self):
+        """Build the request handler bound to this server"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path != SSE_PATH:
+                    self._send_error(404, "Not found")
+                    return
+
+                raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    raw = gzip.decompress(raw)
+                try:
+                    body = json.loads(raw.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    self._send_error(400, "Invalid JSON body")
+                    return
+
+                options = server.options
+                index = server._record(body)
+                faulty = options.fault_requests is None or index <= options.fault_requests
+                if faulty and options.error_status:
+                    self._send_error(options.error_status, "Injected error")
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                try:
+                    self._stream(body, options, faulty)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client closed the stream early
+                    pass
+
+            def _stream(self, body: Dict[str, Any], options: MockServerOptions, faulty: bool):
+                if options.latency:
+                    time.sleep(options.latency)
+                self._send_event(body.get("content", ""), is_from_self=True)
+
+                reply = options.reply
+                end = len(reply)
+                if faulty and options.truncate_at is not None:
+                    end = min(end, options.truncate_at)
+
+                chunk_size = max(options.chunk_size, 1)
+                for start in range(0, end, chunk_size):
+                    stop = min(start + chunk_size, end)
+                    is_delta = not options.cumulative if options.mark_delta else None
+                    if options.cumulative:
+                        self._send_event(reply[:stop], is_delta=is_delta)
+                    else:
+                        self._send_event(reply[start:stop], is_delta=is_delta)
+                    if options.throughput:
+                        time.sleep((stop - start) / options.throughput)
+
+                if faulty and (options.truncate_at is not None or options.stall_seconds):
+                    # Leave the stream without a final event
+                    time.sleep(options.stall_seconds)
+                    return
+                self._send_event(reply, is_final=True)
+
+            def _send_event(self, content: str, is_from_self: bool = False, is_final: bool = False,
+                            is_delta: Optional[bool] = None):
+                payload = {"payload": {"content": content, "is_from_self": is_from_self, "is_final": is_final}}
+                if is_delta is not None:
+                    payload["payload"]["is_delta"] = is_delta
+                data = json.dumps({"type": "reply", **payload}, ensure_ascii=False)
+                self.wfile.write(f"event: reply\ndata: {data}\n\n".encode("utf-8"))
+                self.wfile.flush()
+
+            def _send_error(self, status: int, message: str):
+                data = json.dumps({"error": {"code": status, "message": message}}).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                # Keep test and benchmark output clean
+                pass
+
+        return Handler
+
+
+def main():
+    """Run the mock server until interrupted"""
+    parser = argparse.ArgumentParser(description="Mock LKE SSE server")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8765, help="Bind port")
+    parser.add_argument("--reply-file", help="File holding the reply text, defaults to a small three-language reply")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before the first event")
+    parser.add_argument("--chunk-size", type=int, default=40, help="Reply characters per event")
+    parser.add_argument("--throughput", type=float, default=0.0, help="Reply characters per second, 0 for no limit")
+    parser.add_argument("--cumulative", action="store_true", help="Send the full text so far in every event")
+    parser.add_argument("--mark-delta", action="store_true", help="Mark every event with is_delta")
+    parser.add_argument("--error-status", type=int, default=0, help="Answer requests with this HTTP status")
+    parser.add_argument("--truncate-at", type=int, help="End the stream after this many reply characters")
+    parser.add_argument("--stall-seconds", type=float, default=0.0, help="Hang before closing a faulty stream")
+    parser.add_argument("--fault-requests", type=int, help="Apply faults to the first N requests only")
+    args = parser.parse_args()
+
+    options = MockServerOptions(
+        latency=args.latency,
+        chunk_size=args.chunk_size,
+        throughput=args.throughput,
+        cumulative=args.cumulative,
+        mark_delta=args.mark_delta,
+        error_status=args.error_status,
+        truncate_at=args.truncate_at,
+        stall_seconds=args.stall_seconds,
+        fault_requests=args.fault_requests
+    )
+    if args.reply_file:
+        with open(args.reply_file, encoding="utf-8") as f:
+            options.reply = f.read()
+
+    server = MockLKEServer(options, args.host, args.port)
+    print(f"Mock LKE SSE server listening on {server.url}")
+    print(f"Set sse.url to {server.url} to use it")
+    try:
+        server.start()
+        server._thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
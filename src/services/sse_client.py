@@ -4,14 +4,35 @@ SSE client module
 Provides Server-Sent Events client implementation.
 """
 
+import bisect
+import gzip
 import json
 import time
+import threading
+import uuid
 import sseclient
 import requests
-from typing import Dict, Any, Optional
+import urllib3
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from ..utils.config import Config
-from ..models.types import TranslationRequest
-from ..utils.logger import debug, info, warning, error
+from ..utils.json_extractor import StreamingJSONExtractor
+from ..models.types import TranslationRequest, RequestStats
+from ..utils.logger import debug, info, warning, error, is_debug_enabled
+from ..utils.profiler import profiler, span
+from .transport import create_transport
+
+DEFAULT_SSE_URL = "https://wss.lke.cloud.tencent.com/v1/qbot/chat/sse"
+
+# Upper bounds in seconds of the inter-event gap histogram buckets
+GAP_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class SSEStallError(Exception):
+    """No SSE event arrived within the idle timeout"""
+
+
+class StreamCancelled(Exception):
+    """Raised by an on_language callback to abandon the stream"""
 
 
 class SSEClient:
@@ -25,8 +46,61 @@ class SSEClient:
             config: Configuration object
         """
         self.config = config
+        self.url = config.get("sse.url", DEFAULT_SSE_URL)
         self.streaming_throttle = config.get("sse.streaming_throttle", 1)
         self.timeout = config.get("sse.timeout", 60)
+        self.connect_timeout = config.get("sse.connect_timeout", 10)
+        # Longest wait for the next chunk, kept short so a stalled stream is retried quickly
+        self.idle_timeout = config.get("sse.idle_timeout", 30)
+        # Optional limit on the whole request including the stream, None for no limit
+        self.max_request_seconds = config.get("sse.max_request_seconds")
+        self.stall_retries = config.get("sse.stall_retries", 1)
+        self.stop_when_complete = config.get("sse.stop_when_complete", False)
+        # Reply events without an is_delta marker carry the "delta" or the "cumulative" text
+        self.reply_format = config.get("sse.reply_format", "delta")
+        self.compress_requests = config.get("sse.compress_requests", False)
+        self.compress_threshold = config.get("sse.compress_threshold", 8192)
+        self.accept_compressed = config.get("sse.accept_compressed", True)
+        self.prewarm = config.get("sse.prewarm", False)
+        # Sends the requests, or records/replays sessions depending on sse.transport
+        self.transport = create_transport(config)
+        self._warm_up_thread: Optional[threading.Thread] = None
+        # Set once the server has refused a gzip body, later requests are sent uncompressed
+        self._gzip_refused = False
+        # Statistics are kept per thread so concurrent requests don't mix them up
+        self._local = threading.local()
+    
+    def warm_up(self) -> Optional[threading.Thread]:
+        """
+        Open the upstream connection in the background, ahead of the first request
+        
+        Called while the project is scanned, so DNS, TCP and TLS setup are off
+        the critical path. Does nothing unless sse.prewarm is enabled.
+        
+        Returns:
+            The warm-up thread, or None when no warm-up was started
+        """
+        if not self.prewarm or not hasattr(self.transport, "warm_up"):
+            return None
+        if self._warm_up_thread is not None and self._warm_up_thread.is_alive():
+            return self._warm_up_thread
+        self._warm_up_thread = threading.Thread(target=self._warm_up, name="sse-warm-up", daemon=True)
+        self._warm_up_thread.start()
+        return self._warm_up_thread
+    
+    def _warm_up(self):
+        """Warm-up thread body, failures only cost the warm connection"""
+        start = time.perf_counter()
+        try:
+            if self.transport.warm_up(self.url, self.connect_timeout):
+                debug("Upstream connection opened in %.3fs", time.perf_counter() - start)
+        except Exception as e:
+            debug("Upstream connection warm-up failed: %s", e)
+    
+    @property
+    def last_stats(self) -> Optional[RequestStats]:
+        """Statistics of the last request sent from the current thread"""
+        return getattr(self._local, "stats", None)
     
     def send_request(self, request: TranslationRequest) -> str:
         """
@@ -41,7 +115,35 @@ class SSEClient:
         Raises:
             Exception: Request failed
         """
-        # Build request data
+        req_data = self._request_fields(request)
+        
+        # Send SSE request, starting over if the stream stalls
+        for attempt in range(self.stall_retries + 1):
+            self._local.stats = RequestStats(stall_retries=attempt)
+            try:
+                return self._send_sse_request(req_data, request.on_language, request.languages)
+            except SSEStallError as e:
+                if attempt == self.stall_retries:
+                    raise Exception(f"SSE request failed: {e}")
+                warning(f"⚠ {e}, retrying ({attempt + 1}/{self.stall_retries})")
+    
+    def measure_request(self, request: TranslationRequest) -> Tuple[int, int]:
+        """
+        Measure the body of a request without sending it
+        
+        Args:
+            request: Generation request object
+            
+        Returns:
+            Tuple of the body size and the size sent on the wire, in bytes
+        """
+        body = self._build_request_body(self._build_request_data(self._request_fields(request), str(uuid.uuid4())))
+        wire_bytes = len(gzip.compress(body)) if self._should_compress(body) else len(body)
+        return len(body), wire_bytes
+    
+    @staticmethod
+    def _request_fields(request: TranslationRequest) -> Dict[str, Any]:
+        """Collect the fields of a request, additional parameters included"""
         req_data = {
             "content": request.content,
             "bot_app_key": request.bot_app_key,
@@ -51,57 +153,80 @@ class SSEClient:
         # Add additional parameters
         if request.additional_params:
             req_data.update(request.additional_params)
+        return req_data
+    
+    def _build_request_data(self, req_data: Dict[str, Any], session_id: str) -> Dict[str, Any]:
+        """Build the request payload sent to the SSE endpoint"""
+        request_data = {
+            "content": req_data["content"],
+            "bot_app_key": req_data["bot_app_key"],
+            "visitor_biz_id": req_data["visitor_biz_id"],
+            "session_id": session_id,
+            "streaming_throttle": self.streaming_throttle
+        }
         
-        # Send SSE request
-        response_text = self._send_sse_request(req_data)
-        
-        return response_text
+        # Add workflow variables (if they exist)
+        if "workflow_variables" in req_data:
+            request_data["custom_variables"] = req_data["workflow_variables"]
+        return request_data
     
-    def _send_sse_request(self, req_data: Dict[str, Any]) -> str:
+    def _send_sse_request(self, req_data: Dict[str, Any], on_language: Optional[Callable[[str, str], None]] = None,
+                          languages: Optional[List[str]] = None) -> str:
         """
         Specific implementation of sending SSE request
         
         Args:
             req_data: Request data
+            on_language: Optional callback receiving each language as soon as it completes in the stream
+            languages: Requested language codes, used to close the stream early when sse.stop_when_complete is set
             
         Returns:
             str: Response content
         """
-        url = "https://wss.lke.cloud.tencent.com/v1/qbot/chat/sse"
+        url = self.url
         
-        # Add session_id
-        import uuid
-        session_id = str(uuid.uuid4())
+        # Build request data with a new session_id
+        request_data = self._build_request_data(req_data, str(uuid.uuid4()))
         
-        # Build request data
-        request_data = {
-            "content": req_data["content"],
-            "bot_app_key": req_data["bot_app_key"],
-            "visitor_biz_id": req_data["visitor_biz_id"],
-            "session_id": session_id,
-            "streaming_throttle": self.streaming_throttle
+        headers = {
+            "Accept": "text/event-stream",
+            "Content-Type": "application/json; charset=utf-8",
+            # Compressed replies are decoded incrementally while the stream is read
+            "Accept-Encoding": "gzip, deflate" if self.accept_compressed else "identity"
         }
         
-        # Add workflow variables (if they exist)
-        if "workflow_variables" in req_data:
-            request_data["custom_variables"] = req_data["workflow_variables"]
-        
-        headers = {"Accept": "text/event-stream"}
-        
         try:
-            debug(f"Sending request to: {url}")
-            debug(f"Request data: {json.dumps(request_data, ensure_ascii=False, indent=2)}")
+            debug("Sending request to: %s", url)
+            if is_debug_enabled():
+                debug("Request data: %s", json.dumps(request_data, ensure_ascii=False, indent=2))
+            
+            body = self._build_request_body(request_data)
+            self._local.stats.request_bytes = len(body)
+            debug("Request body size: %d bytes", len(body))
+            
+            # Send request, gzip-compressed when the body is large enough
+            wire_body = body
+            if self._should_compress(body):
+                wire_body = gzip.compress(body)
+                headers["Content-Encoding"] = "gzip"
+                debug("Compressed request body to %d bytes", len(wire_body))
+            self._local.stats.request_wire_bytes = len(wire_body)
             
-            # Send request
-            response = requests.post(
-                url, 
-                data=json.dumps(request_data),
-                stream=True,
-                headers=headers,
-                timeout=self.timeout
-            )
+            stats = self._local.stats
+            request_start = time.perf_counter()
+            response = self._post(url, wire_body, headers)
             
-            debug(f"Response status code: {response.status_code}")
+            if response.status_code in (400, 415) and "Content-Encoding" in headers:
+                # Server does not accept compressed bodies, fall back to plain JSON
+                warning(f"Server refused gzip request body ({response.status_code}), resending uncompressed")
+                response.close()
+                self._gzip_refused = True
+                del headers["Content-Encoding"]
+                self._local.stats.request_wire_bytes = len(body)
+                response = self._post(url, body, headers)
+            stats.connect_seconds = time.perf_counter() - request_start
+            
+            debug("Response status code: %s", response.status_code)
             
             if response.status_code != 200:
                 error(f"Response content: {response.text}")
@@ -110,36 +235,67 @@ class SSEClient:
             # Process SSE response
             client = sseclient.SSEClient(response)
             response_text = ""
+            stop_languages = languages if self.stop_when_complete and languages else None
+            extractor = StreamingJSONExtractor() if on_language or stop_languages else None
             
             debug("Starting to process SSE response...")
+            # Checked once per request, so events cost no logging work unless DEBUG is on
+            debug_enabled = is_debug_enabled()
+            stream_start = time.perf_counter()
             
-            for event in client.events():
-                debug(f"Received event: {event.event}")
-                debug(f"Event data: {event.data}")
+            for event in self._timed_events(client, response, stats, request_start):
+                if debug_enabled:
+                    debug("Received event: %s", event.event)
+                    debug("Event data: %s", event.data)
                 
                 try:
                     data = json.loads(event.data)
                     if event.event == "reply":
                         if data["payload"]["is_from_self"]:
-                            debug(f'Sent content: {data["payload"]["content"]}')
+                            debug("Sent content: %s", data["payload"]["content"])
                         elif data["payload"]["is_final"]:
                             # Use INFO level for the last event
-                            info(f"Received event: {event.event}")
-                            debug(f"Event data: {event.data}")
+                            info("Received event: %s", event.event)
                             info("Polishing completed")
-                            response_text = data["payload"]["content"]
+                            final_content = data["payload"]["content"]
+                            if extractor is not None and final_content.startswith(response_text):
+                                self._emit_languages(extractor, final_content[len(response_text):], on_language)
+                            response_text = final_content
                             break
                         else:
                             content = data["payload"]["content"]
-                            response_text += content
+                            if self._is_cumulative(data["payload"]):
+                                delta = content
+                                if extractor is not None:
+                                    if content.startswith(response_text):
+                                        delta = content[len(response_text):]
+                                    else:
+                                        # Earlier text was revised, parse the reply again from the start
+                                        extractor = StreamingJSONExtractor()
+                                response_text = content
+                            else:
+                                delta = content
+                                response_text += delta
                             # Keep streaming output as is, don't log
                             
+                            if extractor is not None:
+                                self._emit_languages(extractor, delta, on_language)
+                                
+                                if stop_languages and extractor.has_languages(stop_languages):
+                                    info("All %d requested languages received, closing stream early", len(stop_languages))
+                                    response.close()
+                                    response_text = extractor.completed_json()
+                                    break
+                            
                             # Throttle control
                             if self.streaming_throttle > 0:
                                 time.sleep(self.streaming_throttle / 1000.0)
                     else:
-                        debug(f"Unhandled event type: {event.event}")
+                        debug("Unhandled event type: %s", event.event)
                 
+                except StreamCancelled:
+                    response.close()
+                    raise
                 except json.JSONDecodeError as e:
                     error(f"JSON parsing failed: {e}")
                     continue
@@ -147,18 +303,130 @@ class SSEClient:
                     error(f"Failed to process SSE event: {e}")
                     continue
             
-            debug(f"Final response text length: {len(response_text)}")
+            stream_end = time.perf_counter()
+            stats.total_seconds = stream_end - request_start
+            stats.stream_seconds = stream_end - stream_start
+            stats.chars_received = len(response_text)
+            stats.response_bytes = len(response_text.encode("utf-8"))
+            profiler.record("stream", stats.stream_seconds)
+            debug("Stream statistics: %s", stats)
+            
             # Set final JSON response to INFO level
-            info(f"Final response text length: {len(response_text)}")
+            info("Final response text length: %d", len(response_text))
             return response_text
             
-        except requests.exceptions.Timeout:
-            raise Exception("Request timeout")
+        except (SSEStallError, StreamCancelled):
+            raise
+        except requests.exceptions.ReadTimeout:
+            raise SSEStallError(f"No response within the {self.idle_timeout}s idle timeout")
+        except requests.exceptions.Timeout as e:
+            raise Exception(f"Request timeout: {e}")
         except requests.exceptions.RequestException as e:
             raise Exception(f"Network request failed: {e}")
         except Exception as e:
             raise Exception(f"SSE request failed: {e}")
     
+    def _post(self, url: str, body: bytes, headers: Dict[str, str]) -> requests.Response:
+        """Send the request body and open the response stream"""
+        with span("connect"):
+            warm_up = self._warm_up_thread
+            if warm_up is not None and warm_up.is_alive():
+                # Wait for the connection being opened instead of opening a second cold one
+                warm_up.join(self.connect_timeout)
+            # The read timeout bounds the wait for each chunk, a stream that keeps sending is not cut off
+            return self.transport.post(url, body, headers, timeout=(self.connect_timeout, self.idle_timeout))
+    
+    def _timed_events(self, client: sseclient.SSEClient, response: requests.Response,
+                      stats: RequestStats, request_start: float):
+        """
+        Yield SSE events, recording their arrival times
+        
+        Raises:
+            SSEStallError: No event arrived within the idle timeout
+            requests.exceptions.Timeout: The stream ran past sse.max_request_seconds
+        """
+        last_event = None
+        try:
+            for event in client.events():
+                now = time.perf_counter()
+                stats.events += 1
+                if last_event is None:
+                    stats.first_event_seconds = now - request_start
+                    profiler.record("first_event", stats.first_event_seconds)
+                else:
+                    self._observe_gap(stats, now - last_event)
+                last_event = now
+                
+                if self.max_request_seconds and now - request_start > self.max_request_seconds:
+                    response.close()
+                    raise requests.exceptions.Timeout(f"Stream exceeded {self.max_request_seconds}s")
+                yield event
+        except requests.exceptions.ConnectionError as e:
+            response.close()
+            # requests reports a read timeout while streaming as a connection error wrapping urllib3's error
+            if any(isinstance(arg, urllib3.exceptions.ReadTimeoutError) for arg in e.args):
+                raise SSEStallError(f"No event within the {self.idle_timeout}s idle timeout ({e})")
+            raise
+    
+    @staticmethod
+    def _observe_gap(stats: RequestStats, gap: float):
+        """Add an inter-event gap to the request histogram"""
+        index = bisect.bisect_left(GAP_BUCKETS, gap)
+        bucket = str(GAP_BUCKETS[index]) if index < len(GAP_BUCKETS) else "+Inf"
+        stats.gap_histogram[bucket] = stats.gap_histogram.get(bucket, 0) + 1
+        if gap > stats.max_gap_seconds:
+            stats.max_gap_seconds = gap
+    
+    def _should_compress(self, body: bytes) -> bool:
+        """Check whether the request body should be sent gzip-compressed"""
+        return self.compress_requests and not self._gzip_refused and len(body) >= self.compress_threshold
+    
+    @staticmethod
+    def _build_request_body(request_data: Dict[str, Any]) -> bytes:
+        """
+        Encode request data as compact UTF-8 JSON
+        
+        Non-ASCII text is sent as UTF-8 rather than \\uXXXX escapes, which
+        takes 3 bytes instead of 6 for each CJK character.
+        
+        Args:
+            request_data: Request data
+            
+        Returns:
+            bytes: Request body
+        """
+        return json.dumps(request_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    def _is_cumulative(self, payload: Dict[str, Any]) -> bool:
+        """
+        Check whether a reply event carries the full text so far instead of the new part
+        
+        The event's is_delta marker is used when present, otherwise sse.reply_format.
+        
+        Args:
+            payload: Event payload
+            
+        Returns:
+            bool: Whether the content replaces the text received so far
+        """
+        if "is_delta" in payload:
+            return not payload["is_delta"]
+        return self.reply_format == "cumulative"
+    
+    @staticmethod
+    def _emit_languages(extractor: StreamingJSONExtractor, delta: str, on_language: Optional[Callable[[str, str], None]]):
+        """Feed streamed text to the extractor and report completed languages"""
+        for lang_code, content in extractor.feed(delta).items():
+            debug("Language %s completed in stream (%d characters)", lang_code, len(content))
+            if on_language is None:
+                continue
+            try:
+                on_language(lang_code, content)
+            except StreamCancelled:
+                raise
+            except Exception as e:
+                error(f"Failed to handle streamed {lang_code} content: {e}")
+    
     def test_connection(self) -> bool:
         """
         Test if connection is normal
@@ -189,8 +457,19 @@ class SSEClient:
             Dict[str, Any]: Configuration information
         """
         return {
+            "url": self.url,
             "streaming_throttle": self.streaming_throttle,
             "timeout": self.timeout,
+            "connect_timeout": self.connect_timeout,
+            "idle_timeout": self.idle_timeout,
+            "max_request_seconds": self.max_request_seconds,
+            "stall_retries": self.stall_retries,
+            "transport": self.config.get("sse.transport", "http"),
+            "prewarm": self.prewarm,
+            "stop_when_complete": self.stop_when_complete,
+            "reply_format": self.reply_format,
+            "compress_requests": self.compress_requests,
+            "accept_compressed": self.accept_compressed,
             "bot_app_key": self.config.get("app.bot_app_key"),
             "visitor_biz_id": self.config.get("app.visitor_biz_id")
         } 
\ No newline at end of file
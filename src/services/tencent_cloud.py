@@ -6,11 +6,6 @@ Provides Tencent Cloud API integration services.
 
 import os
 from typing import Dict, Any, Optional
-from tencentcloud.common.common_client import CommonClient
-from tencentcloud.common import credential
-from tencentcloud.common.exception.tencent_cloud_sdk_exception import TencentCloudSDKException
-from tencentcloud.common.profile.client_profile import ClientProfile
-from tencentcloud.common.profile.http_profile import HttpProfile
 from ..utils.config import Config
 from ..utils.logger import debug, info, warning, error
 
@@ -45,6 +40,13 @@ class TencentCloudService:
         """
         debug(f"Starting to get Tencent Cloud token: profile={profile}, region={region}")
         
+        # The SDK is slow to import and only needed here
+        from tencentcloud.common.common_client import CommonClient
+        from tencentcloud.common import credential
+        from tencentcloud.common.exception.tencent_cloud_sdk_exception import TencentCloudSDKException
+        from tencentcloud.common.profile.client_profile import ClientProfile
+        from tencentcloud.common.profile.http_profile import HttpProfile
+        
         try:
             # Get secret information
             secret_id = secret.get("secret_id", "")
@@ -0,0 +1,237 @@
+"""
+SSE transport module
+
+Sends SSE requests over HTTP, or records sessions to disk and replays them
+without network access for reproducible end-to-end runs.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from ..utils.config import Config
+from ..utils.logger import debug, info
+
+TRANSPORT_MODES = ("http", "record", "replay")
+
+
+class HTTPTransport:
+    """Transport sending requests over the network"""
+
+    def __init__(self, pool_size: int = 0):
+        """
+        Initialize HTTP transport
+
+        Args:
+            pool_size: Connections kept open for reuse across requests, 0 opens a new connection per request
+        """
+        self.session = None
+        if pool_size > 0:
+            self.session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+    def post(self, url: str, body: bytes, headers: Dict[str, str], timeout: Any) -> requests.Response:
+        """
+        Send the request body and open the response stream
+
+        Args:
+            url: Endpoint URL
+            body: Request body
+            headers: Request headers
+            timeout: requests timeout value
+
+        Returns:
+            Streaming response
+        """
+        return (self.session or requests).post(
+            url,
+            data=body,
+            stream=True,
+            headers=headers,
+            timeout=timeout
+        )
+
+    def warm_up(self, url: str, timeout: Any) -> bool:
+        """
+        Open a pooled connection to the endpoint host
+        
+        Args:
+            url: Endpoint URL
+            timeout: requests timeout value
+            
+        Returns:
+            bool: Whether a connection was opened, False without a connection pool
+        """
+        if self.session is None:
+            return False
+        # Any status will do, the connection goes back to the pool once the response is closed
+        self.session.head(url, timeout=timeout, allow_redirects=False).close()
+        return True
+
+
+def _encode_chunk(chunk: bytes) -> str:
+    """Store raw bytes as JSON-safe text, chunks may split multi-byte characters"""
+    return chunk.decode("utf-8", "surrogateescape")
+
+
+def _decode_chunk(text: str) -> bytes:
+    """Restore the raw bytes of a recorded chunk"""
+    return text.encode("utf-8", "surrogateescape")
+
+
+class RecordingResponse:
+    """Response wrapper saving every chunk with its arrival time"""
+
+    def __init__(self, response: requests.Response, transport: "RecordingTransport", url: str, started: float):
+        self._response = response
+        self._transport = transport
+        self._url = url
+        self._started = started
+        self._chunks: List[Tuple[float, str]] = []
+        self._saved = False
+        self.status_code = response.status_code
+
+    @property
+    def text(self) -> str:
+        return self._response.text
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            for chunk in self._response:
+                self._chunks.append((round(time.perf_counter() - self._started, 6), _encode_chunk(chunk)))
+                yield chunk
+        finally:
+            self._save()
+
+    def close(self):
+        # Save first, error bodies are read from the open response
+        self._save()
+        self._response.close()
+
+    def _save(self):
+        """Append the session to the recording file once"""
+        if self._saved:
+            return
+        self._saved = True
+        session = {"url": self._url, "status_code": self.status_code, "chunks": self._chunks}
+        if self.status_code != 200:
+            session["text"] = self._response.text
+        self._transport.save(session)
+
+
+class RecordingTransport:
+    """Transport that sends requests over HTTP and records the responses"""
+
+    def __init__(self, path: str, inner: Optional[HTTPTransport] = None):
+        """
+        Initialize recording transport
+
+        Args:
+            path: JSON Lines file sessions are appended to
+            inner: Transport used to send the requests
+        """
+        self.path = Path(path)
+        self.inner = inner or HTTPTransport()
+        self._lock = threading.Lock()
+
+    def post(self, url: str, body: bytes, headers: Dict[str, str], timeout: Any) -> RecordingResponse:
+        started = time.perf_counter()
+        response = self.inner.post(url, body, headers, timeout)
+        recording = RecordingResponse(response, self, url, started)
+        if response.status_code != 200:
+            # Error responses are not streamed, save them right away
+            recording.close()
+        return recording
+
+    def warm_up(self, url: str, timeout: Any) -> bool:
+        return self.inner.warm_up(url, timeout)
+
+    def save(self, session: Dict[str, Any]):
+        """Append a recorded session"""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(session) + "\n")
+        debug("Recorded SSE session with %d chunks to %s", len(session["chunks"]), self.path)
+
+
+class ReplayResponse:
+    """Response yielding recorded chunks with their original timing"""
+
+    def __init__(self, session: Dict[str, Any], speed: float):
+        self._session = session
+        self._speed = speed
+        self.status_code = session["status_code"]
+        self.text = session.get("text", "")
+
+    def __iter__(self) -> Iterator[bytes]:
+        started = time.perf_counter()
+        for offset, chunk in self._session["chunks"]:
+            if self._speed > 0:
+                delay = offset / self._speed - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            yield _decode_chunk(chunk)
+
+    def close(self):
+        pass
+
+
+class ReplayTransport:
+    """Transport answering requests from recorded sessions, in order"""
+
+    def __init__(self, path: str, speed: float = 1.0):
+        """
+        Initialize replay transport
+
+        Args:
+            path: JSON Lines file written by RecordingTransport
+            speed: Replay speed factor, 0 replays without delays
+        """
+        self.path = Path(path)
+        self.speed = speed
+        with open(self.path, encoding="utf-8") as f:
+            self.sessions = [json.loads(line) for line in f if line.strip()]
+        if not self.sessions:
+            raise ValueError(f"No recorded sessions in {self.path}")
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def post(self, url: str, body: bytes, headers: Dict[str, str], timeout: Any) -> ReplayResponse:
+        # Sessions are replayed in recording order, starting over after the last one
+        with self._lock:
+            session = self.sessions[self._next % len(self.sessions)]
+            self._next += 1
+        return ReplayResponse(session, self.speed)
+
+
+def create_transport(config: Config):
+    """
+    Create the transport selected by sse.transport
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Transport with a post(url, body, headers, timeout) method
+    """
+    mode = config.get("sse.transport", "http")
+    if mode not in TRANSPORT_MODES:
+        raise ValueError(f"Unsupported SSE transport: {mode}")
+
+    path = config.get("sse.record_path", "sse_sessions.jsonl")
+    # A warmed-up connection is only reused through a pool
+    pool_size = config.get("sse.pool_size", 0) or (1 if config.get("sse.prewarm", False) else 0)
+    if mode == "record":
+        info(f"Recording SSE sessions to {path}")
+        return RecordingTransport(path, HTTPTransport(pool_size))
+    if mode == "replay":
+        info(f"Replaying SSE sessions from {path}")
+        return ReplayTransport(path, config.get("sse.replay_speed", 1.0))
+    return HTTPTransport(pool_size)
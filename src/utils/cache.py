@@ -0,0 +1,154 @@
+"""
+Translation cache module
+
+Stores successful translation replies keyed by a hash of the request, in
+memory and optionally on disk so repeated runs skip unchanged projects, and
+coalesces identical requests that are in flight at the same time.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .logger import debug, warning
+
+
+class TranslationCache:
+    """Thread-safe cache of translation replies"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize translation cache
+
+        Args:
+            cache_dir: Directory replies are also stored in, None keeps them in memory only
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(content: str, languages: List[str], params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key of a request
+
+        Args:
+            content: Request content
+            languages: Requested language codes
+            params: Additional request parameters, such as workflow variables
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        payload = json.dumps(
+            {"content": content, "languages": sorted(languages), "params": params or {}},
+            ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached reply, or None"""
+        with self._lock:
+            value = self._entries.get(key)
+        if value is None and self.cache_dir is not None:
+            path = self._path(key)
+            if path.exists():
+                try:
+                    value = path.read_text(encoding="utf-8")
+                except OSError as e:
+                    warning(f"⚠ Failed to read cache entry {path}: {e}")
+                if value is not None:
+                    with self._lock:
+                        self._entries[key] = value
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put(self, key: str, value: str):
+        """Store a reply"""
+        with self._lock:
+            self._entries[key] = value
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so concurrent readers never see a partial entry
+            temp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            temp_path.write_text(value, encoding="utf-8")
+            os.replace(temp_path, path)
+            debug("Cached translation reply %s", key[:12])
+        except OSError as e:
+            warning(f"⚠ Failed to write cache entry {path}: {e}")
+
+    def _path(self, key: str) -> Path:
+        """File holding an entry, sharded by the first two hex digits"""
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+
+class _Call:
+    """Call in flight, waited on by duplicate callers"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs concurrent calls with the same key once and shares the result"""
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Call func, or wait for the call already running under the same key
+
+        Exceptions raised by func are raised in every caller.
+
+        Args:
+            key: Call key, such as a TranslationCache key
+            func: Function to call
+
+        Returns:
+            Tuple of the result and whether it was shared from another caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # Later callers start a new call, or find the result in the cache
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Number of calls currently running"""
+        with self._lock:
+            return len(self._calls)
@@ -4,16 +4,35 @@ Configuration management module
 Responsible for managing project configuration information.
 """
 
+import copy
 import os
-import yaml
 import importlib.resources
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+
+def _safe_load(stream) -> Any:
+    """Parse YAML with the LibYAML based loader when it is available"""
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
+@lru_cache(maxsize=512)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted configuration key, cached since the same keys are looked up repeatedly"""
+    return tuple(key.split('.'))
 
 
 class Config:
     """Configuration management class"""
     
+    # Parsed built-in configuration, shared by all instances of the process
+    _builtin_cache: Optional[Dict[str, Any]] = None
+    _builtin_lock = threading.Lock()
+    
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize configuration manager
@@ -47,19 +66,25 @@ class Config:
     
     def _save_builtin_config(self):
         """Save current configuration to built-in config file"""
+        import yaml
         try:
             builtin_config_path = importlib.resources.files("src.data").joinpath("default_config.yaml")
             with builtin_config_path.open('w', encoding='utf-8') as f:
                 yaml.dump(self._config, f, default_flow_style=False, allow_unicode=True)
+            with Config._builtin_lock:
+                Config._builtin_cache = copy.deepcopy(self._config)
         except Exception as e:
             print(f"Warning: Unable to save built-in configuration: {e}")
     
     def _load_builtin_config(self):
-        """Load built-in configuration from package data"""
+        """Load built-in configuration from package data, parsed once per process"""
         try:
-            with importlib.resources.files("src.data").joinpath("default_config.yaml").open('r', encoding='utf-8') as f:
-                builtin_config = yaml.safe_load(f)
-                self._config = builtin_config
+            with Config._builtin_lock:
+                if Config._builtin_cache is None:
+                    with importlib.resources.files("src.data").joinpath("default_config.yaml").open('r', encoding='utf-8') as f:
+                        Config._builtin_cache = _safe_load(f)
+                # Each instance gets its own copy, so set() never leaks into other instances
+                self._config = copy.deepcopy(Config._builtin_cache)
         except Exception as e:
             # Fallback to hardcoded default configuration
             print(f"Warning: Unable to load built-in configuration: {e}")
@@ -96,7 +121,7 @@ class Config:
         """Load configuration from configuration file"""
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
-                file_config = yaml.safe_load(f)
+                file_config = _safe_load(f)
                 self._merge_config(file_config)
         except Exception as e:
             print(f"Warning: Unable to load configuration file {config_file}: {e}")
@@ -138,11 +163,10 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
         value = self._config
         
         try:
-            for k in keys:
+            for k in _split_key(key):
                 value = value[k]
             return value
         except (KeyError, TypeError):
@@ -156,7 +180,7 @@ class Config:
             key: Configuration key, supports dot-separated nested keys
             value: Configuration value
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         config = self._config
         
         # Navigate to parent level
@@ -198,6 +222,7 @@ class Config:
             config_file = self.config_file
         
         if config_file:
+            import yaml
             try:
                 with open(config_file, 'w', encoding='utf-8') as f:
                     yaml.dump(self._config, f, default_flow_style=False, allow_unicode=True)
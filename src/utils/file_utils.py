@@ -7,6 +7,7 @@ Provides file read/write and operation utility functions.
 import os
 import shutil
 import fnmatch
+import threading
 from pathlib import Path
 from typing import List, Optional, Union
 
@@ -39,27 +40,68 @@ class FileUtils:
         except UnicodeDecodeError as e:
             raise UnicodeDecodeError(f"File encoding error {file_path}: {e}")
     
-    def write_text_file(self, file_path: Union[str, Path], content: str, encoding: str = "utf-8"):
+    def write_text_file(self, file_path: Union[str, Path], content: str, encoding: str = "utf-8",
+                        skip_unchanged: bool = False) -> bool:
         """
         Write text file
         
+        The content is written and synced to a temporary file that then
+        replaces the target, so neither readers nor a crash leave a partially
+        written file. An existing target keeps its permissions.
+        
         Args:
             file_path: File path
             content: Content to write
             encoding: File encoding
+            skip_unchanged: Leave the file untouched, mtime included, when it already has this content
+            
+        Returns:
+            bool: Whether the file was written, False when skipped as unchanged
             
         Raises:
             OSError: Write failed
         """
         file_path = Path(file_path)
+        data = content.encode(encoding)
         
-        # Ensure directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if skip_unchanged and self._has_content(file_path, data):
+            return False
         
+        temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
         try:
-            file_path.write_text(content, encoding=encoding)
+            try:
+                self._write_synced(temp_path, data)
+            except FileNotFoundError:
+                # Directory is created only when missing, not on every write
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                self._write_synced(temp_path, data)
+            try:
+                shutil.copymode(file_path, temp_path)
+            except FileNotFoundError:
+                pass
+            os.replace(temp_path, file_path)
         except OSError as e:
+            temp_path.unlink(missing_ok=True)
             raise OSError(f"Failed to write file {file_path}: {e}")
+        return True
+    
+    @staticmethod
+    def _write_synced(file_path: Path, data: bytes):
+        """Write bytes and flush them to disk before the file is renamed into place"""
+        with open(file_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def _has_content(self, file_path: Path, data: bytes) -> bool:
+        """Check whether a file already holds exactly these bytes"""
+        try:
+            # Different sizes settle most changes without reading the file
+            if file_path.stat().st_size != len(data):
+                return False
+            return file_path.read_bytes() == data
+        except OSError:
+            return False
     
     def read_binary_file(self, file_path: Union[str, Path]) -> bytes:
         """
@@ -6,12 +6,23 @@ Used to extract JSON content from various response formats.
 
 import re
 import json
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# Decoder accepting raw newlines/tabs inside strings, as models often emit them
+_LENIENT_DECODER = json.JSONDecoder(strict=False)
+
+# Characters that matter outside strings / inside strings when scanning JSON
+_STRUCTURE_PATTERN = re.compile(r'[{}\[\]":,]')
+_STRING_PATTERN = re.compile(r'["\\]')
 
 
 class JSONExtractor:
     """JSON content extractor class"""
     
+    # An opening brace followed by a key, used to skip braces in surrounding prose
+    _OBJECT_START_PATTERN = re.compile(r'\{\s*"')
+    
     @staticmethod
     def extract_json_from_response(response_text: str) -> Optional[Dict[str, Any]]:
         """
@@ -43,15 +54,32 @@ class JSONExtractor:
             
         return None
     
+    @staticmethod
+    def extract_complete_json(response_text: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract JSON content only when it is complete, without repairing truncated text
+        
+        Args:
+            response_text: Response text
+            
+        Returns:
+            Optional[Dict[str, Any]]: Extracted JSON data, None if there is no complete object
+        """
+        if not response_text or not response_text.strip():
+            return None
+        return (JSONExtractor._extract_json_code_block(response_text)
+                or JSONExtractor._extract_complete_json_object(response_text))
+    
     @staticmethod
     def _extract_json_code_block(response_text: str) -> Optional[Dict[str, Any]]:
         """Extract JSON from code block"""
         try:
-            # Find ```json ... ``` format
-            json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
-            if json_match:
-                json_text = json_match.group(1).strip()
-                return json.loads(json_text)
+            # Find ```json ... ``` format, decoding from the fence so code blocks inside values don't end the match
+            fence = response_text.find('```json')
+            if fence != -1:
+                json_data = JSONExtractor._decode_object_at(response_text, fence + len('```json'))
+                if json_data is not None:
+                    return json_data
                 
             # Find ``` ... ``` format (might be JSON)
             code_match = re.search(r'```\s*(.*?)\s*```', response_text, re.DOTALL)
@@ -67,92 +95,138 @@ class JSONExtractor:
     @staticmethod
     def _extract_complete_json_object(response_text: str) -> Optional[Dict[str, Any]]:
         """Extract complete JSON object"""
-        try:
-            # Find first { and last }
-            start = response_text.find('{')
-            if start == -1:
-                return None
-                
-            # Find matching closing brace
-            brace_count = 0
-            end = -1
-            for i in range(start, len(response_text)):
-                if response_text[i] == '{':
-                    brace_count += 1
-                elif response_text[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end = i + 1
-                        break
-            
-            if end != -1:
-                json_text = response_text[start:end]
-                # Clean control characters
-                json_text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', json_text)
-                return json.loads(json_text)
-        except (json.JSONDecodeError, IndexError):
-            pass
+        # Try each candidate start in turn; raw_decode scans in C and skips braces inside strings
+        start = response_text.find('{')
+        while start != -1:
+            try:
+                json_data, _ = _LENIENT_DECODER.raw_decode(response_text, start)
+                if isinstance(json_data, dict):
+                    return json_data
+            except json.JSONDecodeError as e:
+                if JSONExtractor._is_truncation_error(e, response_text):
+                    # Object runs to the end of the text, leave it to the truncation fix
+                    return None
+            start = response_text.find('{', start + 1)
         return None
     
     @staticmethod
     def _extract_and_fix_incomplete_json(response_text: str) -> Optional[Dict[str, Any]]:
         """Extract and fix incomplete JSON"""
+        # Find object start: the first brace that opens a key
+        object_match = JSONExtractor._OBJECT_START_PATTERN.search(response_text)
+        if object_match is None:
+            return None
+        brace_start = object_match.start()
+        
         try:
-            # Find JSON start position
-            json_start = response_text.find('"English readme"')
-            if json_start == -1:
-                return None
-                
-            # Look backward for object start
-            brace_start = response_text.rfind('{', 0, json_start)
-            if brace_start == -1:
-                return None
-                
-            # Try to find matching closing brace
-            brace_count = 0
-            brace_end = -1
-            for i in range(brace_start, len(response_text)):
-                if response_text[i] == '{':
-                    brace_count += 1
-                elif response_text[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        brace_end = i + 1
-                        break
-            
-            if brace_end == -1:
-                # If no matching closing brace found, try to fix
-                return JSONExtractor._fix_truncated_json(response_text[brace_start:])
-            
-            json_text = response_text[brace_start:brace_end]
-            # Clean control characters
-            json_text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', json_text)
-            return json.loads(json_text)
-            
-        except (json.JSONDecodeError, IndexError):
+            json_data, _ = _LENIENT_DECODER.raw_decode(response_text, brace_start)
+            return json_data if isinstance(json_data, dict) else None
+        except json.JSONDecodeError:
+            # If the object is not complete, try to fix
+            return JSONExtractor._fix_truncated_json(response_text[brace_start:])
+    
+    @staticmethod
+    def _decode_object_at(text: str, pos: int) -> Optional[Dict[str, Any]]:
+        """Decode the JSON object starting at the first non-whitespace character after pos"""
+        start = pos
+        while start < len(text) and text[start].isspace():
+            start += 1
+        if not text.startswith('{', start):
+            return None
+        try:
+            json_data, _ = _LENIENT_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
             return None
+        return json_data if isinstance(json_data, dict) else None
+    
+    @staticmethod
+    def _is_truncation_error(err: json.JSONDecodeError, text: str) -> bool:
+        """Check whether a decoding error was caused by the text ending inside the value"""
+        return err.pos >= len(text.rstrip()) or err.msg.startswith("Unterminated string")
     
     @staticmethod
     def _fix_truncated_json(json_text: str) -> Optional[Dict[str, Any]]:
-        """Fix truncated JSON"""
+        """Fix truncated JSON, keeping every complete top-level member"""
+        repaired = JSONExtractor._repair_truncated_json(json_text)
+        if repaired is None:
+            return None
         try:
-            # Clean control characters
-            json_text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', json_text)
+            json_data = _LENIENT_DECODER.decode(repaired)
+        except json.JSONDecodeError:
+            return None
+        return json_data if isinstance(json_data, dict) else None
+    
+    @staticmethod
+    def _repair_truncated_json(json_text: str) -> Optional[str]:
+        """
+        Repair truncated JSON with a small state machine
+        
+        Tracks open strings, arrays and objects while scanning, remembers where
+        the last complete top-level member ended, then cuts there and closes the
+        root container. A member cut off mid-value is dropped rather than guessed.
+        
+        Args:
+            json_text: JSON text starting at the root object or array
             
-            # If JSON is truncated, try to add necessary closing parts
-            if not json_text.endswith('}'):
-                # Find last complete key-value pair
-                last_comma = json_text.rfind(',')
-                if last_comma != -1:
-                    # Remove last comma and add closing brace
-                    json_text = json_text[:last_comma] + '}'
-                else:
-                    # If no comma, directly add closing brace
-                    json_text += '}'
+        Returns:
+            Optional[str]: Repaired JSON text, None if no member was complete
+        """
+        stack = []
+        in_string = False
+        expect_key = False
+        cut = None
+        pos = 0
+        
+        while True:
+            if in_string:
+                match = _STRING_PATTERN.search(json_text, pos)
+                if match is None:
+                    break
+                if match.group() == '\\':
+                    pos = match.end() + 1
+                    continue
+                in_string = False
+                pos = match.end()
+                # A string closing at the top level is a complete member unless it is a key
+                if len(stack) == 1 and not expect_key:
+                    cut = pos
+                continue
+            
+            match = _STRUCTURE_PATTERN.search(json_text, pos)
+            if match is None:
+                break
+            char = match.group()
+            pos = match.end()
             
-            return json.loads(json_text)
-        except (json.JSONDecodeError, IndexError):
+            if not stack and char not in '{[':
+                continue
+            if char == '"':
+                in_string = True
+            elif char in '{[':
+                stack.append(char)
+                if len(stack) == 1:
+                    expect_key = char == '{'
+            elif char in '}]':
+                stack.pop()
+                if not stack:
+                    # Root closed, nothing was truncated
+                    return json_text[:pos]
+                if len(stack) == 1:
+                    cut = pos
+            elif len(stack) == 1:
+                if char == ':':
+                    expect_key = False
+                else:
+                    # Scalar members end at the comma
+                    if cut is None or cut < match.start():
+                        cut = match.start()
+                    expect_key = stack[0] == '{'
+        
+        if not stack or cut is None:
             return None
+        
+        closer = '}' if stack[0] == '{' else ']'
+        return json_text[:cut].rstrip().rstrip(',') + closer
     
     @staticmethod
     def extract_language_content(json_data: Dict[str, Any]) -> Dict[str, str]:
@@ -529,6 +603,157 @@ class JSONExtractor:
         return results
 
 
+class StreamingJSONExtractor:
+    """
+    Incremental JSON tokenizer for streamed responses
+    
+    Consumes the response text chunk by chunk and reports every top-level
+    string member of the first JSON object as soon as its value string closes,
+    so languages can be handled before the stream has finished.
+    """
+    
+    def __init__(self):
+        """Initialize streaming extractor"""
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._expect_key = True
+        self._pending_key = None
+        self.finished = False
+        self.members: Dict[str, Any] = {}
+        self.languages: Dict[str, str] = {}
+    
+    def feed(self, chunk: str) -> Dict[str, str]:
+        """
+        Feed the next piece of streamed text
+        
+        Args:
+            chunk: Newly received text
+            
+        Returns:
+            Dict[str, str]: Languages completed by this chunk (language code to content)
+        """
+        if self.finished or not chunk:
+            return {}
+        
+        self._buffer += chunk
+        completed = {}
+        
+        for key, value in self._scan():
+            self.members[key] = value
+            for lang_code, content in JSONExtractor.extract_language_content({key: value}).items():
+                if lang_code not in self.languages:
+                    self.languages[lang_code] = content
+                    completed[lang_code] = content
+        
+        self._compact()
+        return completed
+    
+    def has_languages(self, languages: List[str]) -> bool:
+        """
+        Check whether all given languages have been received
+        
+        Args:
+            languages: Language codes to check
+            
+        Returns:
+            bool: Whether every language is complete
+        """
+        return all(lang in self.languages for lang in languages)
+    
+    def completed_json(self) -> str:
+        """
+        Serialize the members received so far as a complete JSON object
+        
+        Returns:
+            str: JSON text of all completed top-level members
+        """
+        return json.dumps(self.members, ensure_ascii=False)
+    
+    def _scan(self):
+        """Advance through the buffer, yielding completed top-level string members"""
+        buffer = self._buffer
+        length = len(buffer)
+        
+        while self._pos < length and not self.finished:
+            if self._in_string:
+                match = _STRING_PATTERN.search(buffer, self._pos)
+                if match is None:
+                    self._pos = length
+                    return
+                if match.group() == '\\':
+                    if match.end() >= length:
+                        # Escape sequence split across chunks, wait for more data
+                        self._pos = match.start()
+                        return
+                    self._pos = match.end() + 1
+                    continue
+                
+                self._in_string = False
+                self._pos = match.end()
+                if self._depth == 1:
+                    raw = buffer[self._string_start:match.start()]
+                    if self._expect_key:
+                        self._pending_key = self._decode_string(raw)
+                    elif self._pending_key is not None:
+                        yield self._pending_key, self._decode_string(raw)
+                        self._pending_key = None
+                continue
+            
+            if self._depth == 0:
+                # Skip any text before the JSON object (explanations, code fences)
+                start = buffer.find('{', self._pos)
+                if start == -1:
+                    self._pos = length
+                    return
+                self._depth = 1
+                self._expect_key = True
+                self._pos = start + 1
+                continue
+            
+            match = _STRUCTURE_PATTERN.search(buffer, self._pos)
+            if match is None:
+                self._pos = length
+                return
+            char = match.group()
+            self._pos = match.end()
+            
+            if char == '"':
+                self._in_string = True
+                self._string_start = self._pos
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    self.finished = True
+            elif self._depth == 1:
+                if char == ':':
+                    self._expect_key = False
+                else:
+                    self._expect_key = True
+                    self._pending_key = None
+    
+    def _compact(self):
+        """Drop consumed text so the buffer does not grow with the stream"""
+        keep_from = self._string_start if self._in_string else self._pos
+        if keep_from > 0:
+            self._buffer = self._buffer[keep_from:]
+            self._pos -= keep_from
+            self._string_start = max(self._string_start - keep_from, 0)
+    
+    @staticmethod
+    def _decode_string(raw: str) -> str:
+        """Decode the body of a JSON string, tolerating raw control characters"""
+        try:
+            return _LENIENT_DECODER.decode('"' + raw + '"')
+        except json.JSONDecodeError:
+            return raw
+
+
+
 def extract_json_content(response_text: str) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
     """
     Extract JSON content from response text and parse language content
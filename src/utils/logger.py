@@ -4,9 +4,38 @@ Logging module
 Provides unified logging configuration and management.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full"""
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Records stay in-process, so formatting is left to the listener thread"""
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        """Put the record on the queue, counting it as dropped if the queue is full"""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BlockingStopListener(QueueListener):
+    """Queue listener whose stop waits for room in a full queue instead of failing"""
+    
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
 
 
 class Logger:
@@ -14,6 +43,16 @@ class Logger:
     
     _instance = None
     _logger = None
+    _queue_handler = None
+    _listener = None
+    
+    _LEVEL_MAP = {
+        'DEBUG': logging.DEBUG,
+        'INFO': logging.INFO,
+        'WARNING': logging.WARNING,
+        'ERROR': logging.ERROR,
+        'CRITICAL': logging.CRITICAL
+    }
     
     def __new__(cls):
         if cls._instance is None:
@@ -49,40 +88,91 @@ class Logger:
         # Add handler to logger
         self._logger.addHandler(console_handler)
     
-    def debug(self, message: str):
-        """Output DEBUG level log"""
-        self._logger.debug(message)
+    def debug(self, message: str, *args):
+        """Output DEBUG level log, %-style args are only formatted if the message is output"""
+        self._logger.debug(message, *args)
     
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """Output INFO level log"""
-        self._logger.info(message)
+        self._logger.info(message, *args)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """Output WARNING level log"""
-        self._logger.warning(message)
+        self._logger.warning(message, *args)
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """Output ERROR level log"""
-        self._logger.error(message)
+        self._logger.error(message, *args)
     
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """Output CRITICAL level log"""
-        self._logger.critical(message)
+        self._logger.critical(message, *args)
+    
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Check whether messages of the given level would be output
+        
+        Use it to guard log calls whose arguments are expensive to build.
+        
+        Args:
+            level: Level name, e.g. 'DEBUG'
+            
+        Returns:
+            bool: Whether the level is enabled
+        """
+        return self._logger.isEnabledFor(self._LEVEL_MAP.get(level.upper(), logging.INFO))
     
     def set_level(self, level: str):
         """Set log level"""
-        level_map = {
-            'DEBUG': logging.DEBUG,
-            'INFO': logging.INFO,
-            'WARNING': logging.WARNING,
-            'ERROR': logging.ERROR,
-            'CRITICAL': logging.CRITICAL
-        }
+        if level.upper() in self._LEVEL_MAP:
+            self._logger.setLevel(self._LEVEL_MAP[level.upper()])
+            for handler in self._output_handlers():
+                handler.setLevel(self._LEVEL_MAP[level.upper()])
+    
+    def _output_handlers(self) -> List[logging.Handler]:
+        """Handlers that write records, behind the queue when async logging is enabled"""
+        if self._listener is not None:
+            return list(self._listener.handlers)
+        return list(self._logger.handlers)
+    
+    def enable_async(self, queue_size: int = 10000):
+        """
+        Move formatting and output to a background thread
         
-        if level.upper() in level_map:
-            self._logger.setLevel(level_map[level.upper()])
-            for handler in self._logger.handlers:
-                handler.setLevel(level_map[level.upper()])
+        Records are put on a bounded queue; when it is full new records are
+        dropped so request threads never block on a slow stdout.
+        
+        Args:
+            queue_size: Maximum number of pending records
+        """
+        if self._listener is not None:
+            return
+        
+        self._queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+        self._listener = BlockingStopListener(
+            self._queue_handler.queue, *self._logger.handlers, respect_handler_level=True
+        )
+        self._logger.handlers = [self._queue_handler]
+        self._listener.start()
+        atexit.register(self.disable_async)
+    
+    def disable_async(self):
+        """Flush pending records and write directly to the output handlers again"""
+        if self._listener is None:
+            return
+        
+        self._listener.stop()
+        self._logger.handlers = list(self._listener.handlers)
+        dropped = self._queue_handler.dropped
+        self._listener = None
+        self._queue_handler = None
+        atexit.unregister(self.disable_async)
+        if dropped:
+            self._logger.warning("%d log records dropped, log queue was full", dropped)
+    
+    def is_async(self) -> bool:
+        """Check whether records are written by the background thread"""
+        return self._listener is not None
     
     def enable_debug(self):
         """Enable debug mode, output DEBUG level logs"""
@@ -106,29 +196,49 @@ def get_logger() -> Logger:
     return logger
 
 
-def debug(message: str):
-    """Output DEBUG level log"""
-    logger.debug(message)
+def debug(message: str, *args):
+    """Output DEBUG level log, %-style args are only formatted if the message is output"""
+    logger.debug(message, *args)
 
 
-def info(message: str):
+def info(message: str, *args):
     """Output INFO level log"""
-    logger.info(message)
+    logger.info(message, *args)
 
 
-def warning(message: str):
+def warning(message: str, *args):
     """Output WARNING level log"""
-    logger.warning(message)
+    logger.warning(message, *args)
 
 
-def error(message: str):
+def error(message: str, *args):
     """Output ERROR level log"""
-    logger.error(message)
+    logger.error(message, *args)
 
 
-def critical(message: str):
+def critical(message: str, *args):
     """Output CRITICAL level log"""
-    logger.critical(message)
+    logger.critical(message, *args)
+
+
+def is_enabled_for(level: str) -> bool:
+    """Check whether messages of the given level would be output"""
+    return logger.is_enabled_for(level)
+
+
+def is_debug_enabled() -> bool:
+    """Check whether DEBUG logs are output"""
+    return logger.is_enabled_for('DEBUG')
+
+
+def enable_async_logging(queue_size: int = 10000):
+    """Write logs from a background thread through a bounded queue"""
+    logger.enable_async(queue_size)
+
+
+def disable_async_logging():
+    """Flush queued logs and write synchronously again"""
+    logger.disable_async()
 
 
 def enable_debug():
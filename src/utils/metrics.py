@@ -0,0 +1,148 @@
+"""
+Metrics module
+
+Collects per-run counters and timings and writes them as JSON or a
+Prometheus textfile.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ..models.types import RequestStats
+
+# Metric name prefix used in the Prometheus textfile
+PROMETHEUS_PREFIX = "duoreadme_"
+
+METRIC_FORMATS = ("json", "prometheus")
+
+
+class Metrics:
+    """Run metrics collector, records nothing until enabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._summaries: Dict[str, List[float]] = {}
+        self._languages: Dict[str, bool] = {}
+
+    def enable(self):
+        """Start collecting metrics"""
+        self.enabled = True
+
+    def reset(self):
+        """Discard collected metrics"""
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+            self._languages.clear()
+
+    def inc(self, name: str, value: float = 1):
+        """Add to a counter"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float):
+        """Add an observation to a sum/count summary"""
+        if not self.enabled:
+            return
+        with self._lock:
+            summary = self._summaries.setdefault(name, [0.0, 0])
+            summary[0] += value
+            summary[1] += 1
+
+    def set_language_parsed(self, language: str, parsed: bool):
+        """Record whether a requested language was parsed from the reply"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._languages[language] = parsed
+
+    def record_request(self, stats: RequestStats):
+        """Add the transfer statistics of one SSE request"""
+        if not self.enabled or stats is None:
+            return
+        self.inc("requests")
+        self.inc("request_bytes", stats.request_bytes)
+        self.inc("request_wire_bytes", stats.request_wire_bytes)
+        self.inc("response_bytes", stats.response_bytes)
+        self.inc("chunks_received", stats.events)
+        self.inc("stall_retries", stats.stall_retries)
+        self.observe("connect_seconds", stats.connect_seconds)
+        if stats.events:
+            self.observe("first_event_seconds", stats.first_event_seconds)
+            self.observe("stream_seconds", stats.stream_seconds)
+            self.observe("request_seconds", stats.total_seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get collected metrics
+
+        Returns:
+            Dict[str, Any]: Counters, summaries as {"sum", "count"} and per-language parse results
+        """
+        with self._lock:
+            data: Dict[str, Any] = {"timestamp": int(time.time())}
+            data.update(self._counters)
+            for name, (total, count) in self._summaries.items():
+                data[name] = {"sum": total, "count": count}
+            data["language_parsed"] = dict(self._languages)
+        return data
+
+    def to_json(self) -> str:
+        """Format metrics as JSON"""
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """Format metrics in the Prometheus text exposition format"""
+        data = self.snapshot()
+        lines = []
+        for name, value in data.items():
+            metric = PROMETHEUS_PREFIX + name
+            if name == "language_parsed":
+                lines.append(f"# TYPE {metric} gauge")
+                for language, parsed in value.items():
+                    lines.append(f'{metric}{{language="{language}"}} {int(parsed)}')
+            elif isinstance(value, dict):
+                lines.append(f"# TYPE {metric} summary")
+                lines.append(f"{metric}_sum {value['sum']}")
+                lines.append(f"{metric}_count {value['count']}")
+            else:
+                lines.append(f"# TYPE {metric} gauge")
+                lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, fmt: str = "json"):
+        """
+        Write metrics to a file
+
+        The file is replaced atomically so collectors never read a partial file.
+
+        Args:
+            path: Output file path
+            fmt: "json" or "prometheus"
+        """
+        if fmt not in METRIC_FORMATS:
+            raise ValueError(f"Unsupported metrics format: {fmt}")
+        text = self.to_prometheus() if fmt == "prometheus" else self.to_json()
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_text(text, encoding="utf-8")
+        os.replace(temp_path, path)
+
+
+# Global metrics instance
+metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    """Get metrics instance"""
+    return metrics
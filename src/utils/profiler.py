@@ -0,0 +1,170 @@
+"""
+Profiling module
+
+Provides lightweight named spans for per-phase timing and optional cProfile dumps.
+"""
+
+import cProfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class _NullSpan:
+    """Span returned while profiling is disabled, does nothing"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Active span, records its duration under the enclosing span path"""
+
+    __slots__ = ("_profiler", "_name", "_path", "_start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        stack = self._profiler._stack()
+        stack.append(self._name)
+        self._path = "/".join(stack)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._profiler._add(self._path, time.perf_counter() - self._start)
+        self._profiler._stack().pop()
+        return False
+
+
+class Profiler:
+    """Collects per-phase timings, costs a single attribute check when disabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self._totals: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._cprofile: Optional[cProfile.Profile] = None
+
+    def enable(self, cprofile: bool = False):
+        """
+        Start collecting spans
+
+        Args:
+            cprofile: Also run cProfile so a pstats dump can be written
+        """
+        self.enabled = True
+        if cprofile and self._cprofile is None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def disable(self):
+        """Stop collecting spans and cProfile data"""
+        self.enabled = False
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+    def reset(self):
+        """Discard collected timings"""
+        with self._lock:
+            self._totals.clear()
+        self._cprofile = None
+
+    def span(self, name: str):
+        """
+        Time a phase, nested spans are reported under their parent
+
+        Args:
+            name: Phase name
+
+        Returns:
+            Context manager timing the enclosed block
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, seconds: float):
+        """Add a duration measured elsewhere, e.g. time to first byte, under the open spans"""
+        if not self.enabled:
+            return
+        self._add("/".join(self._stack() + [name]), seconds)
+
+    def _add(self, name: str, seconds: float):
+        """Accumulate a duration for a span path"""
+        with self._lock:
+            entry = self._totals.setdefault(name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def get_timings(self) -> Dict[str, Dict[str, float]]:
+        """Get call count and total seconds per phase, in first-seen order"""
+        with self._lock:
+            return {name: {"count": count, "seconds": total} for name, (count, total) in self._totals.items()}
+
+    def report(self) -> str:
+        """Format the per-phase breakdown as a table"""
+        timings = self.get_timings()
+        if not timings:
+            return "No profiling data collected"
+
+        lines = [f"{'Phase':<40} {'Calls':>6} {'Total (s)':>10}", "-" * 58]
+        # Children follow their parent, keeping the order phases first ran in
+        order = {name: index for index, name in enumerate(timings)}
+        for name in sorted(timings, key=lambda n: [order[p] for p in self._ancestors(n, timings)]):
+            depth = name.count("/")
+            label = "  " * depth + name.rsplit("/", 1)[-1]
+            lines.append(f"{label:<40} {int(timings[name]['count']):>6} {timings[name]['seconds']:>10.3f}")
+        return "\n".join(lines)
+
+    def dump_stats(self, path: str) -> bool:
+        """
+        Write the cProfile data in pstats format
+
+        Args:
+            path: Output file path
+
+        Returns:
+            bool: Whether cProfile data was available
+        """
+        if self._cprofile is None:
+            return False
+        self._cprofile.dump_stats(path)
+        return True
+
+    def _stack(self) -> List[str]:
+        """Span names open in the current thread"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @staticmethod
+    def _ancestors(name: str, timings: Dict[str, Dict[str, float]]) -> List[str]:
+        """Recorded paths from the root down to name"""
+        parts = name.split("/")
+        paths = ["/".join(parts[:i + 1]) for i in range(len(parts))]
+        return [path for path in paths if path in timings]
+
+
+# Global profiler instance
+profiler = Profiler()
+
+
+def get_profiler() -> Profiler:
+    """Get profiler instance"""
+    return profiler
+
+
+def span(name: str):
+    """Time a phase with the global profiler"""
+    return profiler.span(name)
@@ -0,0 +1,29 @@
+"""
+Shared test fixtures
+"""
+
+import threading
+import pytest
+from unittest.mock import patch
+from src.utils.cache import _Call
+
+
+@pytest.fixture
+def flight_waiters():
+    """Semaphore released each time a caller starts waiting on a SingleFlight call"""
+    waiting = threading.Semaphore(0)
+
+    class WatchedCall(_Call):
+        def __init__(self):
+            super().__init__()
+            wait = self.done.wait
+
+            def counted_wait(timeout=None):
+                # Released before waiting, the event stays set so a late wait still returns
+                waiting.release()
+                return wait(timeout)
+
+            self.done.wait = counted_wait
+
+    with patch('src.utils.cache._Call', WatchedCall):
+        yield waiting
@@ -0,0 +1,152 @@
+"""
+Translation API server test module
+
+Tests the serve endpoints against the mock LKE SSE server.
+"""
+
+import http.client
+import json
+import threading
+import pytest
+import requests
+from src.core.translator import Translator
+from src.services.api_server import TranslationServer, TEXT_PATH, PROJECT_PATH, HEALTH_PATH
+from src.services.mock_server import MockLKEServer, MockServerOptions
+from src.utils.config import Config
+
+
+class TestTranslationServer:
+    """Translation API server test class"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.options = MockServerOptions()
+        self.upstream = MockLKEServer(self.options).start()
+        config = Config()
+        config.set("sse.url", self.upstream.url)
+        config.set("sse.streaming_throttle", 0)
+        config.set("sse.stream_output", True)
+        self.translator = Translator(config)
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        self.upstream.stop()
+
+    def test_translate_text(self):
+        """Test a buffered text translation returns every language"""
+        with TranslationServer(self.translator) as server:
+            response = requests.post(server.url + TEXT_PATH, json={"text": "# Demo", "languages": ["zh-Hans", "ja"]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert set(data["languages"]) == {"zh-Hans", "ja"}
+        assert data["languages"]["ja"].startswith("# デモプロジェクト")
+
+    def test_stream_project(self, tmp_path):
+        """Test a streamed project translation sends one line per language, then done"""
+        (tmp_path / "README.md").write_text("# Demo\n", encoding="utf-8")
+
+        with TranslationServer(self.translator, root=str(tmp_path)) as server:
+            response = requests.post(server.url + PROJECT_PATH, stream=True,
+                                     json={"path": ".", "languages": "zh-Hans,ja", "stream": True})
+            lines = [json.loads(line) for line in response.iter_lines() if line]
+
+        assert response.headers["Content-Type"].startswith("application/x-ndjson")
+        assert sorted(line["language"] for line in lines[:-1]) == ["ja", "zh-Hans"]
+        assert lines[-1]["done"] is True
+        assert lines[-1]["success"] is True
+
+    def test_queue_full(self):
+        """Test requests beyond the concurrency and queue limits are rejected with 503"""
+        self.options.latency = 0.5
+        with TranslationServer(self.translator, concurrency=1, queue_size=0) as server:
+            first = threading.Thread(target=requests.post, args=(server.url + TEXT_PATH,),
+                                     kwargs={"json": {"text": "# Demo", "languages": ["ja"]}})
+            first.start()
+            while not self.upstream.requests:
+                threading.Event().wait(0.01)
+
+            response = requests.post(server.url + TEXT_PATH, json={"text": "# Demo", "languages": ["ja"]})
+            first.join()
+            status = requests.get(server.url + HEALTH_PATH).json()
+
+        assert response.status_code == 503
+        assert status["rejected"] == 1
+        assert status["completed"] == 1
+
+    @pytest.mark.parametrize("path,body", [
+        (TEXT_PATH, {}),
+        (TEXT_PATH, {"text": "# Demo", "languages": 3}),
+        (PROJECT_PATH, {"path": "does-not-exist"}),
+    ])
+    def test_invalid_request(self, path, body, tmp_path):
+        """Test invalid requests are answered with 400 without reaching upstream"""
+        with TranslationServer(self.translator, root=str(tmp_path)) as server:
+            response = requests.post(server.url + path, json=body)
+
+        assert response.status_code == 400
+        assert "error" in response.json()
+        assert not self.upstream.requests
+
+    @pytest.mark.parametrize("body,root", [
+        ({"path": "."}, False),
+        ({"path": "/"}, True),
+        ({"path": "../outside"}, True),
+        ({"path": "link"}, True),
+        ({"path": "project", "write": True}, True),
+    ])
+    def test_project_access_refused(self, body, root, tmp_path):
+        """Test paths outside the root, symlinks out of it and unallowed writes are answered with 403"""
+        (tmp_path / "outside").mkdir()
+        (tmp_path / "root" / "project").mkdir(parents=True)
+        (tmp_path / "root" / "link").symlink_to(tmp_path / "outside")
+
+        with TranslationServer(self.translator, root=str(tmp_path / "root") if root else None) as server:
+            response = requests.post(server.url + PROJECT_PATH, json=body)
+
+        assert response.status_code == 403
+        assert not self.upstream.requests
+
+    def test_write_allowed(self, tmp_path):
+        """Test README files are written into a project when the server allows it"""
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "README.md").write_text("# Demo\n", encoding="utf-8")
+
+        with TranslationServer(self.translator, root=str(tmp_path), allow_write=True) as server:
+            response = requests.post(server.url + PROJECT_PATH,
+                                     json={"path": "project", "languages": ["zh-Hans", "ja"], "write": True})
+
+        assert response.status_code == 200
+        assert (project / "docs" / "README.ja.md").exists()
+
+    def test_symlinked_file_outside_root_not_read(self, tmp_path):
+        """Test project files linking out of the root are not sent upstream"""
+        (tmp_path / "secret.txt").write_text("TOP SECRET\n", encoding="utf-8")
+        project = tmp_path / "root" / "project"
+        project.mkdir(parents=True)
+        (project / "README.md").symlink_to(tmp_path / "secret.txt")
+        (project / "main.py").write_text("print('main')\n", encoding="utf-8")
+
+        with TranslationServer(self.translator, root=str(tmp_path / "root")) as server:
+            response = requests.post(server.url + PROJECT_PATH, json={"path": "project", "languages": ["ja"]})
+
+        assert response.status_code == 200
+        sent = json.dumps(self.upstream.requests)
+        assert "main.py" in sent
+        assert "TOP SECRET" not in sent
+
+    @pytest.mark.parametrize("length,status", [(None, 411), ("abc", 400), ("-1", 400)])
+    def test_invalid_content_length(self, length, status):
+        """Test a missing or malformed Content-Length is answered instead of dropping the connection"""
+        with TranslationServer(self.translator) as server:
+            connection = http.client.HTTPConnection(*server._httpd.server_address[:2], timeout=5)
+            connection.putrequest("POST", TEXT_PATH)
+            if length is not None:
+                connection.putheader("Content-Length", length)
+            connection.endheaders()
+            response = connection.getresponse()
+            connection.close()
+
+        assert response.status == status
@@ -0,0 +1,79 @@
+"""
+Translation cache test module
+
+Tests cache keys, the in-memory and on-disk stores, and request coalescing.
+"""
+
+import threading
+import pytest
+from src.utils.cache import SingleFlight, TranslationCache
+
+
+class TestTranslationCache:
+    """Translation cache test class"""
+
+    def test_key_ignores_language_order(self):
+        """Test the key depends on the request, not on the language order"""
+        key = TranslationCache.make_key("# Title", ["en", "ja"])
+
+        assert key == TranslationCache.make_key("# Title", ["ja", "en"])
+        assert key != TranslationCache.make_key("# Title!", ["en", "ja"])
+        assert key != TranslationCache.make_key("# Title", ["en", "ja"], {"mode": "text"})
+
+    def test_memory_cache(self):
+        """Test entries are kept in memory without a cache directory"""
+        cache = TranslationCache()
+        key = TranslationCache.make_key("# Title", ["en"])
+
+        assert cache.get(key) is None
+        cache.put(key, "reply")
+
+        assert cache.get(key) == "reply"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_disk_cache_shared_between_instances(self, tmp_path):
+        """Test entries written to disk are found by a new cache"""
+        key = TranslationCache.make_key("# Title", ["en"])
+        TranslationCache(str(tmp_path)).put(key, "reply 中文")
+
+        assert (tmp_path / key[:2] / f"{key}.txt").exists()
+        assert TranslationCache(str(tmp_path)).get(key) == "reply 中文"
+        assert not list(tmp_path.rglob("*.tmp"))
+
+
+class TestSingleFlight:
+    """Single-flight test class"""
+
+    def test_error_raised_in_every_caller(self, flight_waiters):
+        """Test a failed call raises its error in the waiting callers too"""
+        flights = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def fail():
+            release.wait(5)
+            raise RuntimeError("upstream failed")
+
+        def call():
+            try:
+                flights.do("key", fail)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        assert flight_waiters.acquire(timeout=5) and flight_waiters.acquire(timeout=5)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert errors == ["upstream failed"] * 3
+        assert flights.in_flight() == 0
+
+    def test_sequential_calls_not_shared(self):
+        """Test a call made after the previous one finished runs again"""
+        flights = SingleFlight()
+
+        assert flights.do("key", lambda: 1) == (1, False)
+        assert flights.do("key", lambda: 2) == (2, False)
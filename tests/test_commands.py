@@ -0,0 +1,174 @@
+"""
+CLI commands test module
+
+Tests the workflow helpers used by the gen and trans commands, and the
+batch command.
+"""
+
+import json
+import pytest
+from unittest.mock import Mock, patch
+from click.testing import CliRunner
+from src.cli.commands import _complete_missing_languages, _load_manifest, batch_command, gen_command
+from src.core.parser import Parser
+from src.core.translator import Translator
+from src.models.types import ParsedReadme, TranslationResponse
+from src.services.mock_server import MockLKEServer
+from src.utils.config import Config
+
+
+class TestCompleteMissingLanguages:
+    """Missing language completion test class"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.parser = Parser()
+        self.parsed_readme = ParsedReadme(content={"en": "# Title"}, languages=["en"], total_count=1)
+
+    def test_requests_only_missing_languages(self):
+        """Test follow-up requests ask only for languages not yet parsed"""
+        translate = Mock(return_value=TranslationResponse(
+            success=True,
+            content=json.dumps({"Japanese readme": "# タイトル", "Korean readme": "# 제목"}, ensure_ascii=False)
+        ))
+
+        result = _complete_missing_languages(translate, self.parser, self.parsed_readme, ["en", "ja", "ko"])
+
+        translate.assert_called_once_with(["ja", "ko"])
+        assert result.content == {"en": "# Title", "ja": "# タイトル", "ko": "# 제목"}
+        assert result.total_count == 3
+
+    def test_retry_budget(self):
+        """Test the number of follow-up requests is bounded"""
+        translate = Mock(return_value=TranslationResponse(success=False, error="Network error"))
+
+        result = _complete_missing_languages(translate, self.parser, self.parsed_readme, ["en", "ja"], max_rounds=2)
+
+        assert translate.call_count == 2
+        assert list(result.content) == ["en"]
+
+    def test_nothing_missing(self):
+        """Test no request is made when every language was parsed"""
+        translate = Mock()
+
+        _complete_missing_languages(translate, self.parser, self.parsed_readme, ["en"])
+
+        translate.assert_not_called()
+
+    def test_batched_default_languages_completed(self):
+        """Test a batched run without explicit languages still completes missing default languages"""
+        config = Config()
+        config.set("translation.default_languages", ["en", "ja"])
+        translator = Translator(config)
+        requests = translator._build_batch_requests("=== a.py ===\nprint(1)\n=== b.py ===\nprint(2)", None, 20)
+        assert len(requests) == 2
+
+        reply = json.dumps({"English readme": "# Title"})
+        with patch.object(translator.sse_client, "send_request", return_value=reply):
+            response = translator._execute_requests(requests)
+        translate = Mock(return_value=TranslationResponse(success=True, content=json.dumps({"Japanese readme": "# タイトル"})))
+
+        parsed = self.parser.parse_multilingual_content(response.content, None)
+        result = _complete_missing_languages(translate, self.parser, parsed, response.languages)
+
+        assert response.languages == ["en", "ja"]
+        translate.assert_called_once_with(["ja"])
+        assert result.content["ja"] == "# タイトル"
+
+
+class TestGenCommand:
+    """Gen command test class"""
+
+    def test_plan_output(self, tmp_path):
+        """Test --plan prints only the plan"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("app:\n  bot_app_key: key\n", encoding="utf-8")
+        (tmp_path / "README.md").write_text("# Demo\n", encoding="utf-8")
+
+        result = CliRunner().invoke(gen_command, [
+            "--project-path", str(tmp_path), "--languages", "en,ja", "--config", str(config_file), "--plan"
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert result.output.startswith(f"Generation plan for {tmp_path}")
+        assert "Target languages" not in result.output
+        assert "=" * 50 not in result.output
+
+
+class TestBatchCommand:
+    """Batch command test class"""
+
+    @pytest.fixture
+    def server(self):
+        with MockLKEServer() as server:
+            yield server
+
+    def _write_config(self, tmp_path, server):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            f"sse:\n  url: {server.url}\n  streaming_throttle: 0\n", encoding="utf-8"
+        )
+        return str(config_file)
+
+    def _write_project(self, tmp_path, name):
+        project = tmp_path / name
+        project.mkdir()
+        (project / "README.md").write_text(f"# {name}\n\nProject {name}.\n", encoding="utf-8")
+        return project
+
+    def test_load_manifest(self, tmp_path):
+        """Test manifest defaults and relative paths"""
+        manifest = tmp_path / "projects.yaml"
+        manifest.write_text(
+            "languages: en,ja\nprojects:\n  - one\n  - path: two\n    languages: [zh-Hans]\n    mode: gen\n",
+            encoding="utf-8"
+        )
+
+        projects = _load_manifest(str(manifest))
+
+        assert projects == [
+            {"path": str((tmp_path / "one").resolve()), "languages": ["en", "ja"], "mode": "trans"},
+            {"path": str((tmp_path / "two").resolve()), "languages": ["zh-Hans"], "mode": "gen"}
+        ]
+
+    def test_batch_uses_cache(self, tmp_path, server):
+        """Test every project is translated and an unchanged rerun sends no requests"""
+        config_file = self._write_config(tmp_path, server)
+        projects = [self._write_project(tmp_path, name) for name in ("alpha", "beta")]
+        manifest = tmp_path / "projects.yaml"
+        # English is left out, its output replaces the source README and so the cache key
+        manifest.write_text("languages: zh-Hans,ja\nprojects:\n  - alpha\n  - beta\n", encoding="utf-8")
+        args = [str(manifest), "--config", config_file, "--jobs", "2", "--cache-dir", str(tmp_path / "cache")]
+
+        result = CliRunner().invoke(batch_command, args)
+
+        assert result.exit_code == 0, result.output
+        assert len(server.requests) == 2
+        for project in projects:
+            assert (project / "docs" / "README.zh.md").exists()
+            assert (project / "docs" / "README.ja.md").exists()
+
+        result = CliRunner().invoke(batch_command, args)
+
+        assert result.exit_code == 0, result.output
+        assert len(server.requests) == 2
+        assert "2 cached replies" in result.output
+
+        result = CliRunner().invoke(batch_command, args + ["--no-cache"])
+
+        assert result.exit_code == 0, result.output
+        assert len(server.requests) == 4
+        assert "cached replies" not in result.output
+
+    def test_batch_reports_failed_project(self, tmp_path, server):
+        """Test a missing project fails the run without stopping the others"""
+        config_file = self._write_config(tmp_path, server)
+        self._write_project(tmp_path, "alpha")
+        manifest = tmp_path / "projects.yaml"
+        manifest.write_text("languages: en,zh-Hans,ja\nprojects:\n  - alpha\n  - missing\n", encoding="utf-8")
+
+        result = CliRunner().invoke(batch_command, [str(manifest), "--config", config_file])
+
+        assert result.exit_code == 1
+        assert "1 succeeded, 1 failed" in result.output
+        assert (tmp_path / "alpha" / "docs" / "README.ja.md").exists()
@@ -0,0 +1,37 @@
+"""
+Configuration test module
+
+Tests the memoized built-in configuration and key lookups.
+"""
+
+import pytest
+from unittest.mock import patch
+from src.utils.config import Config
+
+
+class TestConfig:
+    """Configuration test class"""
+
+    def test_builtin_config_parsed_once(self):
+        """Test the built-in configuration is parsed once and copied per instance"""
+        Config()
+        with patch('src.utils.config._safe_load') as mock_load:
+            first = Config()
+            second = Config()
+        mock_load.assert_not_called()
+
+        first.set("sse.timeout", 5)
+        assert second.get("sse.timeout") != 5
+        assert Config().get("sse.timeout") != 5
+
+    def test_file_config_overrides_builtin(self, tmp_path):
+        """Test a configuration file is merged over the built-in values"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("sse:\n  timeout: 7\n  url: http://127.0.0.1:8765/v1/qbot/chat/sse\n", encoding="utf-8")
+
+        config = Config(str(config_file))
+
+        assert config.get("sse.timeout") == 7
+        assert config.get("sse.url").startswith("http://127.0.0.1")
+        assert config.get("sse.missing.key", "default") == "default"
+        assert Config().get("sse.timeout") != 7
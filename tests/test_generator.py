@@ -4,11 +4,14 @@ Generator test module
 Tests generator functionality, especially the logic for placing English README in root directory.
 """
 
+import os
+import stat
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 from src.core.generator import Generator
 from src.models.types import ParsedReadme, GenerationResult
+from src.utils.config import Config
 
 
 class TestGenerator:
@@ -23,6 +26,13 @@ class TestGenerator:
         assert self.generator.output_dir == Path("docs")
         assert self.generator.file_utils is not None
     
+    def test_from_config(self):
+        """Test write workers come from translation.write_workers and default to sequential writes"""
+        config = Config()
+        assert Generator.from_config(config).write_workers == 1
+        config.set("translation.write_workers", 8)
+        assert Generator.from_config(config, base_dir=Path("project")).write_workers == 8
+    
     def test_get_filename_for_language_english(self):
         """Test English filename generation"""
         # Test English should return README.md
@@ -236,4 +246,100 @@ class TestGenerator:
         assert parser._map_json_key_to_language("Russian readme") == "ru"
         
         # Test unknown key
-        assert parser._map_json_key_to_language("Unknown readme") is None 
\ No newline at end of file
+        assert parser._map_json_key_to_language("Unknown readme") is None 
+
+class TestGeneratorWrites:
+    """Generator file write test class"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.parsed_readme = ParsedReadme(
+            content={"en": "# Project", "zh": "# 项目", "ja": "# プロジェクト"},
+            languages=["en", "zh", "ja"],
+            total_count=3
+        )
+
+    def test_unchanged_files_not_rewritten(self, tmp_path):
+        """Test a second run with the same content leaves the files and their mtimes alone"""
+        Generator(base_dir=tmp_path).generate_readme_files(self.parsed_readme)
+        zh_file = tmp_path / "docs" / "README.zh.md"
+        mtime = zh_file.stat().st_mtime_ns
+
+        self.parsed_readme.content["ja"] = "# プロジェクト v2"
+        generator = Generator(base_dir=tmp_path)
+        result = generator.generate_readme_files(self.parsed_readme)
+
+        assert result.total_saved == 3
+        assert result.total_unchanged == 2
+        assert zh_file.stat().st_mtime_ns == mtime
+        assert (tmp_path / "docs" / "README.ja.md").read_text(encoding="utf-8") == "# プロジェクト v2"
+        assert "2 files unchanged" in generator.generate_summary(result)
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_streamed_files_not_reported_unchanged(self, tmp_path):
+        """Test files written from the stream count as written, not unchanged"""
+        generator = Generator(base_dir=tmp_path)
+        assert generator.write_streamed_language("zh", "# 项目") is True
+
+        result = generator.generate_readme_files(self.parsed_readme)
+
+        assert result.total_unchanged == 0
+
+    def test_rewrite_synced_and_keeps_permissions(self, tmp_path):
+        """Test a rewritten file is synced before the rename and keeps its mode"""
+        target = tmp_path / "README.md"
+        target.write_text("# Previous", encoding="utf-8")
+        target.chmod(0o640)
+
+        with patch('src.utils.file_utils.os.fsync', wraps=os.fsync) as fsync:
+            Generator(base_dir=tmp_path).generate_readme_files(
+                ParsedReadme(content={"en": "# New"}, languages=["en"], total_count=1)
+            )
+
+        fsync.assert_called_once()
+        assert stat.S_IMODE(target.stat().st_mode) == 0o640
+        assert "# New" in target.read_text(encoding="utf-8")
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        """Test a write failing midway leaves the previous file intact"""
+        target = tmp_path / "README.md"
+        target.write_text("# Previous", encoding="utf-8")
+        generator = Generator(base_dir=tmp_path)
+
+        with patch('src.utils.file_utils.os.replace', side_effect=OSError("disk full")):
+            result = generator.generate_readme_files(ParsedReadme(content={"en": "# New"}, languages=["en"], total_count=1))
+
+        assert result.total_failed == 1
+        assert target.read_text(encoding="utf-8") == "# Previous"
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_parallel_writes_keep_language_order(self, tmp_path):
+        """Test the writer pool reports files in language order and writes every one"""
+        languages = ["en", "zh", "ja", "ko", "fr", "de", "es", "it"]
+        parsed_readme = ParsedReadme(
+            content={lang: f"# {lang}" for lang in languages},
+            languages=languages,
+            total_count=len(languages)
+        )
+
+        result = Generator(base_dir=tmp_path, write_workers=4).generate_readme_files(parsed_readme)
+
+        assert [f["language"] for f in result.saved_files] == languages
+        assert (tmp_path / "docs" / "README.fr.md").read_text(encoding="utf-8") == "# fr"
+        assert len(list((tmp_path / "docs").glob("README.*.md"))) == len(languages) - 1
+
+    def test_parallel_write_failure_recorded(self, tmp_path):
+        """Test one failing write in the pool is reported without losing the others"""
+        write = Generator().file_utils.write_text_file
+
+        def fail_ja(file_path, content, **kwargs):
+            if Path(file_path).name == "README.ja.md":
+                raise OSError("disk full")
+            return write(file_path, content, **kwargs)
+
+        generator = Generator(base_dir=tmp_path, write_workers=4)
+        with patch.object(generator.file_utils, "write_text_file", side_effect=fail_ja):
+            result = generator.generate_readme_files(self.parsed_readme)
+
+        assert [f["language"] for f in result.saved_files] == ["en", "zh"]
+        assert result.failed_files == [{"language": "ja", "filename": "README.ja.md", "error": "disk full"}]
@@ -0,0 +1,120 @@
+"""
+JSON extractor test module
+
+Tests JSON extraction from complete and streamed responses.
+"""
+
+import json
+import pytest
+from src.utils.json_extractor import JSONExtractor, StreamingJSONExtractor, extract_json_content
+
+
+class TestJSONExtractor:
+    """JSON extractor test class"""
+
+    def test_braces_inside_strings(self):
+        """Test unbalanced braces inside Markdown code samples do not break extraction"""
+        data = {
+            "English readme": "# Demo\n\n```js\nif (ok) {\n  run();\n```\n",
+            "Japanese readme": "# デモ\n\n```js\n}}\n```"
+        }
+        response = "Result:\n```json\n" + json.dumps(data, ensure_ascii=False) + "\n```"
+
+        json_data, languages = extract_json_content(response)
+
+        assert json_data == data
+        assert languages == {"en": data["English readme"].strip(), "ja": data["Japanese readme"].strip()}
+
+    def test_skips_non_json_candidates(self):
+        """Test braces in text before the object are skipped"""
+        response = 'Use {placeholders} like {name}. {"English readme": "# Title"} done'
+
+        assert JSONExtractor.extract_json_from_response(response) == {"English readme": "# Title"}
+
+    def test_raw_newlines_preserved(self):
+        """Test raw newlines inside values are kept rather than stripped"""
+        response = '{"English readme": "# Title\n\nBody"}'
+
+        assert JSONExtractor.extract_json_from_response(response) == {"English readme": "# Title\n\nBody"}
+
+    @pytest.mark.parametrize("cut_marker", [
+        '# タイ',            # inside a string value
+        '"Korean',          # inside a key
+        '": "# 제목"',       # between key and value
+        '"meta": [1, {"a"', # inside a nested array
+    ])
+    def test_truncated_response_keeps_complete_members(self, cut_marker):
+        """Test truncation anywhere keeps every fully received language"""
+        full = ('```json\n{"English readme": "# Title\\n\\n```js\\nif (x) {\\n```", "count": 3, '
+                '"中文 readme": "# 标题 \\"引号\\"", "Japanese readme": "# タイトル", '
+                '"Korean readme": "# 제목", "meta": [1, {"a": 2}], "French readme": "# Titre"}\n```')
+        truncated = full[:full.index(cut_marker) + len(cut_marker) - 2]
+
+        json_data, languages = extract_json_content(truncated)
+
+        assert json_data is not None
+        assert languages["en"] == "# Title\n\n```js\nif (x) {\n```"
+        assert languages["zh-Hans"] == '# 标题 "引号"'
+        assert "fr" not in languages
+
+    def test_repair_closes_at_last_complete_member(self):
+        """Test the repaired text ends after the last complete member"""
+        repaired = JSONExtractor._repair_truncated_json('{"a": "1", "b": [1, 2], "c": 4, "d": "tru')
+
+        assert json.loads(repaired) == {"a": "1", "b": [1, 2], "c": 4}
+
+    def test_repair_without_complete_member(self):
+        """Test nothing is returned when no member was complete"""
+        assert JSONExtractor._repair_truncated_json('{"English readme": "# Ti') is None
+
+
+class TestStreamingJSONExtractor:
+    """Streaming JSON extractor test class"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.response = 'Here is the result:\n```json\n' + json.dumps({
+            "English readme": "# Project\n\nUse `{\"key\": [1, 2]}` in config.",
+            "中文 readme": "# 项目\n\n说明 \\ 路径",
+            "Japanese readme": "# プロジェクト"
+        }, ensure_ascii=False, indent=2) + '\n```\nLet me know if you need changes.'
+
+    def test_languages_emitted_as_they_close(self):
+        """Test each language is reported once its string closes"""
+        extractor = StreamingJSONExtractor()
+
+        english_end = self.response.index('"中文 readme"')
+        first = extractor.feed(self.response[:english_end])
+        assert list(first) == ["en"]
+        assert first["en"] == "# Project\n\nUse `{\"key\": [1, 2]}` in config."
+
+        rest = extractor.feed(self.response[english_end:])
+        assert set(rest) == {"zh-Hans", "ja"}
+        assert rest["zh-Hans"] == "# 项目\n\n说明 \\ 路径"
+        assert extractor.finished
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+    def test_chunk_boundaries(self, chunk_size):
+        """Test results do not depend on where chunks are split, including inside escapes"""
+        extractor = StreamingJSONExtractor()
+        for i in range(0, len(self.response), chunk_size):
+            extractor.feed(self.response[i:i + chunk_size])
+
+        _, expected = extract_json_content(self.response)
+        assert extractor.languages == expected
+        assert extractor.has_languages(["en", "zh-Hans", "ja"])
+
+    def test_raw_newlines_and_nested_values(self):
+        """Test raw control characters in strings and non-string members"""
+        extractor = StreamingJSONExtractor()
+        completed = extractor.feed('{"meta": {"English readme": "ignored"}, "count": 2,\n"English readme": "line 1\nline 2"}')
+
+        assert completed == {"en": "line 1\nline 2"}
+        assert "meta" not in extractor.members
+
+    def test_ignores_text_after_object(self):
+        """Test a repeated payload after the first object is ignored"""
+        extractor = StreamingJSONExtractor()
+        extractor.feed('{"English readme": "first"}')
+        assert extractor.feed(' {"English readme": "second", "Japanese readme": "x"}') == {}
+        assert extractor.languages == {"en": "first"}
@@ -0,0 +1,89 @@
+"""
+Logger test module
+
+Tests lazy argument formatting and level checks.
+"""
+
+import logging
+import threading
+import time
+import pytest
+from src.utils.logger import get_logger, debug, info, is_debug_enabled
+
+
+class Payload:
+    """Object recording whether it was formatted"""
+
+    def __init__(self):
+        self.formatted = False
+
+    def __str__(self):
+        self.formatted = True
+        return "payload"
+
+
+class BlockingHandler(logging.Handler):
+    """Handler that blocks until released, like a stalled stdout"""
+
+    def __init__(self):
+        super().__init__()
+        self.unblock = threading.Event()
+        self.messages = []
+
+    def emit(self, record):
+        self.unblock.wait()
+        self.messages.append(record.getMessage())
+
+
+class TestLogger:
+    """Logger test class"""
+
+    def teardown_method(self):
+        """Restore the default level"""
+        get_logger().disable_async()
+        get_logger().set_level("INFO")
+
+    def test_lazy_args_not_formatted_when_disabled(self):
+        """Test %-style arguments are not formatted below the active level"""
+        payload = Payload()
+
+        debug("Event data: %s", payload)
+
+        assert not is_debug_enabled()
+        assert not payload.formatted
+
+    def test_lazy_args_formatted_when_enabled(self, caplog):
+        """Test %-style arguments are formatted once the level is enabled"""
+        get_logger().enable_debug()
+        payload = Payload()
+
+        debug("Event data: %s", payload)
+
+        assert is_debug_enabled()
+        assert payload.formatted
+        assert "Event data: payload" in caplog.text
+
+    def test_async_logging_never_blocks(self):
+        """Test a stalled handler neither blocks callers nor loses queued records"""
+        log = get_logger()
+        handler = BlockingHandler()
+        log.get_logger().addHandler(handler)
+        try:
+            log.enable_async(queue_size=5)
+            assert log.is_async()
+
+            start = time.perf_counter()
+            for i in range(50):
+                info("message %d", i)
+            assert time.perf_counter() - start < 1
+
+            dropped = log._queue_handler.dropped
+            handler.unblock.set()
+            log.disable_async()
+        finally:
+            log.get_logger().removeHandler(handler)
+
+        assert dropped > 0
+        assert handler.messages[0] == "message 0"
+        assert len(handler.messages) == 50 - dropped + 1
+        assert handler.messages[-1] == f"{dropped} log records dropped, log queue was full"
@@ -0,0 +1,59 @@
+"""
+Metrics test module
+
+Tests metric collection and the JSON and Prometheus outputs.
+"""
+
+import json
+import pytest
+from src.models.types import RequestStats
+from src.utils.metrics import Metrics
+
+
+class TestMetrics:
+    """Metrics test class"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.metrics = Metrics()
+        self.metrics.enable()
+        self.metrics.inc("files_scanned", 12)
+        self.metrics.record_request(RequestStats(
+            request_bytes=2048, request_wire_bytes=2048, response_bytes=9000,
+            events=150, first_event_seconds=0.5, stream_seconds=4.0
+        ))
+        self.metrics.set_language_parsed("en", True)
+        self.metrics.set_language_parsed("ja", False)
+
+    def test_disabled_records_nothing(self):
+        """Test nothing is collected until enabled"""
+        metrics = Metrics()
+        metrics.inc("retries")
+        metrics.record_request(RequestStats(events=1))
+
+        assert list(metrics.snapshot()) == ["timestamp", "language_parsed"]
+
+    def test_json_output(self, tmp_path):
+        """Test the JSON file carries counters, summaries and per-language results"""
+        output = tmp_path / "metrics" / "run.json"
+        self.metrics.write(str(output), "json")
+
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["files_scanned"] == 12
+        assert data["chunks_received"] == 150
+        assert data["first_event_seconds"] == {"sum": 0.5, "count": 1}
+        assert data["language_parsed"] == {"en": True, "ja": False}
+
+    def test_prometheus_output(self):
+        """Test the Prometheus textfile format"""
+        lines = self.metrics.to_prometheus().splitlines()
+
+        assert "duoreadme_request_bytes 2048" in lines
+        assert "# TYPE duoreadme_stream_seconds summary" in lines
+        assert "duoreadme_stream_seconds_count 1" in lines
+        assert 'duoreadme_language_parsed{language="ja"} 0' in lines
+
+    def test_unsupported_format(self, tmp_path):
+        """Test an unknown format is rejected"""
+        with pytest.raises(ValueError):
+            self.metrics.write(str(tmp_path / "run.txt"), "xml")
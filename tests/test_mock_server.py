@@ -0,0 +1,105 @@
+"""
+Mock server test module
+
+Tests SSEClient against the local mock LKE SSE server.
+"""
+
+import json
+import pytest
+from src.services.mock_server import MockLKEServer, MockServerOptions, DEFAULT_REPLY
+from src.services.sse_client import SSEClient
+from src.utils.config import Config
+from src.utils.json_extractor import extract_json_content
+from src.models.types import TranslationRequest
+
+
+class TestMockServer:
+    """Mock server test class"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.options = MockServerOptions(chunk_size=16)
+        self.server = MockLKEServer(self.options).start()
+        self.config = Config()
+        self.config.set("sse.url", self.server.url)
+        self.config.set("sse.streaming_throttle", 0)
+        self.request = TranslationRequest(
+            content="Translate",
+            languages=["en", "zh-Hans", "ja"],
+            bot_app_key="key",
+            visitor_biz_id="visitor"
+        )
+
+    def teardown_method(self):
+        """Stop the server"""
+        self.server.stop()
+
+    def test_streamed_reply(self):
+        """Test a full reply is streamed and languages are reported as they complete"""
+        received = []
+        self.request.on_language = lambda lang, content: received.append(lang)
+        client = SSEClient(self.config)
+
+        response_text = client.send_request(self.request)
+
+        assert response_text == DEFAULT_REPLY
+        assert received == ["en", "zh-Hans", "ja"]
+        assert self.server.requests[0]["content"] == "Translate"
+        assert client.last_stats.events > len(DEFAULT_REPLY) // 16
+
+    @pytest.mark.parametrize("cumulative,mark_delta", [(False, False), (True, False), (True, True)])
+    def test_truncated_reply(self, cumulative, mark_delta):
+        """Test a stream cut off without a final event keeps the complete languages"""
+        self.options.cumulative = cumulative
+        self.options.mark_delta = mark_delta
+        if cumulative and not mark_delta:
+            self.config.set("sse.reply_format", "cumulative")
+        self.options.truncate_at = DEFAULT_REPLY.index('"日本語 readme"')
+
+        response_text = SSEClient(self.config).send_request(self.request)
+
+        _, languages = extract_json_content(response_text)
+        assert set(languages) == {"en", "zh-Hans"}
+
+    def test_injected_error(self):
+        """Test an HTTP error status is raised"""
+        self.options.error_status = 503
+
+        with pytest.raises(Exception, match="503"):
+            SSEClient(self.config).send_request(self.request)
+
+    def test_gzip_request(self):
+        """Test compressed request bodies are decoded by the server"""
+        self.config.set("sse.compress_requests", True)
+        self.config.set("sse.compress_threshold", 0)
+
+        SSEClient(self.config).send_request(self.request)
+
+        assert self.server.requests[0]["bot_app_key"] == "key"
+
+    def test_stall_retried(self):
+        """Test a stalled stream is abandoned after the idle timeout and retried"""
+        self.options.stall_seconds = 2
+        self.options.fault_requests = 1
+        self.config.set("sse.idle_timeout", 0.3)
+        client = SSEClient(self.config)
+
+        assert client.send_request(self.request) == DEFAULT_REPLY
+        assert len(self.server.requests) == 2
+        assert client.last_stats.stall_retries == 1
+
+    def test_long_stream_not_cut_off(self):
+        """Test a stream that keeps sending runs past sse.timeout"""
+        self.options.throughput = 600
+        self.config.set("sse.timeout", 0.2)
+
+        assert SSEClient(self.config).send_request(self.request) == DEFAULT_REPLY
+
+    def test_max_request_seconds(self):
+        """Test the optional total limit ends a long stream without a retry"""
+        self.options.throughput = 600
+        self.config.set("sse.max_request_seconds", 0.2)
+
+        with pytest.raises(Exception, match="Request timeout"):
+            SSEClient(self.config).send_request(self.request)
+        assert len(self.server.requests) == 1
@@ -0,0 +1,105 @@
+"""
+Pipeline test module
+
+Tests the bounded-queue stage runner and the generation pipeline.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from src.core.generator import Generator
+from src.core.pipeline import Pipeline, Stage, TranslationPipeline
+from src.core.translator import Translator
+from src.models.types import TranslationResponse
+from src.utils.config import Config
+
+
+class TestPipeline:
+    """Stage runner test class"""
+
+    def test_items_flow_through_stages(self):
+        """Test every item passes every stage and finish steps run after the last item"""
+        collected = []
+
+        pipeline = Pipeline([
+            Stage("double", lambda item, emit: emit(item * 2), workers=3),
+            Stage("collect", lambda item, emit: collected.append(item), finish=lambda emit: emit(sorted(collected))),
+        ], queue_size=2)
+
+        assert pipeline.run(list(range(20))) == [[i * 2 for i in range(20)]]
+
+    def test_stages_overlap(self):
+        """Test a stage receives items while the previous stage is still busy"""
+        second_started = threading.Event()
+        overlapped = []
+
+        def first(item, emit):
+            emit(item)
+            if item == 0:
+                # Only set while this call runs if the next stage does not wait for the whole stage
+                overlapped.append(second_started.wait(5))
+
+        def second(item, emit):
+            second_started.set()
+            emit(item)
+
+        results = Pipeline([Stage("first", first), Stage("second", second)]).run(list(range(6)))
+
+        assert results == list(range(6))
+        assert overlapped == [True]
+
+    def test_error_stops_pipeline(self):
+        """Test an error in a stage is raised by run without hanging"""
+        def fail(item, emit):
+            if item == 3:
+                raise ValueError("bad item")
+            emit(item)
+
+        with pytest.raises(ValueError, match="bad item"):
+            Pipeline([Stage("fail", fail), Stage("pass", lambda item, emit: emit(item))], queue_size=1).run(range(100))
+
+
+class TestTranslationPipeline:
+    """Generation pipeline test class"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.translator = Translator(Config())
+
+    def _write_project(self, tmp_path):
+        (tmp_path / "README.md").write_text("# Demo\n\nA demo project.\n", encoding="utf-8")
+        (tmp_path / "main.py").write_text("print('main')\n", encoding="utf-8")
+        (tmp_path / "config.py").write_text("DEBUG = False\n", encoding="utf-8")
+
+    def test_same_request_as_sequential(self, tmp_path):
+        """Test the pipeline sends the same request as translate_project"""
+        self._write_project(tmp_path)
+        sent = []
+
+        def execute(request):
+            sent.append(request.content)
+            return TranslationResponse(success=True, content="{}", languages=request.languages)
+
+        with patch.object(Translator, '_execute_translation', side_effect=execute):
+            self.translator.translate_project(str(tmp_path), ["en", "ja"])
+            response = TranslationPipeline(self.translator, Generator(base_dir=tmp_path)).run(str(tmp_path), ["en", "ja"])
+
+        assert response.success is True
+        assert len(sent) == 2
+        assert sent[0] == sent[1]
+
+    def test_streamed_languages_written(self, tmp_path):
+        """Test languages streamed by the request are written by the write stage"""
+        self._write_project(tmp_path)
+        generator = Generator(base_dir=tmp_path)
+        generator.write_streamed_language = Mock()
+
+        def execute(request):
+            request.on_language("ja", "# デモ")
+            request.on_language("ko", "# 데모")
+            return TranslationResponse(success=True, content="{}", languages=request.languages)
+
+        with patch.object(Translator, '_execute_translation', side_effect=execute):
+            TranslationPipeline(self.translator, generator).run(str(tmp_path), ["en", "ja"])
+
+        generator.write_streamed_language.assert_called_once_with("ja", "# デモ")
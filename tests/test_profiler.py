@@ -0,0 +1,55 @@
+"""
+Profiler test module
+
+Tests span timing and the phase report.
+"""
+
+import pytest
+from src.utils.profiler import Profiler
+
+
+class TestProfiler:
+    """Profiler test class"""
+
+    def test_disabled_records_nothing(self):
+        """Test spans are no-ops while profiling is disabled"""
+        profiler = Profiler()
+
+        with profiler.span("request"):
+            profiler.record("first_event", 1.0)
+
+        assert profiler.get_timings() == {}
+
+    def test_nested_spans(self):
+        """Test nested spans and recorded durations are reported under their parent"""
+        profiler = Profiler()
+        profiler.enable()
+
+        with profiler.span("request"):
+            with profiler.span("connect"):
+                pass
+            profiler.record("first_event", 0.25)
+        with profiler.span("write"):
+            pass
+        with profiler.span("write"):
+            pass
+
+        timings = profiler.get_timings()
+        assert list(timings) == ["request/connect", "request/first_event", "request", "write"]
+        assert timings["request/first_event"]["seconds"] == 0.25
+        assert timings["write"]["count"] == 2
+
+        lines = profiler.report().splitlines()[2:]
+        assert [line.split()[0] for line in lines] == ["request", "connect", "first_event", "write"]
+
+    def test_cprofile_dump(self, tmp_path):
+        """Test a pstats file is written when cProfile is enabled"""
+        import pstats
+        profiler = Profiler()
+        profiler.enable(cprofile=True)
+        sum(range(1000))
+        profiler.disable()
+
+        output = tmp_path / "run.pstats"
+        assert profiler.dump_stats(str(output))
+        assert pstats.Stats(str(output)).total_calls > 0
@@ -0,0 +1,302 @@
+"""
+SSE client test module
+
+Tests SSE stream processing.
+"""
+
+import gzip
+import json
+import threading
+import pytest
+import requests
+import urllib3
+from unittest.mock import Mock, patch
+from src.services.sse_client import SSEClient, StreamCancelled
+from src.utils.config import Config
+from src.models.types import TranslationRequest
+
+
+def build_sse_response(contents, final_content=None, is_delta=None):
+    """Build a fake streaming HTTP response carrying reply events"""
+    events = []
+    for content in contents:
+        payload = {"payload": {"content": content, "is_from_self": False, "is_final": False}}
+        if is_delta is not None:
+            payload["payload"]["is_delta"] = is_delta
+        events.append(f"event: reply\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8"))
+    if final_content is not None:
+        payload = {"payload": {"content": final_content, "is_from_self": False, "is_final": True}}
+        events.append(f"event: reply\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8"))
+
+    response = Mock()
+    response.status_code = 200
+    response.__iter__ = Mock(side_effect=lambda: iter(events))
+    return response
+
+
+def build_stalled_response(contents, error=None):
+    """Build a fake response that stops sending after the given reply events"""
+    response = build_sse_response(contents)
+    events = list(response.__iter__())
+    if error is None:
+        error = requests.exceptions.ConnectionError(urllib3.exceptions.ReadTimeoutError(None, None, "Read timed out."))
+
+    def stall():
+        yield from events
+        raise error
+
+    response.__iter__ = Mock(side_effect=stall)
+    return response
+
+
+class TestSSEClient:
+    """SSE client test class"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.config = Config()
+        self.config.set("sse.streaming_throttle", 0)
+        self.request = TranslationRequest(
+            content="Translate",
+            languages=["en", "ja"],
+            bot_app_key="key",
+            visitor_biz_id="visitor"
+        )
+        self.chunks = [
+            '```json\n{"English readme": "# Title',
+            '\\n\\nBody", "Japanese readme": "# タイトル"',
+            ', "Korean readme": "# 제목"}\n```',
+            '\nSome trailing commentary'
+        ]
+
+    @patch('src.services.sse_client.requests.post')
+    def test_streamed_languages_reported(self, mock_post):
+        """Test languages are reported while the stream is read"""
+        mock_post.return_value = build_sse_response(self.chunks, "".join(self.chunks))
+        received = []
+        self.request.on_language = lambda lang, content: received.append((lang, content))
+
+        response_text = SSEClient(self.config).send_request(self.request)
+
+        assert response_text == "".join(self.chunks)
+        assert received == [("en", "# Title\n\nBody"), ("ja", "# タイトル"), ("ko", "# 제목")]
+
+    @patch('src.services.sse_client.requests.post')
+    def test_cumulative_reply_content(self, mock_post):
+        """Test replies carrying the full text so far are not duplicated"""
+        self.config.set("sse.reply_format", "cumulative")
+        cumulative = ["".join(self.chunks[:i + 1]) for i in range(len(self.chunks))]
+        mock_post.return_value = build_sse_response(cumulative)
+
+        response_text = SSEClient(self.config).send_request(self.request)
+
+        assert response_text == "".join(self.chunks)
+
+    @patch('src.services.sse_client.requests.post')
+    def test_delta_marker_overrides_reply_format(self, mock_post):
+        """Test a delta repeating the text received so far is appended, not treated as cumulative"""
+        self.config.set("sse.reply_format", "cumulative")
+        mock_post.return_value = build_sse_response(["ab", "ab", "c"], is_delta=True)
+
+        response_text = SSEClient(self.config).send_request(self.request)
+
+        assert response_text == "ababc"
+
+    @patch('src.services.sse_client.requests.post')
+    def test_revised_cumulative_reply_streamed(self, mock_post):
+        """Test a cumulative event revising earlier text replaces it and is parsed again"""
+        mock_post.return_value = build_sse_response(
+            ['{"English readme": "# Draft', '{"English readme": "# Title", "Japanese readme": "# タイトル"}'],
+            is_delta=False
+        )
+        received = []
+        self.request.on_language = lambda lang, content: received.append((lang, content))
+
+        response_text = SSEClient(self.config).send_request(self.request)
+
+        assert response_text == '{"English readme": "# Title", "Japanese readme": "# タイトル"}'
+        assert received == [("en", "# Title"), ("ja", "# タイトル")]
+
+    @patch('src.services.sse_client.requests.post')
+    def test_cancelled_callback_ends_stream(self, mock_post):
+        """Test a callback cancelling the stream closes it instead of reading on"""
+        response = build_sse_response(self.chunks, "".join(self.chunks))
+        mock_post.return_value = response
+        received = []
+
+        def on_language(lang, content):
+            received.append(lang)
+            raise StreamCancelled()
+
+        self.request.on_language = on_language
+
+        with pytest.raises(StreamCancelled):
+            SSEClient(self.config).send_request(self.request)
+        assert received == ["en"]
+        response.close.assert_called_once()
+
+    @patch('src.services.sse_client.requests.post')
+    def test_stop_when_complete(self, mock_post):
+        """Test the stream is closed once all requested languages are received"""
+        self.config.set("sse.stop_when_complete", True)
+        response = build_sse_response(self.chunks, "".join(self.chunks))
+        mock_post.return_value = response
+
+        response_text = SSEClient(self.config).send_request(self.request)
+
+        response.close.assert_called_once()
+        assert json.loads(response_text) == {"English readme": "# Title\n\nBody", "Japanese readme": "# タイトル"}
+
+    @patch('src.services.sse_client.requests.post')
+    def test_request_body_compact_utf8(self, mock_post):
+        """Test the request body is compact UTF-8 JSON and its size is recorded"""
+        mock_post.return_value = build_sse_response(self.chunks, "".join(self.chunks))
+        self.request.content = "翻译 README"
+        client = SSEClient(self.config)
+
+        client.send_request(self.request)
+
+        body = mock_post.call_args.kwargs["data"]
+        assert "翻译 README".encode("utf-8") in body
+        assert b'", "' not in body
+        assert client.last_stats.request_bytes == len(body)
+        assert client.last_stats.events == len(self.chunks) + 1
+        assert client.last_stats.response_bytes == len("".join(self.chunks).encode("utf-8"))
+
+    @patch('src.services.sse_client.requests.post')
+    def test_gzip_request_body(self, mock_post):
+        """Test large bodies are sent gzip-compressed when enabled"""
+        self.config.set("sse.compress_requests", True)
+        self.config.set("sse.compress_threshold", 100)
+        mock_post.return_value = build_sse_response(self.chunks, "".join(self.chunks))
+        self.request.content = "README " * 200
+        client = SSEClient(self.config)
+
+        client.send_request(self.request)
+
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(kwargs["data"]))["content"] == self.request.content
+        assert client.last_stats.request_wire_bytes < client.last_stats.request_bytes
+
+    @patch('src.services.sse_client.requests.post')
+    def test_gzip_refused_fallback(self, mock_post):
+        """Test an uncompressed body is resent when the server refuses gzip"""
+        self.config.set("sse.compress_requests", True)
+        self.config.set("sse.compress_threshold", 0)
+        refused = Mock(status_code=415)
+        mock_post.side_effect = [refused, build_sse_response(self.chunks, "".join(self.chunks))]
+        client = SSEClient(self.config)
+
+        assert client.send_request(self.request) == "".join(self.chunks)
+
+        assert "Content-Encoding" not in mock_post.call_args.kwargs["headers"]
+        assert not client._should_compress(b"{}")
+
+    @patch('src.services.sse_client.requests.post')
+    def test_stream_statistics(self, mock_post):
+        """Test timing statistics are recorded for the stream"""
+        mock_post.return_value = build_sse_response(self.chunks, "".join(self.chunks))
+        client = SSEClient(self.config)
+
+        client.send_request(self.request)
+
+        stats = client.last_stats
+        assert stats.chars_received == len("".join(self.chunks))
+        assert sum(stats.gap_histogram.values()) == stats.events - 1
+        assert 0 <= stats.first_event_seconds <= stats.total_seconds
+        assert stats.chars_per_second > 0
+        assert mock_post.call_args.kwargs["timeout"] == (client.connect_timeout, client.idle_timeout)
+
+    @patch('src.services.sse_client.requests.post')
+    def test_stalled_stream_retried(self, mock_post):
+        """Test a stream that stops sending events is abandoned and requested again"""
+        self.config.set("sse.stall_retries", 1)
+        stalled = build_stalled_response(self.chunks[:1])
+        mock_post.side_effect = [stalled, build_sse_response(self.chunks, "".join(self.chunks))]
+        client = SSEClient(self.config)
+
+        assert client.send_request(self.request) == "".join(self.chunks)
+
+        stalled.close.assert_called()
+        assert mock_post.call_count == 2
+        assert client.last_stats.stall_retries == 1
+
+    @patch('src.services.sse_client.requests.post')
+    def test_stall_retry_budget(self, mock_post):
+        """Test the request fails once stall retries are used up"""
+        self.config.set("sse.stall_retries", 1)
+        mock_post.side_effect = lambda *args, **kwargs: build_stalled_response(self.chunks[:1])
+
+        with pytest.raises(Exception, match="idle timeout"):
+            SSEClient(self.config).send_request(self.request)
+
+        assert mock_post.call_count == 2
+
+    @patch('src.services.sse_client.requests.post')
+    def test_connection_reset_not_retried(self, mock_post):
+        """Test a dropped connection is reported as such instead of as a stall"""
+        self.config.set("sse.stall_retries", 1)
+        reset = requests.exceptions.ConnectionError("Connection reset by peer")
+        mock_post.side_effect = lambda *args, **kwargs: build_stalled_response(self.chunks[:1], reset)
+
+        with pytest.raises(Exception, match="Network request failed: Connection reset by peer"):
+            SSEClient(self.config).send_request(self.request)
+
+        assert mock_post.call_count == 1
+
+    def test_idle_timeout_default(self):
+        """Test the idle timeout does not follow sse.timeout"""
+        self.config.set("sse.timeout", 600)
+
+        assert SSEClient(self.config).idle_timeout == 30
+
+
+class TestSSEClientWarmUp:
+    """Connection warm-up test class"""
+
+    def _client(self, prewarm=True):
+        config = Config()
+        config.set("sse.prewarm", prewarm)
+        client = SSEClient(config)
+        client.transport = Mock()
+        return client
+
+    def test_warm_up_disabled(self):
+        """Test nothing is started unless sse.prewarm is enabled"""
+        client = self._client(prewarm=False)
+
+        assert client.warm_up() is None
+        client.transport.warm_up.assert_not_called()
+
+    def test_request_waits_for_warm_up(self):
+        """Test the first request waits for the connection being opened"""
+        client = self._client()
+        calls = []
+        release = threading.Event()
+
+        def warm_up(url, timeout):
+            release.wait(5)
+            calls.append("warm_up")
+            return True
+
+        client.transport.warm_up.side_effect = warm_up
+        client.transport.post.side_effect = lambda *args, **kwargs: calls.append("post")
+
+        thread = client.warm_up()
+        assert client.warm_up() is thread
+        threading.Timer(0.1, release.set).start()
+        client._post(client.url, b"{}", {})
+
+        assert calls == ["warm_up", "post"]
+        client.transport.warm_up.assert_called_once_with(client.url, client.connect_timeout)
+
+    def test_warm_up_failure_ignored(self):
+        """Test a failed warm-up does not raise"""
+        client = self._client()
+        client.transport.warm_up.side_effect = ConnectionError("unreachable")
+
+        client.warm_up().join(5)
+        client._post(client.url, b"{}", {})
+
+        client.transport.post.assert_called_once()
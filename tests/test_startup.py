@@ -0,0 +1,53 @@
+"""
+CLI startup test module
+
+Tests that heavy dependencies are not imported when the CLI starts.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Loaded only by the commands that send requests or read YAML
+HEAVY_MODULES = ["tencentcloud", "requests", "sseclient", "yaml"]
+
+
+def run_python(*args):
+    """Run a Python subprocess from the project root"""
+    return subprocess.run(
+        [sys.executable, *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+
+
+class TestStartup:
+    """CLI startup test class"""
+
+    def test_import_skips_heavy_dependencies(self):
+        """Test importing the CLI does not load heavy dependencies"""
+        code = (
+            "import sys\n"
+            "import src.cli.main\n"
+            f"print(sorted(m for m in sys.modules if m.split('.')[0] in {HEAVY_MODULES!r}))\n"
+        )
+        result = run_python("-c", code)
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_help_skips_heavy_dependencies(self):
+        """Test --help runs without loading the network stack"""
+        code = (
+            "import sys\n"
+            "from src.cli.main import cli\n"
+            "try:\n"
+            "    cli(['gen', '--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+        )
+        result = run_python("-c", code)
+
+        assert "--profile" in result.stdout
+        assert result.stdout.strip().splitlines()[-1] == "[]"
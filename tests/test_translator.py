@@ -4,10 +4,14 @@ Translator test module
 Tests translator functionality.
 """
 
+import json
+import threading
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock, patch
-from src.core.translator import Translator
+from src.core.translator import MAX_IMPORTANT_FILES, Translator
+from src.utils.cache import TranslationCache
 from src.utils.config import Config
 from src.models.types import TranslationResponse
 
@@ -81,6 +85,19 @@ class TestTranslator:
         assert "English" in request.content
         assert request.languages == languages
     
+    def test_build_translation_request_sends_source_once(self):
+        """Test project source is sent in the prompt or the code_text variable, not both"""
+        content = "=== main.py ===\nprint('源代码')"
+
+        request = self.translator._build_translation_request(content, ["en", "ja"])
+        assert content in request.content
+        assert "code_text" not in request.additional_params["workflow_variables"]
+
+        self.config.set("translation.source_transport", "variable")
+        request = self.translator._build_translation_request(content, ["en", "ja"])
+        assert content not in request.content
+        assert request.additional_params["workflow_variables"]["code_text"] == content
+    
     @patch('src.services.sse_client.SSEClient.send_request')
     def test_execute_translation_success(self, mock_send_request):
         """Test successful translation execution"""
@@ -95,6 +112,140 @@ class TestTranslator:
         assert response.content == "Translated content"
         assert response.languages == ["中文", "English"]
     
+    def test_score_file_reasons(self):
+        """Test file scores are explained by their rules"""
+        score, reasons = self.translator._score_file(Path("src/config_utils.py"))
+
+        assert score == 80 + 60 - 10
+        assert reasons == ["configuration file +80", "utility file +60", "depth -10"]
+
+    @patch('src.services.sse_client.SSEClient.send_request')
+    def test_plan_project(self, mock_send_request, tmp_path, capsys):
+        """Test a plan reports files and batches without sending requests"""
+        (tmp_path / "README.md").write_text("# Demo\n\n" + "Usage line.\n" * 100, encoding="utf-8")
+        (tmp_path / "main.py").write_text("print('main')\n", encoding="utf-8")
+        (tmp_path / "config.py").write_text("DEBUG = False\n", encoding="utf-8")
+        (tmp_path / "helpers.py").write_text("def helper(): pass\n", encoding="utf-8")
+
+        plan = self.translator.plan_project(str(tmp_path), ["en", "ja"])
+
+        mock_send_request.assert_not_called()
+        assert plan.files_scanned == 4
+        assert [(f.path, f.selected) for f in plan.files] == [
+            ("README.md", True), ("main.py", True), ("config.py", True), ("helpers.py", False)
+        ]
+        assert f"below the top {MAX_IMPORTANT_FILES}" in plan.files[-1].reasons
+        assert "Target languages" not in capsys.readouterr().out
+        assert plan.languages == ["en", "ja"]
+        assert len(plan.batches) == 1
+        batch = plan.batches[0]
+        assert batch.characters == plan.content_characters
+        assert batch.request_bytes > batch.characters
+        assert batch.estimated_tokens > 0
+
+    @patch('src.services.sse_client.SSEClient.send_request')
+    def test_plan_project_batches(self, mock_send_request, tmp_path):
+        """Test content over the batch limit is planned as several requests"""
+        (tmp_path / "README.md").write_text("# Demo\n", encoding="utf-8")
+
+        with patch.object(Translator, '_read_project_content', return_value="\n".join(
+            f"=== part{i}.py ===\n" + "x" * 6000 for i in range(5)
+        )):
+            plan = self.translator.plan_project(str(tmp_path), ["en"])
+
+        mock_send_request.assert_not_called()
+        assert len(plan.batches) == 3
+        assert [batch.index for batch in plan.batches] == [1, 2, 3]
+        assert plan.request_bytes == sum(batch.request_bytes for batch in plan.batches)
+
+    @patch('src.services.sse_client.SSEClient.warm_up')
+    def test_warm_up_during_scan(self, mock_warm_up, tmp_path):
+        """Test the upstream connection is warmed up while the project is read, but not for plans"""
+        (tmp_path / "README.md").write_text("# Demo\n", encoding="utf-8")
+
+        self.translator.plan_project(str(tmp_path), ["en"])
+        mock_warm_up.assert_not_called()
+
+        self.translator._read_project_content(str(tmp_path))
+        mock_warm_up.assert_called_once()
+
+    def test_estimate_tokens(self):
+        """Test ASCII text counts four characters per token and CJK one"""
+        assert Translator._estimate_tokens("abcdefgh") == 2
+        assert Translator._estimate_tokens("中文") == 2
+
+    @patch('src.services.sse_client.SSEClient.send_request')
+    def test_identical_requests_coalesced(self, mock_send_request, flight_waiters):
+        """Test identical requests in flight at the same time are sent upstream once"""
+        started = threading.Event()
+        release = threading.Event()
+
+        def send(request):
+            started.set()
+            release.wait(5)
+            return "Translated content"
+
+        mock_send_request.side_effect = send
+        requests = [self.translator._build_text_translation_request("# Title", ["en", "ja"]) for _ in range(3)]
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(self.translator._execute_translation, requests[0])]
+            started.wait(5)
+            futures += [pool.submit(self.translator._execute_translation, request) for request in requests[1:]]
+            assert flight_waiters.acquire(timeout=5) and flight_waiters.acquire(timeout=5)
+            release.set()
+            responses = [future.result() for future in futures]
+
+        assert mock_send_request.call_count == 1
+        assert [response.content for response in responses] == ["Translated content"] * 3
+        assert self.translator._flights.in_flight() == 0
+
+    @patch('src.services.sse_client.SSEClient.send_request')
+    def test_coalesced_request_receives_languages(self, mock_send_request, flight_waiters):
+        """Test a request sharing another's reply still gets its languages reported"""
+        started = threading.Event()
+        release = threading.Event()
+        reply = json.dumps({"en": "# Title", "ja": "# タイトル"}, ensure_ascii=False)
+
+        def send(request):
+            started.set()
+            release.wait(5)
+            return reply
+
+        mock_send_request.side_effect = send
+        leader, follower = [self.translator._build_text_translation_request("# Title", ["en", "ja"]) for _ in range(2)]
+        received = {}
+        follower.on_language = received.__setitem__
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(self.translator._execute_translation, leader)
+            started.wait(5)
+            second = pool.submit(self.translator._execute_translation, follower)
+            assert flight_waiters.acquire(timeout=5)
+            release.set()
+            first.result()
+            second.result()
+
+        assert mock_send_request.call_count == 1
+        assert received == {"en": "# Title", "ja": "# タイトル"}
+    
+    @patch('src.services.sse_client.SSEClient.send_request')
+    def test_only_complete_replies_cached(self, mock_send_request):
+        """Test truncated replies and replies missing a language are not cached"""
+        translator = Translator(self.config, cache=TranslationCache())
+        request = translator._build_text_translation_request("# Title", ["en", "ja"])
+        complete = json.dumps({"English readme": "# Title", "Japanese readme": "# タイトル"}, ensure_ascii=False)
+
+        for reply in ['{"English readme": "# Title", "Japanese readme": "# タ', json.dumps({"English readme": "# Title"})]:
+            mock_send_request.return_value = reply
+            assert translator._execute_translation(request).content == reply
+        mock_send_request.return_value = complete
+        translator._execute_translation(request)
+        translator._execute_translation(request)
+
+        assert mock_send_request.call_count == 3
+        assert translator.cache.hits == 1
+    
     @patch('src.services.sse_client.SSEClient.send_request')
     def test_execute_translation_failure(self, mock_send_request):
         """Test translation failure"""
@@ -136,6 +287,6 @@ class TestTranslator:
         assert result.languages == ["中文", "English"]
         
         # Verify method calls
-        mock_read.assert_called_once_with("test_project")
+        mock_read.assert_called_once_with("test_project", root=None)
         mock_build.assert_called_once_with("Project content", ["中文", "English"])
         mock_execute.assert_called_once_with(mock_request) 
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Transport test module
+
+Tests recording SSE sessions and replaying them without network access.
+"""
+
+import pytest
+from unittest.mock import patch
+from src.services.mock_server import MockLKEServer, MockServerOptions, DEFAULT_REPLY
+from src.services.sse_client import SSEClient
+from src.services.transport import ReplayTransport, RecordingTransport, HTTPTransport, create_transport
+from src.utils.config import Config
+from src.models.types import TranslationRequest
+
+
+class TestTransport:
+    """Record and replay transport test class"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.request = TranslationRequest(
+            content="Translate",
+            languages=["en", "zh-Hans", "ja"],
+            bot_app_key="key",
+            visitor_biz_id="visitor"
+        )
+
+    def _config(self, **sse):
+        config = Config()
+        config.set("sse.streaming_throttle", 0)
+        for key, value in sse.items():
+            config.set(f"sse.{key}", value)
+        return config
+
+    def _record(self, path, options):
+        with MockLKEServer(options) as server:
+            client = SSEClient(self._config(url=server.url, transport="record", record_path=str(path)))
+            return client.send_request(self.request)
+
+    def test_record_and_replay(self, tmp_path):
+        """Test a replayed session gives the same reply as the recorded one"""
+        path = tmp_path / "sessions.jsonl"
+        # Odd chunk sizes split multi-byte characters across chunks
+        recorded = self._record(path, MockServerOptions(chunk_size=7))
+
+        received = []
+        self.request.on_language = lambda lang, content: received.append(lang)
+        client = SSEClient(self._config(transport="replay", record_path=str(path), replay_speed=0))
+
+        assert recorded == DEFAULT_REPLY
+        assert client.send_request(self.request) == recorded
+        assert received == ["en", "zh-Hans", "ja"]
+
+    def test_replay_timing(self, tmp_path):
+        """Test recorded delays are replayed scaled by the speed factor"""
+        path = tmp_path / "sessions.jsonl"
+        self._record(path, MockServerOptions(latency=0.4))
+
+        transport = ReplayTransport(str(path), speed=2)
+        offsets = [offset for offset, _ in transport.sessions[0]["chunks"]]
+
+        # A frozen clock makes every delay exactly the recorded offset over the speed
+        with patch("src.services.transport.time.perf_counter", return_value=0.0), \
+                patch("src.services.transport.time.sleep") as sleep:
+            for chunk in transport.post("", b"", {}, None):
+                pass
+
+        assert offsets[0] >= 0.4
+        assert [c.args[0] for c in sleep.call_args_list] == [offset / 2 for offset in offsets if offset > 0]
+
+    def test_replay_error_status(self, tmp_path):
+        """Test recorded HTTP errors are replayed"""
+        path = tmp_path / "sessions.jsonl"
+        with pytest.raises(Exception, match="503"):
+            self._record(path, MockServerOptions(error_status=503))
+
+        with pytest.raises(Exception, match="503"):
+            SSEClient(self._config(transport="replay", record_path=str(path))).send_request(self.request)
+
+    def test_create_transport(self, tmp_path):
+        """Test the transport is chosen by sse.transport"""
+        assert isinstance(create_transport(self._config()), HTTPTransport)
+        assert isinstance(create_transport(self._config(transport="record", record_path=str(tmp_path / "s.jsonl"))),
+                          RecordingTransport)
+        with pytest.raises(ValueError):
+            create_transport(self._config(transport="carrier-pigeon"))
+
+    def test_warm_up_pooled_connection(self):
+        """Test warm-up opens a connection only when connections are pooled"""
+        with MockLKEServer() as server:
+            assert HTTPTransport(pool_size=1).warm_up(server.url, timeout=5) is True
+            assert HTTPTransport().warm_up(server.url, timeout=5) is False
+            # Warm-up must not reach the SSE endpoint as a request
+            assert server.requests == []
+
+    def test_prewarm_enables_pool(self):
+        """Test sse.prewarm keeps a one-connection pool for the warmed connection"""
+        assert create_transport(self._config(prewarm=True)).session is not None
+        assert create_transport(self._config()).session is None